@@ -1,4 +1,11 @@
+import hashlib
+import io
 import json
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+import numpy as np
 import pandas as pd
 from datetime import datetime, timezone
 from pathlib import Path
@@ -15,12 +22,237 @@ for p in {str(ROOT), str(ROOT / "stc_swc")}:
         sys.path.insert(0, p)
 # -------------------------------------------------------------------------------
 
-from stc_swc.extract.mythril import parse_report as parse_mythril
-from stc_swc.extract.slither import parse_report as parse_slither
+from stc_swc.extract.mythril import parse_bytes as parse_mythril
+from stc_swc.extract.slither import parse_bytes as parse_slither
+from stc_swc.extract.sniff import sniff_tool
 from stc_swc.normalize.mapper import to_stc_schema_batch
-from stc_swc.export.csv_exporter import write_csv
+from stc_swc.normalize.detector_map import resolve_swc
+from stc_swc.export.csv_exporter import FIELDS as CSV_FIELDS, write_csv
 from stc_swc.export.ndjson_exporter import write_ndjson
-from stc_swc.normalize.swc_registry import get_swc_meta
+from stc_swc.finding import values_getter
+from stc_swc.normalize.swc_registry import get_swc_meta, registry_version
+from stc_swc import stats
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+MAX_WORKERS = 4
+
+# --- cache hasil konversi per (digest upload, tool, timestamp, versi registry) ---
+# LRU terbatas + TTL; klik Konversi / download ulang untuk report yang sama
+# dilayani dari memory tanpa parse & enrich ulang
+CACHE_TTL = 60 * 60
+CACHE_MAX_ENTRIES = 32
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def convert_report(digest: str, tool: str, timestamp_now: str, registry_ver: str,
+                   filename: str, _data, instrument: bool = False) -> dict:
+    # ``_data`` tidak ikut di-hash Streamlit; kuncinya ``digest``
+    if not instrument:
+        return _convert(tool, timestamp_now, filename, _data)
+    # collector per thread: file lain di thread pool tidak ikut tercatat
+    with stats.collect(local=True) as sc:
+        res = _convert(tool, timestamp_now, filename, _data)
+    return {**res, "stats": sc.as_dict()}
+
+def _enrich(raw_findings: list, filename: str, timestamp_now: str):
+    """Lengkapi metadata & SWC registry per temuan (in-place)."""
+    # --- ambil nama file utk default contract name
+    contract_guess = Path(filename).stem.split(".")[0]
+
+    # --- ambil git commit hash otomatis
+    def get_commit_hash():
+        try:
+            import subprocess
+            return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"]).decode().strip()
+        except:
+            return ""
+
+    commit_hash = get_commit_hash()
+
+    # --- isi metadata ke semua temuan
+    for f in raw_findings:
+        f["contract"] = f.get("contract") or contract_guess
+        f["network"] = f.get("network") or "ethereum"
+        f["commit_hash"] = f.get("commit_hash") or commit_hash
+        f["timestamp"] = timestamp_now or datetime.utcnow().isoformat(timespec="seconds")
+        if "status" not in f:
+            f["status"] = "unresolved"
+        if "confidence" not in f or f["confidence"] in (None, ""):
+            f["confidence"] = "medium"
+
+    # -------------------------------
+    # Lengkapi metadata per temuan
+    # -------------------------------
+    
+    # Ambil nama kontrak dari nama file (mis. SmartToken.slither.json → SmartToken)
+    contract_guess = Path(filename).stem.split(".")[0]
+    
+    # Ambil git commit hash (jika tersedia)
+    def get_commit_hash():
+        try:
+            import subprocess
+            return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"]).decode().strip()
+        except:
+            return ""
+    
+    commit_hash = get_commit_hash()
+    
+    for f in raw_findings:
+        f["contract"] = f.get("contract") or contract_guess
+        f["network"] = f.get("network") or "ethereum"
+        f["commit_hash"] = f.get("commit_hash") or commit_hash
+        f["timestamp"] = f.get("timestamp") or timestamp_now or datetime.utcnow().isoformat(timespec="seconds")
+    
+        if not f.get("status"):
+            f["status"] = "unresolved"
+    
+        if not f.get("confidence") or f["confidence"] in ("", None):
+            f["confidence"] = 0.5  # default confidence
+    
+        if not f.get("line_start") and f.get("line"):
+            f["line_start"] = f["line"]
+        if not f.get("line_end"):
+            f["line_end"] = f.get("line_start")
+
+    CONF_NUM = {"low": 0.25, "medium": 0.50, "high": 0.75}
+
+    for f in raw_findings:
+        ...
+        val = f.get("confidence")
+        if isinstance(val, str):
+            f["confidence"] = CONF_NUM.get(val.lower(), None)
+        elif isinstance(val, (int, float)):
+            f["confidence"] = round(float(val), 2)
+        else:
+            f["confidence"] = None
+
+    # ------ Enrich dari registry & isi default ------
+    for f in raw_findings:
+        # metadata umum
+        f["contract"]    = f.get("contract")    or Path(filename).stem.split(".")[0]
+        f["network"]     = f.get("network")     or "ethereum"
+        f["commit_hash"] = f.get("commit_hash") or commit_hash
+        f["timestamp"]   = f.get("timestamp")   or (timestamp_now or datetime.utcnow().isoformat(timespec="seconds"))
+        f["status"]      = f.get("status")      or "unresolved"
+        f["confidence"]  = f.get("confidence")  or "medium"
+    
+        # line_end fallback
+        if not f.get("line_end") and f.get("line_start"):
+            f["line_end"] = f["line_start"]
+    
+        # SWC-ID dari nama detector (tabel + matcher terkompilasi)
+        if not f.get("swc_id"):
+            f["swc_id"] = resolve_swc(f.get("title"))
+    
+        # Enrich dari SWC Registry
+        meta = get_swc_meta(f.get("swc_id"))
+        if meta:
+            # Jangan override kalau scanner sudah kasih value
+            f["title"]       = f.get("title")       or meta.get("title")
+            f["severity"]    = f.get("severity")    or meta.get("severity")
+            f["remediation"] = f.get("remediation") or meta.get("remediation") or ""
+
+def _convert(tool: str, timestamp_now: str, filename: str, _data) -> dict:
+    parse = parse_mythril if tool == "mythril" else parse_slither
+    stats.add("extract", bytes_in=len(_data))
+    with stats.stage("extract"):
+        raw_findings = parse(_data)
+    stats.add("extract", rows=len(raw_findings))
+    with stats.stage("enrich"):
+        _enrich(raw_findings, filename, timestamp_now)
+    stats.add("enrich", rows=len(raw_findings))
+
+    # --- konversi ke schema final
+    with stats.stage("normalize"):
+        rows = to_stc_schema_batch(raw_findings, tool=tool)
+    stats.add("normalize", rows=len(rows))
+
+    # --- render hasil ke memory (download dilayani dari cache, tanpa file di disk)
+    ts = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    with stats.stage("export"):
+        out = render_outputs(rows, f"swc_findings_{ts}")
+    stats.add("export", rows=len(rows), bytes_out=len(out["csv"]) + len(out["ndjson"]))
+    return out
+
+def render_outputs(rows: list, stem: str) -> dict:
+    csv_buf, ndj_buf = io.BytesIO(), io.BytesIO()
+    write_csv(rows, csv_buf)
+    write_ndjson(rows, ndj_buf)
+    return {
+        "rows": rows,
+        "csv": csv_buf.getvalue(),
+        "ndjson": ndj_buf.getvalue(),
+        "csv_name": f"{stem}.csv",
+        "ndjson_name": f"{stem}.ndjson",
+    }
+
+def stats_frame(files: list) -> pd.DataFrame:
+    """Satu baris per (file, stage) + baris counter registry per file."""
+    recs = []
+    for f in files:
+        sd = f["stats"]
+        for stage, v in sd["stages"].items():
+            recs.append({"file": f["name"], "stage": stage, **v})
+        recs.append({"file": f["name"], "stage": "total", "wall_s": sd["wall_s"], **sd["counters"]})
+    return pd.DataFrame(recs)
+
+def build_zip(results: list) -> bytes:
+    """Satu CSV + NDJSON per report, dinamai sesuai file upload."""
+    buf = io.BytesIO()
+    seen = {}
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for r in results:
+            stem = Path(r["name"]).stem
+            n = seen[stem] = seen.get(stem, 0) + 1
+            if n > 1:
+                stem = f"{stem}_{n}"
+            zf.writestr(f"{stem}.csv", r["csv"])
+            zf.writestr(f"{stem}.ndjson", r["ndjson"])
+    return buf.getvalue()
+
+# --- tabel temuan: satu DataFrame kolumnar per sesi, filter/sort/paging di server ---
+SEV_ORDER = ["low", "medium", "high", "critical"]
+CATEGORY_COLUMNS = ["network", "contract", "file", "swc_id", "title", "status", "remediation", "commit_hash"]
+FILTER_COLUMNS = {"severity": "Severity", "swc_id": "SWC", "contract": "Contract"}
+PAGE_SIZES = [25, 50, 100, 500]
+
+def build_frame(rows: list) -> pd.DataFrame:
+    # Finding -> tuple via attrgetter (jauh lebih cepat dari record Mapping / dict)
+    df = pd.DataFrame.from_records(list(map(values_getter(CSV_FIELDS), rows)), columns=CSV_FIELDS)
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].fillna("").astype(str).astype("category")
+    sev = df["severity"].fillna("").astype(str)
+    extra = sorted(set(sev.unique()) - set(SEV_ORDER))
+    # ordered: sort descending -> critical dulu, severity tak dikenal paling bawah
+    df["severity"] = sev.astype(pd.CategoricalDtype(extra + SEV_ORDER, ordered=True))
+    for col in ("line_start", "line_end"):
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype("int32")
+    df["confidence"] = pd.to_numeric(df["confidence"], errors="coerce")
+    return df
+
+def summarize(df: pd.DataFrame) -> pd.DataFrame:
+    """Jumlah temuan per severity × SWC × contract (dihitung sekali per konversi)."""
+    return (df.groupby(["severity", "swc_id", "contract"], observed=True)
+              .size().rename("count").reset_index()
+              .sort_values(["severity", "count"], ascending=[False, False], ignore_index=True))
+
+def view_index(df: pd.DataFrame, filters: dict, sort_by: str, ascending: bool):
+    """Posisi baris hasil filter + sort; di-memo per sesi supaya ganti halaman cukup slicing."""
+    key = (tuple((k, tuple(v)) for k, v in sorted(filters.items())), sort_by, ascending)
+    memo = st.session_state.get("view")
+    if memo and memo[0] == key:
+        return memo[1]
+    mask = np.ones(len(df), dtype=bool)
+    for col, values in filters.items():
+        if values:
+            mask &= df[col].isin(values).to_numpy()
+    idx = np.flatnonzero(mask)
+    col = df[sort_by].iloc[idx]
+    order = np.argsort(col.cat.codes.to_numpy() if hasattr(col, "cat") else col.to_numpy(), kind="stable")
+    if not ascending:
+        order = order[::-1]
+    idx = idx[order]
+    st.session_state["view"] = (key, idx)
+    return idx
 
 if st.query_params.get("ping") == "1":
     st.write("ok"); st.stop()
@@ -104,39 +336,80 @@ st.markdown(
 
 col = st.columns([1, 1])  # hanya 2 kolom sekarang
 with col[0]:
-    tool = st.selectbox("Pilih tool", ["mythril", "slither"], index=0)
+    tool = st.selectbox("Pilih tool", ["auto", "mythril", "slither"], index=0,
+                        help="auto = deteksi per file, satu batch boleh campur Mythril & Slither")
 with col[1]:
     timestamp_now = st.text_input("Timestamp (opsional, ISO)", "", placeholder="YYYY-MM-DDTHH:MM:SS")
 
-out_dir = Path("outputs")
-out_dir.mkdir(parents=True, exist_ok=True)
-
-report_file = st.file_uploader("Upload output JSON (Mythril/Slither)", type=["json"], accept_multiple_files=False)
+report_files = st.file_uploader("Upload output JSON (Mythril/Slither)", type=["json"], accept_multiple_files=True)
+instrument = st.checkbox("⏱️ Catat statistik per stage", value=False,
+                         help="Waktu, baris & bytes untuk extract / enrich / normalize / export, "
+                              "plus hit/miss registry SWC")
 
 # --- reset UI kalau user hapus file upload ---
-if "converted" in st.session_state and report_file is None:
+if "converted" in st.session_state and not report_files:
     st.session_state.pop("converted")
-    st.session_state.pop("csv_path", None)
-    st.session_state.pop("ndj_path", None)
-    st.session_state.pop("rows", None)
+    for key in ("result", "frame", "agg", "view"):
+        st.session_state.pop(key, None)
 
 if st.session_state.get("converted"):
-    st.success("Berhasil diexport!")
-
-    csv_path = Path(st.session_state["csv_path"])
-    ndj_path = Path(st.session_state["ndj_path"])
-    rows = st.session_state["rows"]
-
-    with open(csv_path, "rb") as f:
-        st.download_button("📥 Download CSV", f, file_name=csv_path.name, mime="text/csv", key="csv_dl")
-
-    with open(ndj_path, "rb") as f:
-        st.download_button("📥 Download NDJSON", f, file_name=ndj_path.name, mime="application/x-ndjson", key="ndjson_dl")
-
-    st.dataframe(pd.DataFrame(rows))
+    result = st.session_state["result"]
+    files = result["files"]
+    failed = [f for f in files if f.get("error")]
+    df = st.session_state["frame"]
+    agg = st.session_state["agg"]
+    st.success(f"Berhasil diexport! {len(files) - len(failed)}/{len(files)} file, {len(df)} temuan")
+    for f in failed:
+        st.error(f"❌ {f['name']}: {f['error']}")
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        st.download_button("📥 Download CSV (gabungan)", result["csv"], file_name=result["csv_name"],
+                           mime="text/csv", key="csv_dl", use_container_width=True)
+    with c2:
+        st.download_button("📥 Download NDJSON (gabungan)", result["ndjson"], file_name=result["ndjson_name"],
+                           mime="application/x-ndjson", key="ndjson_dl", use_container_width=True)
+    with c3:
+        if len(files) > 1:
+            st.download_button("🗜️ Download ZIP (per file)", result["zip"], file_name=result["zip_name"],
+                               mime="application/zip", key="zip_dl", use_container_width=True)
+
+    sev_counts = agg.groupby("severity", observed=True)["count"].sum()
+    mcols = st.columns(len(SEV_ORDER))
+    for mc, sev in zip(mcols, reversed(SEV_ORDER)):
+        mc.metric(sev.capitalize(), int(sev_counts.get(sev, 0)))
+    with st.expander("📊 Ringkasan severity × SWC × contract"):
+        st.dataframe(agg, use_container_width=True, hide_index=True)
+
+    timed = [f for f in files if f.get("stats")]
+    if timed:
+        with st.expander("⏱️ Statistik per stage"):
+            st.dataframe(stats_frame(timed), use_container_width=True, hide_index=True)
+            st.download_button("📥 Download stats (JSON)",
+                               json.dumps({f["name"]: f["stats"] for f in timed}, indent=2),
+                               file_name="swc_stats.json", mime="application/json", key="stats_dl")
+
+    fcols = st.columns(len(FILTER_COLUMNS))
+    filters = {}
+    for fc, (col, label) in zip(fcols, FILTER_COLUMNS.items()):
+        options = [c for c in agg[col].astype(str).unique() if c]
+        filters[col] = fc.multiselect(label, sorted(options), key=f"flt_{col}")
+
+    s1, s2, s3, s4 = st.columns([2, 1, 1, 1])
+    sort_by = s1.selectbox("Urutkan", CSV_FIELDS, index=CSV_FIELDS.index("severity"), key="sort_by")
+    ascending = s2.radio("Arah", ["↓", "↑"], horizontal=True, key="sort_dir") == "↑"
+    page_size = s3.selectbox("Baris/halaman", PAGE_SIZES, index=1, key="page_size")
+
+    idx = view_index(df, filters, sort_by, ascending)
+    pages = max(1, -(-len(idx) // page_size))
+    page = s4.number_input("Halaman", min_value=1, max_value=pages, value=1, step=1, key="page")
+    start = (min(page, pages) - 1) * page_size
+    st.caption(f"{len(idx)} dari {len(df)} temuan • halaman {min(page, pages)}/{pages}")
+    # hanya satu halaman yang dikirim ke browser
+    st.dataframe(df.iloc[idx[start:start + page_size]], use_container_width=True, hide_index=True)
 
 if st.button("▶️ Konversi", use_container_width=True):
-    if not report_file:
+    if not report_files:
         st.error("Upload report JSON dulu ya.")
         st.stop()
 
@@ -147,151 +420,58 @@ if st.button("▶️ Konversi", use_container_width=True):
             st.error("Format timestamp harus YYYY-MM-DDTHH:MM:SS")
             st.stop()
 
-    tmp_path = out_dir / "_tmp_report.json"
-    tmp_path.write_bytes(report_file.read())
-
-    # --- ambil nama file utk default contract name
-    contract_guess = Path(report_file.name).stem.split(".")[0]
-
-    # --- ambil git commit hash otomatis
-    def get_commit_hash():
-        try:
-            import subprocess
-            return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"]).decode().strip()
-        except:
-            return ""
-
-    commit_hash = get_commit_hash()
-
-    # --- parsing file JSON
-    if tool == "mythril":
-        raw_findings = parse_mythril(str(tmp_path))
-    else:
-        raw_findings = parse_slither(str(tmp_path))
-
-    # --- isi metadata ke semua temuan
-    for f in raw_findings:
-        f["contract"] = f.get("contract") or contract_guess
-        f["network"] = f.get("network") or "ethereum"
-        f["commit_hash"] = f.get("commit_hash") or commit_hash
-        f["timestamp"] = timestamp_now or datetime.utcnow().isoformat(timespec="seconds")
-        if "status" not in f:
-            f["status"] = "unresolved"
-        if "confidence" not in f or f["confidence"] in (None, ""):
-            f["confidence"] = "medium"
-
-    # -------------------------------
-    # Lengkapi metadata per temuan
-    # -------------------------------
-    
-    # Ambil nama kontrak dari nama file (mis. SmartToken.slither.json → SmartToken)
-    contract_guess = Path(report_file.name).stem.split(".")[0]
-    
-    # Ambil git commit hash (jika tersedia)
-    def get_commit_hash():
-        try:
-            import subprocess
-            return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"]).decode().strip()
-        except:
-            return ""
-    
-    commit_hash = get_commit_hash()
-    
-    # SWC Mapping contoh minimal
-    SWC_MAPPING = {
-        "reentrancy": "SWC-107",
-        "low-level-calls": "SWC-104",
-        "solc-version": "SWC-103",
-        # tambahkan sesuai tool
-    }
-    
-    for f in raw_findings:
-        f["contract"] = f.get("contract") or contract_guess
-        f["network"] = f.get("network") or "ethereum"
-        f["commit_hash"] = f.get("commit_hash") or commit_hash
-        f["timestamp"] = f.get("timestamp") or timestamp_now or datetime.utcnow().isoformat(timespec="seconds")
-    
-        if not f.get("status"):
-            f["status"] = "unresolved"
-    
-        if not f.get("confidence") or f["confidence"] in ("", None):
-            f["confidence"] = 0.5  # default confidence
-    
-        if not f.get("line_start") and f.get("line"):
-            f["line_start"] = f["line"]
-        if not f.get("line_end"):
-            f["line_end"] = f.get("line_start")
-    
-        # isi swc_id dari judul jika cocok
-        title_lc = (f.get("title") or "").lower()
-        for k, v in SWC_MAPPING.items():
-            if k in title_lc:
-                f["swc_id"] = v
-                break
-
-    CONF_NUM = {"low": 0.25, "medium": 0.50, "high": 0.75}
-
-    for f in raw_findings:
-        ...
-        val = f.get("confidence")
-        if isinstance(val, str):
-            f["confidence"] = CONF_NUM.get(val.lower(), None)
-        elif isinstance(val, (int, float)):
-            f["confidence"] = round(float(val), 2)
+    reg_ver = registry_version()
+    ctx = get_script_run_ctx()
+    progress = st.progress(0.0, text=f"0/{len(report_files)} file")
+    status = [st.empty() for _ in report_files]
+    files = [None] * len(report_files)
+
+    def convert_one(name, data):
+        detected = sniff_tool(data)
+        if tool == "auto":
+            if detected is None:
+                raise ValueError("format tidak dikenali (bukan report Mythril/Slither)")
+            file_tool = detected
+        elif detected and detected != tool:
+            raise ValueError(f"report terdeteksi sebagai {detected}, bukan {tool}")
         else:
-            f["confidence"] = None
-
-    # ------ Enrich dari registry & isi default ------
-    for f in raw_findings:
-        # metadata umum
-        f["contract"]    = f.get("contract")    or Path(report_file.name).stem.split(".")[0]
-        f["network"]     = f.get("network")     or "ethereum"
-        f["commit_hash"] = f.get("commit_hash") or commit_hash
-        f["timestamp"]   = f.get("timestamp")   or (timestamp_now or datetime.utcnow().isoformat(timespec="seconds"))
-        f["status"]      = f.get("status")      or "unresolved"
-        f["confidence"]  = f.get("confidence")  or "medium"
-    
-        # line_end fallback
-        if not f.get("line_end") and f.get("line_start"):
-            f["line_end"] = f["line_start"]
-    
-        # SWC-ID dari judul (fallback ringan)
-        if not f.get("swc_id"):
-            title_lc = (f.get("title") or "").lower()
-            for k, v in {
-                "reentrancy": "SWC-107",
-                "low-level-calls": "SWC-104",
-                "solc-version": "SWC-103",
-                "tx-origin": "SWC-115",
-                "unchecked-send": "SWC-113",
-            }.items():
-                if k in title_lc:
-                    f["swc_id"] = v
-                    break
-    
-        # Enrich dari SWC Registry
-        meta = get_swc_meta(f.get("swc_id"))
-        if meta:
-            # Jangan override kalau scanner sudah kasih value
-            f["title"]       = f.get("title")       or meta.get("title")
-            f["severity"]    = f.get("severity")    or meta.get("severity")
-            f["remediation"] = f.get("remediation") or meta.get("remediation") or ""
-
-
-    # --- konversi ke schema final
-    rows = to_stc_schema_batch(raw_findings, tool=tool)
-
-    # --- simpan hasil ke file
+            file_tool = tool
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        return file_tool, convert_report(digest, file_tool, timestamp_now, reg_ver, name, data, instrument)
+
+    # konversi paralel di thread pool; UI di-update dari thread script saja
+    with ExitStack() as stack, ThreadPoolExecutor(
+            max_workers=min(MAX_WORKERS, len(report_files)),
+            initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)) as pool:
+        futures = {}
+        for i, rf in enumerate(report_files):
+            status[i].caption(f"⏳ {rf.name}")
+            data = stack.enter_context(rf.getbuffer())
+            futures[pool.submit(convert_one, rf.name, data)] = i
+
+        for done, fut in enumerate(as_completed(futures), 1):
+            i = futures[fut]
+            name = report_files[i].name
+            try:
+                file_tool, res = fut.result()
+                files[i] = {**res, "name": name, "tool": file_tool}
+                status[i].caption(f"✅ {name} — {file_tool}, {len(res['rows'])} temuan")
+            except Exception as e:
+                files[i] = {"name": name, "error": f"{type(e).__name__}: {e}", "rows": []}
+                status[i].caption(f"❌ {name} — {type(e).__name__}: {e}")
+            progress.progress(done / len(report_files), text=f"{done}/{len(report_files)} file")
+
+    ok = [f for f in files if not f.get("error")]
+    merged_rows = [r for f in ok for r in f["rows"]]
     ts = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-    csv_path = out_dir / f"swc_findings_{ts}.csv"
-    ndj_path = out_dir / f"swc_findings_{ts}.ndjson"
-
-    write_csv(rows, str(csv_path))
-    write_ndjson(rows, str(ndj_path))
-
+    result = ok[0] if len(files) == 1 and ok else render_outputs(merged_rows, f"swc_findings_{ts}")
+    result = {**result, "files": [{k: f.get(k) for k in ("name", "tool", "error", "stats")} for f in files],
+              "zip": build_zip(ok), "zip_name": f"swc_findings_{ts}.zip"}
+    result.pop("rows", None)
+    st.session_state["result"] = result
+    st.session_state["frame"] = build_frame(merged_rows)
+    st.session_state["agg"] = summarize(st.session_state["frame"])
+    st.session_state.pop("view", None)
     st.session_state["converted"] = True
-    st.session_state["csv_path"] = str(csv_path)
-    st.session_state["ndj_path"] = str(ndj_path)
-    st.session_state["rows"] = rows
 
     st.rerun()
@@ -1,37 +1,295 @@
 import argparse
+import sys
 from pathlib import Path
-from stc_swc.extract.mythril import parse_report as parse_mythril
-from stc_swc.extract.slither import parse_report as parse_slither
-from stc_swc.normalize.mapper import to_stc_schema_batch
-from stc_swc.export.csv_exporter import write_csv
-from stc_swc.export.ndjson_exporter import write_ndjson
+from stc_swc.batch import AUTO, PARSERS, expand_inputs
+from stc_swc.compression import CODECS, available
+from stc_swc.export.csv_exporter import FIELDS
+from stc_swc.export.formats import FORMATS, missing_dependency, output_path
+
+# cold start: hanya modul ringan untuk parsing argumen yang diimport di atas;
+# extractor, exporter, cache, sqlite3 dsb diimport di fungsi yang memakainya
+
+def _extra_sinks(args) -> list:
+    if not args.db:
+        return []
+    from stc_swc import stats
+    from stc_swc.export.sqlite_store import write_sqlite
+    return [stats.sink("export.sqlite", lambda rs: write_sqlite(rs, args.db), args.db)]
+
+class _AllFailed(Exception):
+    """Semua report gagal tanpa satu baris pun; dataset lama tidak di-swap."""
+
+def _unless_all_failed(rows, inputs, failures):
+    n = 0
+    for r in rows:
+        n += 1
+        yield r
+    if not n and inputs and len(failures) == len(inputs):
+        # raise di producer -> fan_out membatalkan semua sink
+        raise _AllFailed
+
+def run_partitioned(args, inputs, formats, out_dir) -> int:
+    """Layout partisi: selalu konversi penuh (tanpa cache manifest baris)."""
+    from stc_swc import stats
+    from stc_swc.batch import iter_batch, retry_partial
+    from stc_swc.export.partitioned import dataset_path, write_partitioned
+    from stc_swc.pipeline import fan_out
+
+    failures = []
+    extra_fields = ()
+    if args.merge:
+        from stc_swc.normalize.merge import MERGE_FIELDS, merge_findings
+        extra_fields = MERGE_FIELDS
+    manifests = {}
+
+    def sink(fmt):
+        def write(rs):
+            manifests[fmt] = write_partitioned(rs, dataset_path(out_dir, fmt), fmt,
+                                               partition_by=args.partition_by, max_rows=args.max_rows,
+                                               max_bytes=args.max_bytes, compression=args.compress,
+                                               level=args.compress_level, extra_fields=extra_fields)
+        return write
+
+    def attempt(skip):
+        # dataset partisi baru di-swap kalau writer selesai normal, jadi
+        # report yang rusak di tengah stream cukup dilewati lalu diulang
+        del failures[:]
+        rows = _unless_all_failed(iter_batch(inputs, args.tool, timestamp_iso=args.timestamp or None,
+                                             jobs=args.jobs, failures=failures, skip=skip),
+                                  inputs, failures)
+        if args.merge:
+            rows = merge_findings(rows)
+        fan_out(rows, [stats.sink(f"export.{fmt}", sink(fmt), dataset_path(out_dir, fmt)) for fmt in formats]
+                + _extra_sinks(args))
+
+    try:
+        retry_partial(attempt)
+    except _AllFailed:
+        for path, err in failures:
+            print(f"FAIL {path}: {err}", file=sys.stderr)
+        print(f"Semua {len(inputs)} file gagal, output lama tidak diubah", file=sys.stderr)
+        return 1
+    for path, err in failures:
+        print(f"FAIL {path}: {err}", file=sys.stderr)
+    for fmt in formats:
+        m = manifests[fmt]
+        print(f"OK → {dataset_path(out_dir, fmt)}/ ({len(m['shards'])} shard, {m['rows']} temuan)")
+    return 1 if failures else 0
+
+def run_single(args, inputs, formats, out_dir) -> int:
+    """Satu file per format; report yang tidak berubah sejak run sebelumnya dilewati."""
+    from stc_swc.cache import convert_incremental
+
+    failures = []
+    summary = convert_incremental(inputs, args.tool, out_dir, formats,
+                                  timestamp_iso=args.timestamp or None, jobs=args.jobs,
+                                  force=args.force, failures=failures,
+                                  compression=args.compress, level=args.compress_level,
+                                  db=args.db, merge=args.merge)
+    for path, err in failures:
+        print(f"FAIL {path}: {err}", file=sys.stderr)
+
+    converted = summary["converted"] - len(failures)
+    if summary["mode"] == "skip":
+        print(f"Tidak ada perubahan ({summary['skipped']} file), output tidak ditulis ulang")
+    elif summary["mode"] == "failed":
+        print(f"Semua {summary['converted']} file gagal, output lama tidak diubah", file=sys.stderr)
+        return 1
+    elif len(inputs) > 1 or summary["skipped"]:
+        print(f"{converted}/{summary['converted']} file dikonversi ({summary['mode']}), "
+              f"{summary['skipped']} dari cache, {summary['rows']} temuan")
+    for fmt in formats:
+        print(f"OK → {output_path(out_dir, fmt, compression=args.compress)}")
+    return 1 if failures else 0
+
+def run_instrumented(run, args, inputs, formats, out_dir) -> int:
+    """``run`` dengan collector stats (``--stats``) dan/atau cProfile (``--profile``)."""
+    import json
+    from contextlib import nullcontext
+    from stc_swc import stats
+
+    prof = None
+    if args.profile:
+        import cProfile
+        prof = cProfile.Profile()
+    with (stats.collect() if args.stats else nullcontext()) as st:
+        if prof:
+            prof.enable()
+        try:
+            rc = run(args, inputs, formats, out_dir)
+        finally:
+            if prof:
+                prof.disable()
+                prof.dump_stats(args.profile)
+                print(f"Profil → {args.profile} (python -m pstats {args.profile})", file=sys.stderr)
+    if st is not None:
+        report = {"files": len(inputs), "exit_code": rc, **st.as_dict()}
+        print(json.dumps(report, indent=2), file=sys.stderr)
+    return rc
+
+DB_DEFAULT = "outputs/swc_findings.db"
+TABLE_COLUMNS = ["finding_id", "severity", "swc_id", "contract", "file", "line_start", "title"]
+
+def query_main(argv) -> int:
+    from stc_swc.export.sqlite_store import COLUMNS as DB_COLUMNS, count, query
+
+    ap = argparse.ArgumentParser(prog="cli.py query", description="Query store SQLite temuan (pakai index)")
+    ap.add_argument("--db", default=DB_DEFAULT)
+    ap.add_argument("--swc", nargs="+", help="SWC-ID, mis. 107 atau SWC-107")
+    ap.add_argument("--severity", nargs="+")
+    ap.add_argument("--contract", nargs="+")
+    ap.add_argument("--commit", nargs="+", dest="commit_hash")
+    ap.add_argument("--since", help="Timestamp ISO minimal (inklusif)")
+    ap.add_argument("--until", help="Timestamp ISO maksimal (eksklusif)")
+    ap.add_argument("--order-by", default="timestamp", choices=DB_COLUMNS)
+    ap.add_argument("--asc", action="store_true", help="Urut naik (default: turun)")
+    ap.add_argument("--limit", type=int, default=50)
+    ap.add_argument("--offset", type=int, default=0)
+    ap.add_argument("--count", action="store_true", help="Cetak jumlah saja")
+    ap.add_argument("--group-by", choices=DB_COLUMNS, help="Jumlah per nilai kolom ini")
+    ap.add_argument("--output", choices=["table", "ndjson"], default="table")
+    args = ap.parse_args(argv)
+
+    if not Path(args.db).exists():
+        ap.error(f"database tidak ditemukan: {args.db} (isi dulu dengan --db saat konversi)")
+    filters = dict(swc=args.swc, severity=args.severity, contract=args.contract,
+                   commit_hash=args.commit_hash, since=args.since, until=args.until)
+
+    if args.count or args.group_by:
+        res = count(args.db, group_by=args.group_by, **filters)
+        if args.group_by:
+            for k, n in res.items():
+                print(f"{n:>8}  {k}")
+        else:
+            print(res)
+        return 0
+
+    rows = query(args.db, **filters, order_by=args.order_by, descending=not args.asc,
+                 limit=args.limit, offset=args.offset)
+    if args.output == "ndjson":
+        from stc_swc.serializer import dumps_line
+        for r in rows:
+            sys.stdout.buffer.write(dumps_line(r))
+        return 0
+    print("  ".join(TABLE_COLUMNS))
+    for r in rows:
+        print("  ".join(str(r.get(c, "")) for c in TABLE_COLUMNS))
+    return 0
+
+def watch_main(argv) -> int:
+    from stc_swc.watch import CHECKPOINT_NAME, POLL_INTERVAL, SETTLE_SECONDS, Watcher
+
+    ap = argparse.ArgumentParser(prog="cli.py watch",
+                                 description="Pantau direktori & konversi report baru/berubah secara otomatis")
+    ap.add_argument("dir", help="Direktori tempat scanner menaruh report JSON")
+    ap.add_argument("--tool", default=AUTO, choices=[AUTO, *sorted(PARSERS)])
+    ap.add_argument("--out-dir", default="outputs")
+    ap.add_argument("--timestamp", default="", help="Override timestamp ISO (opsional)")
+    ap.add_argument("--jobs", type=int, default=1, help="Jumlah worker process per putaran (0 = semua CPU)")
+    ap.add_argument("--format", nargs="+", default=["csv", "ndjson"], choices=sorted(FORMATS))
+    ap.add_argument("--compress", choices=CODECS)
+    ap.add_argument("--compress-level", type=int, default=None)
+    ap.add_argument("--db", default=None, help="Upsert juga baris ke store SQLite ini")
+    ap.add_argument("--interval", type=float, default=POLL_INTERVAL, help="Jeda antar poll (detik)")
+    ap.add_argument("--settle", type=float, default=SETTLE_SECONDS,
+                    help="File dianggap selesai ditulis setelah tidak berubah selama N detik")
+    ap.add_argument("--checkpoint", default=None,
+                    help=f"File checkpoint (default: <out-dir>/{CHECKPOINT_NAME})")
+    ap.add_argument("--once", action="store_true",
+                    help="Proses yang ada lalu keluar (tanpa menunggu file baru); "
+                         "exit 1 kalau ada file yang gagal")
+    args = ap.parse_args(argv)
+
+    if not Path(args.dir).is_dir():
+        ap.error(f"direktori tidak ditemukan: {args.dir}")
+    if args.compress and not available(args.compress):
+        ap.error(f"--compress {args.compress} butuh paket zstandard (pip install zstandard)")
+    for fmt in args.format:
+        if pkg := missing_dependency(fmt):
+            ap.error(f"--format {fmt} butuh paket {pkg} (pip install {pkg})")
+
+    import signal
+    import threading
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+    watcher = Watcher(args.dir, args.out_dir, list(dict.fromkeys(args.format)), tool=args.tool,
+                      timestamp_iso=args.timestamp or None, jobs=args.jobs,
+                      compression=args.compress, level=args.compress_level,
+                      db=args.db, checkpoint=args.checkpoint, settle=args.settle,
+                      log=lambda msg: print(msg, flush=True))
+    try:
+        failed = watcher.run(interval=args.interval, once=args.once, stop=stop)
+    except KeyboardInterrupt:
+        failed = len(watcher.failed)
+    return 1 if failed else 0
 
 def main():
+    if sys.argv[1:2] == ["query"]:
+        return query_main(sys.argv[2:])
+    if sys.argv[1:2] == ["watch"]:
+        return watch_main(sys.argv[2:])
+
     ap = argparse.ArgumentParser(description="STC for SWC Converter (Mythril/Slither JSON → STC Analytics schema)")
-    ap.add_argument("--tool", required=True, choices=["mythril", "slither"])
-    ap.add_argument("--input", required=True, help="Path ke file JSON report")
+    ap.add_argument("--tool", default=AUTO, choices=[AUTO, *sorted(PARSERS)],
+                    help="Tool penghasil report (default: auto, dideteksi per file)")
+    ap.add_argument("--input", required=True, nargs="+",
+                    help="Path ke file JSON report; boleh lebih dari satu, glob, atau direktori")
     ap.add_argument("--out-dir", default="outputs")
     ap.add_argument("--timestamp", default="", help="Override timestamp ISO (opsional)")
+    ap.add_argument("--jobs", type=int, default=1, help="Jumlah worker process untuk batch (0 = semua CPU)")
+    ap.add_argument("--format", nargs="+", default=["csv", "ndjson"], choices=sorted(FORMATS),
+                    help="Format output (default: csv ndjson)")
+    ap.add_argument("--compress", choices=CODECS,
+                    help="Kompres output CSV/NDJSON (gzip; zstd butuh paket zstandard)")
+    ap.add_argument("--compress-level", type=int, default=None,
+                    help="Level kompresi (default gzip 6, zstd 3)")
+    ap.add_argument("--layout", choices=["single", "partitioned"], default="single",
+                    help="single = satu file per format; partitioned = direktori key=value/ ala Hive")
+    ap.add_argument("--partition-by", nargs="+", default=["network", "contract"], choices=FIELDS,
+                    metavar="KOLOM", help="Kolom partisi untuk --layout partitioned (default: network contract)")
+    ap.add_argument("--max-rows", type=int, default=None, help="Rotate shard setelah N baris")
+    ap.add_argument("--max-bytes", type=int, default=None,
+                    help="Rotate shard setelah N bytes (sebelum kompresi)")
+    ap.add_argument("--db", default=None,
+                    help="Upsert juga baris ke store SQLite ini (lihat: cli.py query)")
+    ap.add_argument("--merge", action="store_true",
+                    help="Gabungkan temuan lintas tool (file, contract, SWC sama & baris overlap); "
+                         "tambah kolom tools dan merged_ids")
+    ap.add_argument("--force", action="store_true",
+                    help="Abaikan cache manifest, konversi ulang semua report")
+    ap.add_argument("--stats", choices=["json"], default=None,
+                    help="Cetak waktu, baris & bytes per stage (extract/normalize/export) + hit/miss "
+                         "registry ke stderr")
+    ap.add_argument("--profile", metavar="FILE", default=None,
+                    help="Tulis dump cProfile/pstats konversi ke FILE (thread utama)")
     args = ap.parse_args()
 
     out_dir = Path(args.out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    if args.tool == "mythril":
-        raw = parse_mythril(args.input)
-    else:
-        raw = parse_slither(args.input)
-
-    rows = to_stc_schema_batch(raw, tool=args.tool, timestamp_iso=args.timestamp or None)
+    inputs = expand_inputs(args.input)
+    if not inputs:
+        ap.error("tidak ada file report yang cocok dengan --input")
 
-    csv_path = out_dir / "swc_findings.csv"
-    ndj_path = out_dir / "swc_findings.ndjson"
+    formats = list(dict.fromkeys(args.format))
+    if args.compress and not available(args.compress):
+        ap.error(f"--compress {args.compress} butuh paket zstandard (pip install zstandard)")
+    for fmt in args.format:
+        if pkg := missing_dependency(fmt):
+            ap.error(f"--format {fmt} butuh paket {pkg} (pip install {pkg})")
 
-    write_csv(rows, str(csv_path))
-    write_ndjson(rows, str(ndj_path))
+    if args.layout == "partitioned":
+        from stc_swc.export.partitioned import PARTITION_FORMATS
+        unsupported = [f for f in formats if f not in PARTITION_FORMATS]
+        if unsupported:
+            ap.error(f"--layout partitioned hanya mendukung {', '.join(PARTITION_FORMATS)}")
 
-    print(f"OK → {csv_path}")
-    print(f"OK → {ndj_path}")
+    # stats / profil hanya dipasang kalau diminta -> tanpa overhead saat mati
+    run = run_partitioned if args.layout == "partitioned" else run_single
+    if not (args.stats or args.profile):
+        return run(args, inputs, formats, out_dir)
+    return run_instrumented(run, args, inputs, formats, out_dir)
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""
+Batch mode: konversi banyak report sekaligus di process pool.
+
+Hasil digabung sesuai urutan file (deterministik), dan file yang gagal
+dicatat tanpa menghentikan batch.
+
+Extractor, mapper dan process pool baru diimport saat konversi berjalan,
+jadi ``cli.py --help`` / parsing argumen tidak ikut membayar biayanya.
+"""
+from __future__ import annotations
+import glob
+import os
+from importlib import import_module
+from pathlib import Path
+
+from stc_swc import stats
+from stc_swc.extract.sniff import sniff_tool
+
+# tool -> modul extractor (punya ``iter_report``)
+PARSERS = {
+    "mythril": "stc_swc.extract.mythril",
+    "slither": "stc_swc.extract.slither",
+}
+
+# tool="auto": format tiap report dideteksi dari prefix file-nya
+AUTO = "auto"
+
+REPORT_GLOBS = ["*.json", "*.json.gz", "*.json.zst"]
+_HIDDEN = ("_", ".")
+
+def parser(tool: str):
+    """``iter_report`` milik extractor ``tool`` (modul diimport saat pertama dipakai)."""
+    return import_module(PARSERS[tool]).iter_report
+
+def expand_inputs(patterns: list[str]) -> list[str]:
+    """
+    Path file, glob, atau direktori (dicari *.json / *.json.gz / *.json.zst
+    rekursif) -> daftar file unik terurut. Saat scan direktori, file yang
+    diawali ``_`` / ``.`` (metadata, mis. ``_manifest.json`` dataset partisi)
+    dilewati.
+    """
+    found = set()
+    for pat in patterns:
+        p = Path(pat)
+        if p.is_dir():
+            found.update(str(x) for pat in REPORT_GLOBS for x in p.rglob(pat)
+                         if x.is_file() and not x.name.startswith(_HIDDEN))
+        elif p.is_file():
+            found.add(str(p))
+        else:
+            found.update(x for x in glob.glob(pat, recursive=True) if os.path.isfile(x))
+    return sorted(found)
+
+def resolve_tool(path: str, tool: str = AUTO) -> str:
+    """
+    Tool untuk ``path``: hasil sniff kalau ``tool`` = auto. Kalau tool
+    ditentukan tapi isi report jelas milik tool lain -> ValueError, bukan
+    nol temuan diam-diam.
+    """
+    detected = sniff_tool(path)
+    if tool == AUTO:
+        if detected not in PARSERS:
+            raise ValueError("format report tidak dikenali (bukan Mythril/Slither)")
+        return detected
+    if detected in PARSERS and detected != tool:
+        raise ValueError(f"report terdeteksi sebagai {detected}, bukan {tool}")
+    return tool
+
+def convert_file(path: str, tool: str, timestamp_iso: str | None = None) -> list[dict]:
+    from stc_swc.normalize.mapper import to_stc_schema_batch
+    tool = resolve_tool(path, tool)
+    stats.add("extract", bytes_in=os.path.getsize(path))
+    with stats.stage("normalize"):
+        rows = to_stc_schema_batch(stats.timed("extract", parser(tool)(path)),
+                                   tool=tool, timestamp_iso=timestamp_iso)
+    stats.add("normalize", rows=len(rows))
+    return rows
+
+def _convert_one(path, tool, timestamp_iso):
+    try:
+        return path, convert_file(path, tool, timestamp_iso), None
+    except Exception as e:
+        return path, None, f"{type(e).__name__}: {e}"
+
+def _convert_safe(args):
+    path, tool, timestamp_iso, collect = args
+    if not collect:
+        return (*_convert_one(path, tool, timestamp_iso), None)
+    # worker process punya collector sendiri; hasilnya di-merge di parent
+    with stats.collect() as st:
+        res = _convert_one(path, tool, timestamp_iso)
+    return (*res, st.as_dict())
+
+class PartialFileError(Exception):
+    """
+    Report gagal setelah sebagian barisnya sudah di-yield (jalur sequential
+    yang streaming). Pemanggil membatalkan output run ini lalu mengulangnya
+    dengan report itu di ``skip`` (lihat ``retry_partial``).
+    """
+    def __init__(self, path: str, error: str):
+        super().__init__(f"{path}: {error}")
+        self.path = path
+        self.error = error
+
+def _iter_file(path, tool, timestamp_iso, outcome: dict):
+    from stc_swc.normalize.mapper import iter_stc_schema
+    n = 0
+    try:
+        file_tool = resolve_tool(path, tool)
+        stats.add("extract", bytes_in=os.path.getsize(path))
+        raw = stats.timed("extract", parser(file_tool)(path))
+        for row in stats.timed("normalize", iter_stc_schema(raw, tool=file_tool, timestamp_iso=timestamp_iso)):
+            n += 1
+            yield row
+    except Exception as e:
+        err = f"{type(e).__name__}: {e}"
+        if n:
+            raise PartialFileError(path, err) from e
+        outcome["error"] = err
+    outcome["rows"] = n
+
+def iter_files(paths: list[str], tool: str, timestamp_iso: str | None = None, jobs: int = 1,
+               skip: dict | None = None):
+    """
+    Yield ``(path, rows, outcome)`` per file sesuai urutan ``paths``. Setelah
+    ``rows`` habis diiterasi, ``outcome`` = ``{"rows": n, "error": pesan
+    atau None}``. Dengan satu worker baris di-stream langsung dari parser
+    (memori O(batch)); kalau report rusak setelah ada baris yang di-yield ->
+    ``PartialFileError``. ``skip`` = path -> error yang sudah diketahui; path
+    itu dilaporkan gagal tanpa di-parse.
+    """
+    skip = skip or {}
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    if jobs <= 1 or len(paths) <= 1:
+        for path in paths:
+            if path in skip:
+                yield path, (), {"rows": 0, "error": skip[path]}
+                continue
+            outcome = {"rows": 0, "error": None}
+            yield path, _iter_file(path, tool, timestamp_iso, outcome), outcome
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    parent = stats.current()
+    tasks = [(p, tool, timestamp_iso, parent is not None) for p in paths if p not in skip]
+    # chunksize > 1 supaya ribuan file kecil tidak bolak-balik IPC per file
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        results = ex.map(_convert_safe, tasks, chunksize=chunksize)
+        for path in paths:
+            if path in skip:
+                yield path, (), {"rows": 0, "error": skip[path]}
+                continue
+            _, file_rows, err, worker_stats = next(results)
+            if worker_stats:
+                parent.merge(worker_stats)
+            yield path, file_rows or (), {"rows": len(file_rows or ()), "error": err}
+
+def iter_batch(paths: list[str], tool: str, timestamp_iso: str | None = None,
+               jobs: int = 1, failures: list | None = None, on_file=None,
+               skip: dict | None = None):
+    """
+    Yield baris hasil konversi semua ``paths`` sesuai urutan file.
+    File yang gagal dicatat ke ``failures`` sebagai (path, pesan error).
+    ``on_file(path, n_rows, err)`` dipanggil setelah baris tiap file habis di-yield.
+    Report yang rusak setelah sebagian barisnya ter-yield -> ``PartialFileError``
+    (lihat ``iter_files``), jadi output tetap all-or-nothing per file.
+    """
+    if failures is None:
+        failures = []
+    for path, file_rows, outcome in iter_files(paths, tool, timestamp_iso=timestamp_iso,
+                                               jobs=jobs, skip=skip):
+        yield from file_rows
+        if outcome["error"] is not None:
+            failures.append((path, outcome["error"]))
+        if on_file:
+            on_file(path, outcome["rows"], outcome["error"])
+
+def retry_partial(run, skip: dict | None = None):
+    """
+    Panggil ``run(skip)``; setiap ``PartialFileError`` -> report itu masuk
+    ``skip`` (path -> error) dan ``run`` diulang. ``run`` harus membatalkan
+    output-nya sendiri saat exception (lihat ``pipeline.fan_out``).
+    """
+    skip = {} if skip is None else skip
+    while True:
+        try:
+            return run(skip)
+        except PartialFileError as e:
+            skip[e.path] = e.error
+
+def run_batch(paths: list[str], tool: str, timestamp_iso: str | None = None, jobs: int = 1):
+    """Seperti ``iter_batch`` tapi return ``(rows, failures)``."""
+    def attempt(skip):
+        failures = []
+        rows = list(iter_batch(paths, tool, timestamp_iso=timestamp_iso, jobs=jobs,
+                               failures=failures, skip=skip))
+        return rows, failures
+    return retry_partial(attempt)
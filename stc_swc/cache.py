@@ -0,0 +1,306 @@
+"""
+Cache konversi inkremental berbasis content hash report.
+
+Manifest ``swc_findings.manifest`` di out_dir mencatat per input: digest
+isi file dan row range-nya (start, count) di output. Sengaja tanpa
+akhiran ``.json`` supaya tidak ikut terbaca sebagai report kalau out_dir
+dipakai sebagai ``--input``. Run berikutnya hanya
+mengonversi report yang baru / berubah:
+
+- tidak ada perubahan        -> skip total
+- hanya ada report baru yang -> baris baru di-append ke output
+  urut setelah semua report
+  lama
+- selain itu                 -> output ditulis ulang sesuai urutan input; baris
+                                report yang tidak berubah disalin dari output
+                                lama tanpa parse ulang
+
+Seluruh cache invalid kalau versi converter, isi ``swc_registry_full.json``,
+tool, timestamp override, daftar format, kompresi output, store SQLite
+(``db``), atau opsi merge lintas tool berubah, kalau file output diubah di luar converter, atau kalau
+store SQLite-nya hilang.
+"""
+from __future__ import annotations
+import csv
+import hashlib
+import io
+import json
+import os
+from itertools import islice
+from pathlib import Path
+
+from stc_swc import serializer, stats
+from stc_swc.batch import iter_batch, iter_files, retry_partial
+from stc_swc.compression import open_read
+from stc_swc.export.formats import FORMATS, output_path, writer
+from stc_swc.normalize.merge import MERGE_FIELDS, merge_findings
+from stc_swc.normalize.swc_registry import registry_version
+from stc_swc.pipeline import fan_out
+from stc_swc.version import __version__
+
+MANIFEST_NAME = "swc_findings.manifest"
+# nama lama (<= 1.2.0); dibaca sekali lalu dihapus saat manifest baru disimpan
+LEGACY_MANIFEST_NAME = "swc_findings.manifest.json"
+
+# format yang bisa dibaca ulang sebagai sumber baris lama (urutan prioritas)
+_ROW_SOURCES = ["ndjson", "csv"]
+
+def file_digest(path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _settings(tool: str, timestamp_iso: str | None, formats: list[str],
+              compression: str | None = None, db=None, merge: bool = False) -> dict:
+    return {
+        "converter_version": __version__,
+        "registry_version": registry_version(),
+        "tool": tool,
+        "timestamp": timestamp_iso or "",
+        "formats": sorted(formats),
+        "compression": compression or "",
+        "db": os.path.abspath(db) if db else "",
+        "merge": merge,
+    }
+
+def _output_stat(path) -> list | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+def load_manifest(out_dir) -> dict:
+    for name in (MANIFEST_NAME, LEGACY_MANIFEST_NAME):
+        try:
+            return json.loads((Path(out_dir) / name).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            continue
+        except ValueError:
+            return {}
+    return {}
+
+def save_manifest(out_dir, manifest: dict):
+    p = Path(out_dir) / MANIFEST_NAME
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, p)
+    (Path(out_dir) / LEGACY_MANIFEST_NAME).unlink(missing_ok=True)
+
+def _valid_entries(manifest: dict, settings: dict, out_paths: dict) -> dict:
+    if manifest.get("settings") != settings:
+        return {}
+    outputs = manifest.get("outputs", {})
+    for fmt, path in out_paths.items():
+        if outputs.get(fmt) != _output_stat(path):
+            return {}
+    return manifest.get("inputs", {})
+
+def _read_rows(path, fmt: str):
+    with io.TextIOWrapper(open_read(path), newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield serializer.loads(line)
+
+def _iter_kept(path, fmt: str, kept: list[dict]):
+    """Yield baris output lama yang masuk row range ``kept``."""
+    ranges = sorted((e["start"], e["start"] + e["count"]) for e in kept if e["count"])
+    if not ranges:
+        return
+    i = 0
+    for idx, row in enumerate(_read_rows(path, fmt)):
+        while idx >= ranges[i][1]:
+            i += 1
+            if i == len(ranges):
+                return
+        if idx >= ranges[i][0]:
+            yield row
+
+class _KeptRows:
+    """
+    Baris output lama per row range, dibaca sekali dari awal ke akhir file.
+    Range yang diminta sesuai urutan file di-stream langsung; hanya range
+    yang diminta lebih lambat dari posisinya di file yang di-buffer.
+    """
+    def __init__(self, path, fmt: str, kept: list[dict]):
+        self._ranges = sorted((e["start"], e["count"]) for e in kept if e["count"])
+        self._rows = stats.timed("reuse", _iter_kept(path, fmt, kept))
+        self._next = 0
+        self._buffered = {}
+
+    def take(self, entry: dict):
+        """Iterable baris range ``entry``; harus habis dikonsumsi sebelum ``take`` berikutnya."""
+        if not entry["count"]:
+            return ()
+        if entry["start"] in self._buffered:
+            return self._buffered.pop(entry["start"])
+        while True:
+            start, count = self._ranges[self._next]
+            self._next += 1
+            if start == entry["start"]:
+                return islice(self._rows, count)
+            self._buffered[start] = list(islice(self._rows, count))
+
+def _iter_interleaved(inputs: list[str], unchanged: set, old: dict, kept: _KeptRows,
+                      converted, failures: list, on_file):
+    """
+    Baris semua ``inputs`` sesuai urutan input: report di ``unchanged``
+    disalin dari output lama, sisanya diambil berurutan dari ``converted``
+    (hasil ``iter_files``).
+    """
+    for p in inputs:
+        if p in unchanged:
+            yield from kept.take(old[p])
+            on_file(p, old[p]["count"], None)
+            continue
+        _, file_rows, outcome = next(converted)
+        yield from file_rows
+        if outcome["error"] is not None:
+            failures.append((p, outcome["error"]))
+        on_file(p, outcome["rows"], outcome["error"])
+
+def convert_incremental(inputs: list[str], tool: str, out_dir, formats: list[str],
+                        timestamp_iso: str | None = None, jobs: int = 1,
+                        force: bool = False, failures: list | None = None,
+                        compression: str | None = None, level: int | None = None,
+                        db=None, digests: dict | None = None, merge: bool = False) -> dict:
+    """
+    Konversi ``inputs`` ke ``out_dir`` memakai manifest sebagai cache.
+    ``compression`` / ``level`` diteruskan ke writer CSV & NDJSON.
+    ``db`` = store SQLite yang ikut di-upsert; karena masuk settings cache,
+    menambah ``db`` (atau store-nya hilang) memicu konversi penuh sehingga
+    store berisi semua baris, bukan hanya baris run ini.
+    ``merge`` = gabungkan temuan lintas tool (``merge_findings``) dan ekspor
+    kolom ``MERGE_FIELDS``; karena cluster bisa lintas report, output selalu
+    ditulis ulang penuh (kecuali tidak ada perubahan sama sekali).
+    ``digests`` = digest yang sudah diketahui per path (mis. dari checkpoint
+    mode watch); path lain di-hash seperti biasa.
+    Return ringkasan: mode (skip/append/replace/full, atau failed kalau
+    semua report gagal dan output lama tidak disentuh), jumlah file
+    dikonversi / dilewati, dan total baris di output.
+    """
+    if failures is None:
+        failures = []
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_paths = {fmt: output_path(out_dir, fmt, compression=compression) for fmt in formats}
+    settings = _settings(tool, timestamp_iso, formats, compression, db, merge)
+    known = digests or {}
+    digests = {p: known.get(p) or file_digest(p) for p in inputs}
+
+    manifest = load_manifest(out_dir)
+    old = {} if force or (db and not os.path.exists(db)) else _valid_entries(manifest, settings, out_paths)
+
+    unchanged = [p for p in inputs
+                 if p in old and old[p].get("ok") and old[p].get("digest") == digests[p]]
+    unchanged_set = set(unchanged)
+    todo = [p for p in inputs if p not in unchanged_set]
+    removed = [p for p in old if p not in digests]
+    replaced = [p for p in todo if p in old]
+    source = next((f for f in _ROW_SOURCES if f in out_paths), None)
+
+    if old and not todo and not removed:
+        return {"mode": "skip", "converted": 0, "skipped": len(unchanged), "rows": manifest.get("rows", 0)}
+    # append hanya kalau report baru semuanya urut setelah report lama;
+    # selain itu output ditulis ulang supaya urutannya tetap urutan input
+    tail_only = not todo or not unchanged or inputs.index(todo[0]) > inputs.index(unchanged[-1])
+    if merge:
+        mode = "full"
+        unchanged, todo = [], list(inputs)
+    elif old and not removed and not replaced and tail_only and all(FORMATS[f][2] for f in formats):
+        mode = "append"
+    elif old and source:
+        mode = "replace"
+    else:
+        mode = "full"
+        unchanged, todo = [], list(inputs)
+
+    base_entries = {}
+    base_pos = 0
+    if mode == "append":
+        for p in sorted(unchanged, key=lambda p: old[p]["start"]):
+            base_entries[p] = old[p]
+            base_pos = max(base_pos, old[p]["start"] + old[p]["count"])
+    extra_fields = MERGE_FIELDS if merge else ()
+
+    if mode == "append":
+        targets = out_paths
+        # ukuran sebelum run -> baris yang sudah ter-append bisa dibuang lagi
+        sizes = {f: (p.stat().st_size if p.exists() else None) for f, p in out_paths.items()}
+    else:
+        # tulis ke file sementara lalu rename -> output lama utuh kalau gagal
+        targets = {f: p.with_name(p.name + ".tmp") for f, p in out_paths.items()}
+
+    def discard():
+        for fmt, path in targets.items():
+            if mode != "append" or sizes[fmt] is None:
+                path.unlink(missing_ok=True)
+            else:
+                with open(path, "r+b") as fh:
+                    fh.truncate(sizes[fmt])
+
+    n0 = len(failures)
+    entries = {}
+    pos = 0
+
+    def on_file(path, n, err):
+        nonlocal pos
+        entries[path] = {"digest": digests[path], "ok": err is None, "start": pos, "count": n}
+        pos += n
+
+    def attempt(skip):
+        # satu percobaan penuh; report yang rusak di tengah stream -> semua
+        # output percobaan ini dibuang dan report itu dilewati di percobaan
+        # berikutnya (``retry_partial``)
+        nonlocal pos
+        del failures[n0:]
+        entries.clear()
+        entries.update(base_entries)
+        pos = base_pos
+        if mode == "replace":
+            rows = _iter_interleaved(inputs, unchanged_set, old, _KeptRows(out_paths[source], source,
+                                     [old[p] for p in unchanged]),
+                                     iter_files(todo, tool, timestamp_iso=timestamp_iso, jobs=jobs, skip=skip),
+                                     failures, on_file)
+        else:
+            rows = iter_batch(todo, tool, timestamp_iso=timestamp_iso, jobs=jobs,
+                              failures=failures, on_file=on_file, skip=skip)
+        if merge:
+            rows = merge_findings(rows)
+        sinks = [
+            stats.sink(f"export.{fmt}", lambda rs, w=writer(fmt, compression, level, extra_fields), p=str(path),
+                       a=(mode == "append"): w(rs, p, append=a), path)
+            for fmt, path in targets.items()
+        ]
+        if db:
+            from stc_swc.export.sqlite_store import write_sqlite
+            sinks.append(stats.sink("export.sqlite", lambda rs: write_sqlite(rs, db), db))
+        try:
+            return fan_out(rows, sinks)
+        except BaseException:
+            discard()
+            raise
+
+    n = retry_partial(attempt)
+    # entries mencatat jumlah baris per report sebelum merge
+    total = n if merge else pos
+    if mode != "append":
+        if entries and not pos and not any(e["ok"] for e in entries.values()):
+            # semua report gagal dan tidak ada baris -> output & manifest lama dibiarkan
+            discard()
+            return {"mode": "failed", "converted": len(todo), "skipped": 0, "rows": 0}
+        for fmt, tmp in targets.items():
+            os.replace(tmp, out_paths[fmt])
+
+    save_manifest(out_dir, {
+        "settings": settings,
+        "rows": total,
+        "inputs": {p: entries[p] for p in sorted(entries, key=lambda p: entries[p]["start"])},
+        "outputs": {fmt: _output_stat(p) for fmt, p in out_paths.items()},
+    })
+    return {"mode": mode, "converted": len(todo), "skipped": len(unchanged), "rows": total}
@@ -0,0 +1,105 @@
+"""
+Kompresi streaming untuk output CSV / NDJSON dan input report.
+
+gzip selalu tersedia (stdlib); zstd dipakai kalau paket ``zstandard``
+terinstall (opsional, hanya diimport saat dipakai). Input dikenali dari
+magic bytes, bukan ekstensi, jadi ``report.json.gz`` / ``.zst`` bisa langsung
+dibaca tanpa di-unpack.
+"""
+from __future__ import annotations
+import gzip
+from contextlib import nullcontext
+
+CODECS = ("gzip", "zstd")
+SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+DEFAULT_LEVEL = {"gzip": 6, "zstd": 3}
+
+_MAGIC = {b"\x1f\x8b": "gzip", b"\x28\xb5\x2f\xfd": "zstd"}
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("Kompresi zstd butuh zstandard: pip install zstandard") from e
+    return zstandard
+
+def available(compression: str) -> bool:
+    if compression == "zstd":
+        try:
+            _zstd()
+        except ImportError:
+            return False
+    return compression in CODECS
+
+def _check(compression: str | None):
+    if compression and compression not in CODECS:
+        raise ValueError(f"compression tidak dikenal: {compression!r} (pilihan: {', '.join(CODECS)})")
+
+def suffix(compression: str | None) -> str:
+    _check(compression)
+    return SUFFIXES.get(compression, "")
+
+def open_write(path, compression: str | None = None, level: int | None = None,
+               append: bool = False):
+    """
+    Buka ``path`` untuk tulis binary, lewat kompresor kalau ``compression``
+    diisi. Append menulis member gzip / frame zstd baru di akhir file;
+    keduanya dibaca berurutan oleh decompressor (dan ``zcat``/``zstdcat``).
+    ``path`` boleh file object binary (mis. ``io.BytesIO``); file itu tidak
+    ikut ditutup.
+    """
+    _check(compression)
+    owned = not hasattr(path, "write")
+    mode = "ab" if append else "wb"
+    if not compression:
+        return open(path, mode) if owned else nullcontext(path)
+    if level is None:
+        level = DEFAULT_LEVEL[compression]
+    if compression == "gzip":
+        if owned:
+            return gzip.open(path, mode, compresslevel=level)
+        return gzip.GzipFile(fileobj=path, mode="wb", compresslevel=level)
+    zstd = _zstd()
+    fp = open(path, mode) if owned else path
+    return zstd.ZstdCompressor(level=level).stream_writer(fp, closefd=owned)
+
+def codec_of(head: bytes) -> str | None:
+    """Codec dari beberapa byte pertama data (None = tidak terkompresi)."""
+    for magic, codec in _MAGIC.items():
+        if head.startswith(magic):
+            return codec
+    return None
+
+def sniff(path) -> str | None:
+    """Codec file dari magic bytes-nya (None = tidak terkompresi)."""
+    with open(path, "rb") as f:
+        return codec_of(f.read(4))
+
+def open_read(path):
+    """Buka ``path`` untuk baca binary; gzip / zstd di-decompress transparan."""
+    codec = sniff(path)
+    if codec == "gzip":
+        return gzip.open(path, "rb")
+    if codec == "zstd":
+        zstd = _zstd()
+        return zstd.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True, closefd=True)
+    return open(path, "rb")
+
+def wrap_read(fp):
+    """
+    Bungkus file object binary milik pemanggil dengan decompressor kalau
+    isinya gzip / zstd; ``fp`` tidak ikut ditutup. Data biasa -> ``fp`` apa adanya.
+    """
+    if hasattr(fp, "peek"):
+        head = fp.peek(4)[:4]
+    else:
+        pos = fp.tell()
+        head = fp.read(4)
+        fp.seek(pos)
+    codec = codec_of(head)
+    if codec == "gzip":
+        return gzip.GzipFile(fileobj=fp, mode="rb")
+    if codec == "zstd":
+        zstd = _zstd()
+        return zstd.ZstdDecompressor().stream_reader(fp, read_across_frames=True, closefd=False)
+    return fp
@@ -1,5 +1,10 @@
-import csv
+from __future__ import annotations
+import io
 from pathlib import Path
+from typing import Iterable, Sequence
+
+from stc_swc.compression import open_write
+from stc_swc.finding import values_getter
 
 FIELDS = [
     "finding_id",
@@ -18,12 +23,43 @@ FIELDS = [
     "commit_hash"
 ]
 
-def write_csv(rows: list[dict], path: str):
-    p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=FIELDS)
-        w.writeheader()
+# baris ditampung di StringIO dan di-flush per ~1 MB ke file / kompresor
+BUFFER_SIZE = 1 << 20
+
+def write_csv(rows: Iterable[dict], path: str, append: bool = False,
+              compression: str | None = None, level: int | None = None,
+              chunk_size: int = BUFFER_SIZE, extra_fields: Sequence[str] = ()) -> int:
+    """
+    Tulis ``rows`` sebagai CSV. ``compression`` ("gzip"/"zstd") membuat
+    output di-stream lewat kompresor dengan ``level``; ``chunk_size`` = ukuran
+    buffer (bytes) per write ke file / kompresor. ``path`` boleh file object
+    binary (mis. ``io.BytesIO``). ``extra_fields`` = kolom tambahan setelah
+    ``FIELDS`` (mis. ``MERGE_FIELDS``).
+    """
+    # modul csv baru dimuat di sini: FIELDS dipakai CLI saat parsing argumen
+    import csv
+    if hasattr(path, "write"):
+        p = path
+    else:
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        # append ke file yang sudah ada -> header tidak ditulis ulang
+        append = append and p.exists() and p.stat().st_size > 0
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    # pastikan hanya field yang terdaftar (Finding: attrgetter, tanpa dict per baris)
+    fields = [*FIELDS, *extra_fields]
+    values = values_getter(fields)
+    n = 0
+    with open_write(p, compression, level, append=append) as f:
+        if not append:
+            w.writerow(fields)
         for r in rows:
-            # pastikan hanya field yang terdaftar
-            w.writerow({k: r.get(k, "") for k in FIELDS})
+            w.writerow(values(r))
+            n += 1
+            if buf.tell() >= chunk_size:
+                f.write(buf.getvalue().encode("utf-8"))
+                buf.seek(0)
+                buf.truncate()
+        f.write(buf.getvalue().encode("utf-8"))
+    return n
@@ -0,0 +1,57 @@
+"""Daftar format output yang dikenal CLI: nama -> (ekstensi, writer, bisa append)."""
+from __future__ import annotations
+from pathlib import Path
+
+from stc_swc.compression import suffix
+
+# exporter baru diimport saat format itu benar-benar ditulis
+# (parquet -> pyarrow; csv/ndjson -> csv, serializer/orjson)
+def write_csv(rows, path, append=False, **kw):
+    from stc_swc.export.csv_exporter import write_csv
+    return write_csv(rows, path, append=append, **kw)
+
+def write_ndjson(rows, path, append=False, **kw):
+    from stc_swc.export.ndjson_exporter import write_ndjson
+    return write_ndjson(rows, path, append=append, **kw)
+
+def _write_parquet(rows, path, append=False, **kw):
+    from stc_swc.export.parquet_exporter import write_parquet
+    return write_parquet(rows, path, **kw)
+
+FORMATS = {
+    "csv": (".csv", write_csv, True),
+    "ndjson": (".ndjson", write_ndjson, True),
+    "parquet": (".parquet", _write_parquet, False),
+}
+
+# paket opsional yang dibutuhkan format tertentu
+REQUIRES = {"parquet": "pyarrow"}
+
+def missing_dependency(fmt: str) -> str | None:
+    """Nama paket yang dibutuhkan ``fmt`` tapi belum terinstall (dicek tanpa import)."""
+    from importlib.util import find_spec
+    pkg = REQUIRES.get(fmt)
+    return pkg if pkg and find_spec(pkg) is None else None
+
+# format teks yang bisa di-stream lewat gzip / zstd (Parquet punya kompresi sendiri)
+COMPRESSIBLE = {"csv", "ndjson"}
+
+def output_path(out_dir, fmt: str, stem: str = "swc_findings", compression: str | None = None) -> Path:
+    ext = FORMATS[fmt][0] + (suffix(compression) if fmt in COMPRESSIBLE else "")
+    return Path(out_dir) / f"{stem}{ext}"
+
+def writer(fmt: str, compression: str | None = None, level: int | None = None,
+           extra_fields: tuple = ()):
+    """
+    Writer ``fmt`` dengan opsi kompresi (kalau formatnya mendukung) dan
+    kolom tambahan ``extra_fields`` sudah terpasang.
+    """
+    w = FORMATS[fmt][1]
+    kw = {}
+    if compression and fmt in COMPRESSIBLE:
+        kw.update(compression=compression, level=level)
+    if extra_fields:
+        kw["extra_fields"] = extra_fields
+    if not kw:
+        return w
+    return lambda rows, path, append=False: w(rows, path, append=append, **kw)
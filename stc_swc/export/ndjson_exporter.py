@@ -1,20 +1,55 @@
-import json
+from __future__ import annotations
 from pathlib import Path
+from typing import Iterable, Sequence
 
-def write_ndjson(rows: list[dict], path: str, mode="full"):
-    p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
+from stc_swc import serializer
+from stc_swc.compression import open_write
+from stc_swc.finding import dict_getter
 
-    FIELDS_FULL = [
-        "finding_id", "timestamp", "network", "contract", "file", "line_start", "line_end",
-        "swc_id", "title", "severity", "confidence", "status", "remediation", "commit_hash"
-    ]
-    FIELDS_SHORT = [
-        "swc_id", "title", "description", "severity", "tool", "contract", "function", "file", "line", "timestamp"
-    ]
-    FIELDS = FIELDS_FULL if mode == "full" else FIELDS_SHORT
+FIELDS_FULL = [
+    "finding_id", "timestamp", "network", "contract", "file", "line_start", "line_end",
+    "swc_id", "title", "severity", "confidence", "status", "remediation", "commit_hash"
+]
+FIELDS_SHORT = [
+    "swc_id", "title", "description", "severity", "tool", "contract", "function", "file", "line", "timestamp"
+]
 
-    with p.open("w", encoding="utf-8") as f:
+# baris di-encode ke buffer dan di-flush per ~1 MB, bukan write() per baris
+BUFFER_SIZE = 1 << 20
+
+def write_ndjson(rows: Iterable[dict], path: str, mode="full", append: bool = False,
+                 compression: str | None = None, level: int | None = None,
+                 chunk_size: int = BUFFER_SIZE, extra_fields: Sequence[str] = ()) -> int:
+    """
+    Tulis ``rows`` sebagai NDJSON. ``compression`` ("gzip"/"zstd") membuat
+    output di-stream lewat kompresor dengan ``level``; ``chunk_size`` = ukuran
+    buffer (bytes) per write ke file / kompresor. ``path`` boleh file object
+    binary (mis. ``io.BytesIO``). ``extra_fields`` = key tambahan per baris
+    (mis. ``MERGE_FIELDS``).
+    """
+    if hasattr(path, "write"):
+        p = path
+    else:
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+
+    FIELDS = [*(FIELDS_FULL if mode == "full" else FIELDS_SHORT), *extra_fields]
+    dumps_line = serializer.dumps_line
+    as_dict = dict_getter(FIELDS)
+
+    n = 0
+    buf = []
+    size = 0
+    with open_write(p, compression, level, append=append) as f:
         for r in rows:
-            obj = {k: r.get(k, "") for k in FIELDS}
-            f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+            line = dumps_line(as_dict(r))
+            buf.append(line)
+            size += len(line)
+            n += 1
+            if size >= chunk_size:
+                f.write(b"".join(buf))
+                buf.clear()
+                size = 0
+        if buf:
+            f.write(b"".join(buf))
+    return n
@@ -0,0 +1,132 @@
+"""
+Parquet / Arrow exporter untuk schema ``FIELDS`` (sama dengan CSV).
+
+Kolom low-cardinality di-dictionary-encode, tipe kolom dibuat benar
+(timestamp, int, float), dan penulisan di-stream per row group dari
+iterator baris. Butuh ``pyarrow`` (opsional, hanya diimport saat dipakai).
+"""
+from __future__ import annotations
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+from stc_swc.export.csv_exporter import FIELDS
+from stc_swc.finding import column
+
+ROW_GROUP_SIZE = 100_000
+
+# kolom yang nilainya berulang antar baris -> dictionary encoding
+DICT_FIELDS = ["network", "contract", "file", "swc_id", "title",
+               "severity", "status", "remediation", "commit_hash"]
+
+def _pa():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Export Parquet butuh pyarrow: pip install pyarrow") from e
+    return pa, pq
+
+def arrow_schema(extra_fields: Sequence[str] = ()):
+    pa, _ = _pa()
+    types = {
+        "finding_id": pa.string(),
+        "timestamp": pa.timestamp("s"),
+        "line_start": pa.int32(),
+        "line_end": pa.int32(),
+        "confidence": pa.float64(),
+    }
+    dict_type = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([(k, types.get(k, dict_type if k in DICT_FIELDS else pa.string()))
+                      for k in [*FIELDS, *extra_fields]])
+
+def _naive_utc(dt: datetime) -> datetime:
+    # kolom timestamp disimpan naive dalam UTC (timestamp tanpa offset sudah
+    # UTC); offset dikonversi dulu, bukan dibuang
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.replace(tzinfo=None)
+
+@lru_cache(maxsize=1024)
+def _parse_ts(s: str):
+    try:
+        return _naive_utc(datetime.fromisoformat(s.replace("Z", "+00:00")))
+    except ValueError:
+        return None
+
+def _to_ts(x):
+    if isinstance(x, datetime):
+        return _naive_utc(x)
+    return _parse_ts(str(x)) if x else None
+
+def _to_int(x):
+    try:
+        return int(x)
+    except (TypeError, ValueError):
+        return None
+
+def _to_float(x):
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return None
+
+_CONVERTERS = {
+    "timestamp": _to_ts,
+    "line_start": _to_int,
+    "line_end": _to_int,
+    "confidence": _to_float,
+}
+
+def _record_batch(rows: list[dict], schema):
+    pa, _ = _pa()
+    arrays = []
+    for field in schema:
+        k = field.name
+        conv = _CONVERTERS.get(k)
+        col = column(rows, k)
+        if conv:
+            vals = [conv(v) for v in col]
+            arrays.append(pa.array(vals, type=field.type))
+        else:
+            vals = [(None if v is None else str(v)) for v in col]
+            arr = pa.array(vals, type=pa.string())
+            arrays.append(arr.dictionary_encode() if pa.types.is_dictionary(field.type) else arr)
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+def iter_record_batches(rows: Iterable[dict], batch_size: int = ROW_GROUP_SIZE,
+                        extra_fields: Sequence[str] = ()) -> Iterator:
+    schema = arrow_schema(extra_fields)
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, batch_size))
+        if not chunk:
+            return
+        yield _record_batch(chunk, schema)
+
+def to_arrow_table(rows: Iterable[dict]):
+    """Baris STC -> ``pyarrow.Table`` in-memory dengan schema bertipe."""
+    pa, _ = _pa()
+    batches = list(iter_record_batches(rows))
+    return pa.Table.from_batches(batches, schema=arrow_schema())
+
+def write_parquet(rows: Iterable[dict], path: str, compression: str = "zstd",
+                  compression_level: int | None = None,
+                  row_group_size: int = ROW_GROUP_SIZE, extra_fields: Sequence[str] = ()) -> int:
+    """
+    Stream ``rows`` ke file Parquet, satu row group per ``row_group_size``
+    baris. ``extra_fields`` = kolom string tambahan (mis. ``MERGE_FIELDS``).
+    """
+    _, pq = _pa()
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    n = 0
+    with pq.ParquetWriter(str(p), arrow_schema(extra_fields), compression=compression,
+                          compression_level=compression_level,
+                          use_dictionary=DICT_FIELDS) as w:
+        for batch in iter_record_batches(rows, row_group_size, extra_fields):
+            w.write_batch(batch, row_group_size=row_group_size)
+            n += batch.num_rows
+    return n
@@ -0,0 +1,207 @@
+"""
+Layout output terpartisi ala Hive untuk CSV / NDJSON.
+
+Baris dikelompokkan per kolom partisi (mis. ``network``/``contract``/``swc_id``)
+ke direktori ``key=value/`` dan tiap partisi ditulis sebagai shard
+``part-00000.csv``, ``part-00001.csv``, ... yang di-rotate begitu mencapai
+batas baris atau bytes. ``_manifest.json`` di root dataset mencatat semua
+shard beserta partisi & jumlah barisnya, jadi loader bisa fan-out per shard
+dan melewati partisi yang tidak dibutuhkan.
+
+Dataset ditulis ke direktori sementara lalu di-swap, jadi shard lama dari
+run sebelumnya tidak tercampur.
+"""
+from __future__ import annotations
+import csv
+import io
+import json
+import os
+import shutil
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable
+from urllib.parse import quote
+
+from stc_swc import serializer
+from stc_swc.compression import open_write, suffix
+from stc_swc.export.csv_exporter import FIELDS
+from stc_swc.export.ndjson_exporter import FIELDS_FULL
+from stc_swc.finding import dict_getter, values_getter
+
+MANIFEST_NAME = "_manifest.json"
+DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+PARTITION_FORMATS = {"csv": ".csv", "ndjson": ".ndjson"}
+
+# batas file yang terbuka bersamaan; shard yang tergusur dibuka ulang (append)
+MAX_OPEN = 64
+# buffer per shard sebelum ditulis ke file / kompresor
+SHARD_BUFFER = 1 << 16
+
+def partition_value(value) -> str:
+    """Escape nilai partisi untuk nama direktori (``/``, ``=``, ``%`` dsb)."""
+    s = "" if value is None else str(value)
+    if not s:
+        return DEFAULT_PARTITION
+    if s in (".", ".."):
+        return s.replace(".", "%2E")
+    return quote(s, safe=" -_.,()+@")
+
+def _csv_encoder(fields: list[str]):
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    values = values_getter(fields)
+
+    def encode(row: dict | None) -> bytes:
+        buf.seek(0)
+        buf.truncate()
+        if row is None:
+            w.writerow(fields)
+        else:
+            w.writerow(values(row))
+        return buf.getvalue().encode("utf-8")
+    return encode
+
+def _ndjson_encoder(fields: list[str]):
+    dumps_line = serializer.dumps_line
+    as_dict = dict_getter(fields)
+
+    def encode(row: dict | None) -> bytes:
+        if row is None:
+            return b""
+        return dumps_line(as_dict(row))
+    return encode
+
+# format -> (encoder, kolom dasar)
+_ENCODERS = {"csv": (_csv_encoder, FIELDS), "ndjson": (_ndjson_encoder, FIELDS_FULL)}
+
+class _Shard:
+    def __init__(self, path: Path, partition: dict, header: bytes):
+        self.path = path
+        self.partition = partition
+        self.rows = 0
+        self.bytes = len(header)
+        self.buf = [header] if header else []
+        self.buf_size = len(header)
+        self.f = None
+        self.opened = False
+
+    def write(self, data: bytes, open_fn):
+        self.buf.append(data)
+        self.buf_size += len(data)
+        self.bytes += len(data)
+        self.rows += 1
+        if self.buf_size >= SHARD_BUFFER:
+            self.flush(open_fn)
+
+    def flush(self, open_fn):
+        if not self.buf:
+            return
+        if self.f is None:
+            self.f = open_fn(self.path, append=self.opened)
+            self.opened = True
+        self.f.write(b"".join(self.buf))
+        self.buf.clear()
+        self.buf_size = 0
+
+    def close(self, open_fn):
+        self.flush(open_fn)
+        if self.f is not None:
+            self.f.close()
+            self.f = None
+
+def write_partitioned(rows: Iterable[dict], root, fmt: str = "ndjson",
+                      partition_by: list[str] = ("network", "contract"),
+                      max_rows: int | None = None, max_bytes: int | None = None,
+                      compression: str | None = None, level: int | None = None,
+                      extra_fields: tuple = ()) -> dict:
+    """
+    Tulis ``rows`` ke dataset terpartisi di ``root`` dan return manifest-nya.
+    ``max_bytes`` dihitung dari ukuran sebelum kompresi; ``extra_fields`` =
+    kolom tambahan setelah kolom dasar format (mis. ``MERGE_FIELDS``).
+    """
+    if fmt not in PARTITION_FORMATS:
+        raise ValueError(f"layout partisi hanya untuk {', '.join(PARTITION_FORMATS)}, bukan {fmt!r}")
+    partition_by = list(partition_by)
+    root = Path(root)
+    tmp = root.with_name(root.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    ext = PARTITION_FORMATS[fmt] + suffix(compression)
+    make_encoder, base_fields = _ENCODERS[fmt]
+    encode = make_encoder([*base_fields, *extra_fields])
+    header = encode(None)
+
+    def open_fn(path, append):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return open_write(path, compression, level, append=append)
+
+    current: dict[tuple, _Shard] = {}
+    counters: dict[tuple, int] = {}
+    done: list[_Shard] = []
+    open_lru: OrderedDict[int, _Shard] = OrderedDict()
+
+    def new_shard(key: tuple) -> _Shard:
+        n = counters.get(key, 0)
+        counters[key] = n + 1
+        rel = Path(*(f"{k}={partition_value(v)}" for k, v in zip(partition_by, key)))
+        return _Shard(tmp / rel / f"part-{n:05d}{ext}", dict(zip(partition_by, key)), header)
+
+    def retire(shard: _Shard):
+        open_lru.pop(id(shard), None)
+        shard.close(open_fn)
+        done.append(shard)
+
+    try:
+        for r in rows:
+            key = tuple("" if r.get(k) is None else str(r.get(k)) for k in partition_by)
+            shard = current.get(key)
+            if shard is None:
+                shard = current[key] = new_shard(key)
+            shard.write(encode(r), open_fn)
+
+            if shard.f is not None:
+                open_lru[id(shard)] = shard
+                open_lru.move_to_end(id(shard))
+                if len(open_lru) > MAX_OPEN:
+                    _, old = open_lru.popitem(last=False)
+                    old.close(open_fn)
+
+            if (max_rows and shard.rows >= max_rows) or (max_bytes and shard.bytes >= max_bytes):
+                retire(shard)
+                del current[key]
+        for shard in list(current.values()):
+            retire(shard)
+    except BaseException:
+        for shard in open_lru.values():
+            if shard.f is not None:
+                shard.f.close()
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    done.sort(key=lambda s: str(s.path))
+    manifest = {
+        "format": fmt,
+        "compression": compression or "",
+        "partition_by": partition_by,
+        "rows": sum(s.rows for s in done),
+        "shards": [{
+            "path": s.path.relative_to(tmp).as_posix(),
+            "partition": s.partition,
+            "rows": s.rows,
+            "bytes": os.path.getsize(s.path),
+        } for s in done],
+    }
+    (tmp / MANIFEST_NAME).write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    # swap: dataset lama -> .old, tmp -> root, lalu hapus yang lama
+    old = root.with_name(root.name + ".old")
+    shutil.rmtree(old, ignore_errors=True)
+    if root.exists():
+        os.replace(root, old)
+    os.replace(tmp, root)
+    shutil.rmtree(old, ignore_errors=True)
+    return manifest
+
+def dataset_path(out_dir, fmt: str, stem: str = "swc_findings") -> Path:
+    return Path(out_dir) / f"{stem}_{fmt}"
@@ -0,0 +1,169 @@
+"""
+Store SQLite untuk temuan ter-normalisasi.
+
+Baris di-upsert per ``finding_id`` (fingerprint deterministik, jadi report
+yang sama dikonversi ulang tidak menggandakan baris) dalam satu transaksi
+per panggilan lewat ``executemany``; database memakai WAL supaya query tetap jalan selama
+penulisan. Kolom yang sering difilter (``swc_id``, ``severity``,
+``contract``, ``commit_hash``, ``timestamp``) di-index, dan ``query()``
+hanya membangun WHERE di atas kolom-kolom itu.
+"""
+from __future__ import annotations
+import sqlite3
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from stc_swc.export.csv_exporter import FIELDS
+
+COLUMNS = FIELDS + ["tool"]
+INDEXED = ["swc_id", "severity", "contract", "commit_hash", "timestamp"]
+BATCH_SIZE = 50_000
+
+_TYPES = {"line_start": "INTEGER", "line_end": "INTEGER", "confidence": "REAL"}
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS findings (\n    {}\n)".format(",\n    ".join(
+    f"{c} {_TYPES.get(c, 'TEXT')}{' PRIMARY KEY' if c == 'finding_id' else ''}" for c in COLUMNS))
+
+_UPSERT = "INSERT INTO findings ({cols}) VALUES ({marks}) ON CONFLICT(finding_id) DO UPDATE SET {sets}".format(
+    cols=", ".join(COLUMNS),
+    marks=", ".join("?" * len(COLUMNS)),
+    sets=", ".join(f"{c} = excluded.{c}" for c in COLUMNS if c != "finding_id"),
+)
+
+def connect(path) -> sqlite3.Connection:
+    """Buka (dan siapkan schema + index) database di ``path``."""
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(p))
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(_SCHEMA)
+    for col in INDEXED:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_findings_{col} ON findings ({col})")
+    conn.commit()
+    return conn
+
+def _int(x):
+    try:
+        return int(x)
+    except (TypeError, ValueError):
+        return None
+
+def _float(x):
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return None
+
+def _record(r: dict) -> tuple:
+    out = []
+    for c in COLUMNS:
+        v = r.get(c)
+        if c in ("line_start", "line_end"):
+            v = _int(v)
+        elif c == "confidence":
+            v = _float(v)
+        elif v is None:
+            v = ""
+        elif not isinstance(v, str):
+            v = str(v)
+        out.append(v)
+    return tuple(out)
+
+def write_sqlite(rows: Iterable[dict], path, append: bool = True,
+                 batch_size: int = BATCH_SIZE) -> int:
+    """
+    Upsert ``rows`` ke store di ``path`` dalam satu transaksi (``executemany``
+    per ``batch_size`` baris): kalau ``rows`` raise di tengah jalan (mis.
+    ``fan_out`` dibatalkan), tidak ada baris yang di-commit. ``append`` hanya
+    untuk kompatibilitas signature writer lain: store selalu di-upsert,
+    tidak pernah ditimpa.
+    """
+    conn = connect(path)
+    n = 0
+    try:
+        it = iter(rows)
+        with conn:
+            while True:
+                batch = [_record(r) for r in islice(it, batch_size)]
+                if not batch:
+                    break
+                conn.executemany(_UPSERT, batch)
+                n += len(batch)
+        # perbarui statistik index supaya planner memilih index yang tepat
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+    return n
+
+def _swc_variants(swc: str) -> list[str]:
+    # registry & tool menulis "107" maupun "SWC-107"
+    bare = str(swc).upper().replace("SWC-", "").strip()
+    return [bare, f"SWC-{bare}"]
+
+def _where(swc=None, severity=None, contract=None, commit_hash=None,
+           since=None, until=None) -> tuple[str, list]:
+    clauses, params = [], []
+
+    def any_of(col, values):
+        values = [values] if isinstance(values, str) else list(values)
+        if values:
+            clauses.append(f"{col} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+
+    if swc:
+        swcs = [swc] if isinstance(swc, str) else swc
+        any_of("swc_id", [v for s in swcs for v in _swc_variants(s)])
+    if severity:
+        sevs = [severity] if isinstance(severity, str) else severity
+        any_of("severity", [s.lower() for s in sevs])
+    if contract:
+        any_of("contract", contract)
+    if commit_hash:
+        any_of("commit_hash", commit_hash)
+    if since:
+        clauses.append("timestamp >= ?")
+        params.append(since)
+    if until:
+        clauses.append("timestamp < ?")
+        params.append(until)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+def query(path, swc=None, severity=None, contract=None, commit_hash=None,
+          since: str | None = None, until: str | None = None,
+          order_by: str = "timestamp", descending: bool = True,
+          limit: int | None = 100, offset: int = 0) -> Iterator[dict]:
+    """
+    Yield temuan yang cocok dengan semua filter. Tiap filter boleh satu
+    nilai atau list (OR di dalam filter); ``since``/``until`` = rentang
+    timestamp ISO [since, until).
+    """
+    if order_by not in COLUMNS:
+        raise ValueError(f"order_by tidak dikenal: {order_by!r}")
+    where, params = _where(swc, severity, contract, commit_hash, since, until)
+    sql = f"SELECT {', '.join(COLUMNS)} FROM findings{where} ORDER BY {order_by} {'DESC' if descending else 'ASC'}"
+    if limit is not None:
+        sql += " LIMIT ? OFFSET ?"
+        params += [limit, offset]
+    conn = connect(path)
+    try:
+        for row in conn.execute(sql, params):
+            yield dict(row)
+    finally:
+        conn.close()
+
+def count(path, group_by: str | None = None, **filters) -> int | dict:
+    """Jumlah temuan yang cocok; dengan ``group_by`` -> {nilai kolom: jumlah}."""
+    where, params = _where(**filters)
+    conn = connect(path)
+    try:
+        if group_by is None:
+            return conn.execute(f"SELECT COUNT(*) FROM findings{where}", params).fetchone()[0]
+        if group_by not in COLUMNS:
+            raise ValueError(f"group_by tidak dikenal: {group_by!r}")
+        sql = f"SELECT {group_by}, COUNT(*) FROM findings{where} GROUP BY {group_by} ORDER BY 2 DESC"
+        return {k: n for k, n in conn.execute(sql, params)}
+    finally:
+        conn.close()
@@ -0,0 +1,198 @@
+"""
+Pembaca JSON inkremental untuk report besar.
+
+Report Slither/Mythril bisa ratusan MB; di sini dokumen dibaca per-chunk dan
+hanya elemen array target (mis. ``issues`` atau ``results.detectors``) yang
+di-decode satu per satu, jadi memori tetap datar berapapun ukuran file.
+"""
+import io
+import json
+import os
+import re
+from contextlib import contextmanager
+from os import PathLike
+
+from stc_swc import serializer
+from stc_swc.compression import codec_of, open_read, sniff, wrap_read
+
+CHUNK_SIZE = 1 << 16
+# report sekecil ini di-decode utuh dengan orjson (jauh lebih cepat daripada
+# raw_decode per elemen); pohon objek Python bisa ~8x ukuran file, jadi di
+# atas batas ini tetap streaming supaya memori tetap datar
+WHOLE_DOC_LIMIT = 4 << 20
+
+_WS = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+_NUM_TAIL = "0123456789.eE+-"
+
+
+class _Reader:
+    def __init__(self, fp, chunk_size: int = CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _error(self, msg: str):
+        return json.JSONDecodeError(msg, self.buf, self.pos)
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        # baca minimal sebesar sisa buffer -> total kerja tetap linear
+        # walaupun satu elemen jauh lebih besar dari chunk_size
+        chunk = self.fp.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def compact(self):
+        if self.pos >= self.chunk_size:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+
+    def skip_ws(self) -> str:
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, ch: str):
+        if self.skip_ws() != ch:
+            raise self._error(f"Expecting '{ch}'")
+        self.pos += 1
+
+    def read_value(self):
+        if not self.skip_ws():
+            raise self._error("Expecting value")
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # elemen terpotong di batas chunk -> tambah buffer lalu ulangi;
+                # kalau sudah EOF berarti memang JSON-nya rusak
+                if not self.fill():
+                    raise
+                continue
+            # angka di ujung buffer bisa saja masih berlanjut di chunk berikutnya
+            # (mis. "1.5e" dari "1.5e10") -> pastikan delimiter-nya sudah terbaca
+            nxt = _WS.match(self.buf, end).end()
+            if not self.eof and (nxt == len(self.buf) or self.buf[nxt] in _NUM_TAIL):
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+    def skip_value(self):
+        self.read_value()
+
+
+def _iter_array(r: _Reader):
+    if r.skip_ws() != "[":
+        # bukan array (mis. null) -> anggap kosong
+        r.skip_value()
+        return
+    r.pos += 1
+    if r.skip_ws() == "]":
+        r.pos += 1
+        return
+    while True:
+        yield r.read_value()
+        r.compact()
+        c = r.skip_ws()
+        r.pos += 1
+        if c == ",":
+            continue
+        if c == "]":
+            return
+        r.pos -= 1
+        raise r._error("Expecting ',' delimiter")
+
+
+def _iter_path(r: _Reader, path: tuple):
+    if r.skip_ws() != "{":
+        r.skip_value()
+        return
+    r.pos += 1
+    if r.skip_ws() == "}":
+        r.pos += 1
+        return
+    while True:
+        key = r.read_value()
+        r.expect(":")
+        if key == path[0]:
+            if len(path) == 1:
+                yield from _iter_array(r)
+            else:
+                yield from _iter_path(r, path[1:])
+            return
+        r.skip_value()
+        r.compact()
+        c = r.skip_ws()
+        r.pos += 1
+        if c == ",":
+            continue
+        if c == "}":
+            return
+        r.pos -= 1
+        raise r._error("Expecting ',' delimiter")
+
+
+@contextmanager
+def open_text(src):
+    """
+    Buka path / file object (text atau binary) sebagai stream teks UTF-8.
+    Input gzip / zstd (mis. ``report.json.gz``) di-decompress transparan.
+    """
+    if isinstance(src, (str, PathLike)):
+        with io.TextIOWrapper(open_read(src), encoding="utf-8") as f:
+            yield f
+        return
+    if isinstance(src, io.TextIOBase):
+        yield src
+        return
+    stream = wrap_read(src)
+    wrapper = io.TextIOWrapper(stream, encoding="utf-8")
+    try:
+        yield wrapper
+    finally:
+        # jangan ikut menutup file milik pemanggil
+        wrapper.detach()
+        if stream is not src:
+            stream.close()
+
+
+def _select(doc, path: tuple):
+    node = doc
+    for key in path:
+        node = node.get(key) if isinstance(node, dict) else None
+    return node if isinstance(node, list) else []
+
+
+def iter_json_array(src, path: tuple, chunk_size: int = CHUNK_SIZE):
+    """
+    Yield elemen array pada ``path`` (tuple key) secara inkremental.
+    ``src`` boleh path, file object, atau buffer in-memory (bytes /
+    memoryview, mis. isi upload). Key yang tidak ada / bukan array -> tidak
+    ada yang di-yield.
+    """
+    if isinstance(src, (bytes, bytearray, memoryview)):
+        view = memoryview(src)
+        if (serializer.BACKEND == "orjson" and view.nbytes <= WHOLE_DOC_LIMIT
+                and codec_of(bytes(view[:4])) is None):
+            # orjson menerima buffer langsung, tanpa salinan ke str
+            yield from _select(serializer.loads(view), path)
+            return
+        src = io.BytesIO(view)
+    elif serializer.BACKEND == "orjson" and isinstance(src, (str, PathLike)):
+        if os.path.getsize(src) <= WHOLE_DOC_LIMIT and sniff(src) is None:
+            with open(src, "rb") as f:
+                yield from _select(serializer.loads(f.read()), path)
+            return
+    with open_text(src) as fp:
+        yield from _iter_path(_Reader(fp, chunk_size), tuple(path))
@@ -1,14 +1,9 @@
-import json
-from pathlib import Path
+from stc_swc.extract._stream import iter_json_array
+from stc_swc.finding import Finding
 
-def parse_report(path: str):
-    p = Path(path)
-    data = json.loads(p.read_text(encoding="utf-8"))
-
-    issues = data.get("issues", [])
-    findings = []
-
-    for it in issues:
+def iter_report(src):
+    """Yield temuan satu per satu dari ``issues[]`` (path, file object, atau buffer bytes)."""
+    for it in iter_json_array(src, ("issues",)):
         swc_id = it.get("swc-id") or it.get("swcID") or it.get("swcid")
         title = it.get("title") or ""
         desc = it.get("description") or ""
@@ -35,25 +30,39 @@ def parse_report(path: str):
             if isinstance(line, int):
                 line_start = line_end = line
 
+        # output ``myth analyze -o json`` menaruh lokasi di level issue
+        file_path = file_path or it.get("filename") or ""
+        if not line_start and isinstance(it.get("lineno"), int):
+            line_start = line_end = it["lineno"]
+
         meta = it.get("extra") or {}
-        contract = meta.get("contract") or ""
-        func = meta.get("function") or ""
-
-        findings.append({
-            "swc_id": swc_id,
-            "title": title,
-            "description": desc,
-            "severity": severity,
-            "confidence": confidence,
-            "status": "unresolved",
-            "contract": contract,
-            "function": func,
-            "file": file_path,
-            "line_start": line_start,
-            "line_end": line_end,
-            "remediation": "",
-            "commit_hash": "",
-            "network": "ethereum",
-        })
-
-    return findings
+        contract = meta.get("contract") or it.get("contract") or ""
+        func = meta.get("function") or it.get("function") or ""
+
+        yield Finding(
+            swc_id=swc_id,
+            title=title,
+            description=desc,
+            severity=severity,
+            confidence=confidence,
+            status="unresolved",
+            contract=contract,
+            function=func,
+            file=file_path,
+            line_start=line_start,
+            line_end=line_end,
+            remediation="",
+            commit_hash="",
+            network="ethereum",
+        )
+
+def parse_report(path: str):
+    return list(iter_report(path))
+
+def parse_bytes(data) -> list:
+    """Parse report dari buffer in-memory (bytes / bytearray / memoryview), tanpa file sementara."""
+    return list(iter_report(data))
+
+def parse_stream(fp) -> list:
+    """Parse report dari file object (text / binary, mis. upload Streamlit)."""
+    return list(iter_report(fp))
@@ -1,14 +1,9 @@
-import json
-from pathlib import Path
+from stc_swc.extract._stream import iter_json_array
+from stc_swc.finding import Finding
 
-def parse_report(path: str):
-    p = Path(path)
-    data = json.loads(p.read_text(encoding="utf-8"))
-
-    detectors = data.get("results", {}).get("detectors", [])
-    findings = []
-
-    for d in detectors:
+def iter_report(src):
+    """Yield temuan satu per satu dari ``results.detectors[]`` (path, file object, atau buffer bytes)."""
+    for d in iter_json_array(src, ("results", "detectors")):
         title = d.get("check") or d.get("title") or ""
         desc = d.get("description") or ""
         impact = (d.get("impact") or "").lower()
@@ -36,21 +31,30 @@ def parse_report(path: str):
             contract = parent.get("name", "")
             func = elements[0].get("name", "") or ""
 
-        findings.append({
-            "swc_id": None,  # akan diisi belakangan via mapping
-            "title": title,
-            "description": desc,
-            "severity": impact,
-            "confidence": confidence,
-            "status": "unresolved",
-            "contract": contract,
-            "function": func,
-            "file": file_path,
-            "line_start": line_start,
-            "line_end": line_end,
-            "remediation": "",
-            "commit_hash": "",
-            "network": "ethereum",
-        })
-
-    return findings
+        yield Finding(
+            swc_id=None,  # akan diisi belakangan via mapping
+            title=title,
+            description=desc,
+            severity=impact,
+            confidence=confidence,
+            status="unresolved",
+            contract=contract,
+            function=func,
+            file=file_path,
+            line_start=line_start,
+            line_end=line_end,
+            remediation="",
+            commit_hash="",
+            network="ethereum",
+        )
+
+def parse_report(path: str):
+    return list(iter_report(path))
+
+def parse_bytes(data) -> list:
+    """Parse report dari buffer in-memory (bytes / bytearray / memoryview), tanpa file sementara."""
+    return list(iter_report(data))
+
+def parse_stream(fp) -> list:
+    """Parse report dari file object (text / binary, mis. upload Streamlit)."""
+    return list(iter_report(fp))
@@ -0,0 +1,77 @@
+"""
+Deteksi format report (Mythril / Slither / ...) dari prefix file.
+
+Hanya ``SNIFF_BYTES`` pertama yang dibaca (setelah decompress kalau gzip /
+zstd); key level atas objek JSON di-scan tanpa parse penuh dan key pertama
+yang cocok dengan ``TOOL_SIGNATURES`` menentukan tool. Report besar pun
+cukup dibaca beberapa KB.
+"""
+from __future__ import annotations
+import io
+import re
+from os import PathLike
+
+from stc_swc.compression import codec_of, open_read, wrap_read
+
+SNIFF_BYTES = 1 << 16
+
+# key level atas -> tool; tambah entri di sini untuk format baru
+TOOL_SIGNATURES = {
+    "issues": "mythril",    # {"error": ..., "issues": [...], "success": ...}
+    "results": "slither",   # {"success": ..., "error": ..., "results": {"detectors": [...]}}
+}
+
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]:]')
+
+def _prefix(src, limit: int) -> str:
+    if isinstance(src, (bytes, bytearray, memoryview)):
+        data = bytes(memoryview(src)[:limit])
+        if codec_of(data):
+            with wrap_read(io.BytesIO(memoryview(src))) as f:
+                data = f.read(limit)
+    elif isinstance(src, (str, PathLike)):
+        with open_read(src) as f:
+            data = f.read(limit)
+    elif isinstance(src, io.TextIOBase):
+        pos = src.tell()
+        data = src.read(limit)
+        src.seek(pos)
+    else:
+        # file object binary: baca lalu kembalikan posisinya
+        pos = src.tell()
+        stream = wrap_read(src)
+        data = stream.read(limit)
+        if stream is not src:
+            stream.close()
+        src.seek(pos)
+    if isinstance(data, str):
+        return data
+    # prefix bisa memotong karakter multi-byte di ujung -> abaikan
+    return data.decode("utf-8", errors="ignore")
+
+def sniff_tool(src, limit: int = SNIFF_BYTES) -> str | None:
+    """
+    Tool penghasil report ``src`` (path, buffer bytes, atau file object
+    seekable), atau None kalau tidak dikenali dalam ``limit`` byte pertama.
+    """
+    text = _prefix(src, limit).lstrip("\ufeff \t\r\n")
+    if not text.startswith("{"):
+        return None
+    depth = 0
+    key = None
+    for m in _TOKEN.finditer(text):
+        tok = m.group(0)
+        if tok in "{[":
+            depth += 1
+        elif tok in "}]":
+            depth -= 1
+            if depth == 0:
+                return None
+        elif tok == ":":
+            if depth == 1 and key in TOOL_SIGNATURES:
+                return TOOL_SIGNATURES[key]
+        elif depth == 1:
+            key = tok[1:-1]
+            continue
+        key = None
+    return None
@@ -0,0 +1,159 @@
+"""
+Record temuan ringkas dari extract sampai export.
+
+``Finding`` memakai ``__slots__`` (tanpa dict per baris) dan nilai string
+yang berulang antar baris (network, status, severity, file, contract,
+title, timestamp, ...) di-intern saat normalisasi, jadi ribuan baris
+berbagi satu objek string. Remediation diambil apa adanya dari registry
+SWC -> satu string per SWC-ID yang direferensikan semua baris, bukan
+disalin. ``finding_id`` disimpan sebagai 16 byte digest mentah dan baru
+dijadikan hex saat dibaca.
+
+Finding tetap bisa diakses seperti dict (``get``, ``[]``, ``in``,
+``keys``, ``dict(f)``), jadi exporter, app, merge dan standardizer yang
+memakai akses dict tidak berubah, dan baris dict biasa (mis. dibaca ulang
+dari output lama oleh cache) boleh dicampur dengan Finding.
+"""
+from __future__ import annotations
+from collections.abc import Callable, Mapping, MutableMapping
+from operator import attrgetter
+
+# field output (urutan export) + "tool", lalu field mentah dari extractor
+# yang dibuang saat normalisasi
+FIELDS = (
+    "finding_id", "timestamp", "network", "contract", "file", "line_start", "line_end",
+    "swc_id", "title", "severity", "confidence", "status", "remediation", "commit_hash",
+    "tool",
+)
+RAW_FIELDS = ("description", "function")
+
+_NAMES = FIELDS + RAW_FIELDS
+_KEYS = frozenset(_NAMES)
+
+class Finding(MutableMapping):
+    """Satu temuan. Nilai ``None`` = field tidak diisi (tidak muncul di ``keys()``)."""
+    # "_id" = finding_id (bytes digest atau str apa adanya)
+    __slots__ = ("_id",) + _NAMES[1:]
+
+    def __init__(self, finding_id=None, timestamp=None, network=None, contract=None, file=None,
+                 line_start=None, line_end=None, swc_id=None, title=None, severity=None,
+                 confidence=None, status=None, remediation=None, commit_hash=None, tool=None,
+                 description=None, function=None):
+        self._id = finding_id
+        self.timestamp = timestamp
+        self.network = network
+        self.contract = contract
+        self.file = file
+        self.line_start = line_start
+        self.line_end = line_end
+        self.swc_id = swc_id
+        self.title = title
+        self.severity = severity
+        self.confidence = confidence
+        self.status = status
+        self.remediation = remediation
+        self.commit_hash = commit_hash
+        self.tool = tool
+        self.description = description
+        self.function = function
+
+    @property
+    def finding_id(self):
+        v = self._id
+        return v.hex() if type(v) is bytes else v
+
+    @finding_id.setter
+    def finding_id(self, value):
+        # bytes (mis. ``finding_digest``) = 49 byte per baris vs 81 untuk hex str
+        self._id = value
+
+    # --- akses ala dict
+    def get(self, key, default=None):
+        if key in _KEYS:
+            v = getattr(self, key)
+            if v is not None:
+                return v
+        return default
+
+    def __getitem__(self, key):
+        if key in _KEYS:
+            v = getattr(self, key)
+            if v is not None:
+                return v
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in _KEYS:
+            raise KeyError(f"field Finding tidak dikenal: {key}")
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in _KEYS:
+            raise KeyError(key)
+        setattr(self, key, None)
+
+    def __contains__(self, key):
+        return key in _KEYS and getattr(self, key) is not None
+
+    def __iter__(self):
+        return (k for k in _NAMES if getattr(self, k) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __eq__(self, other):
+        if isinstance(other, Finding):
+            return _ALL(self) == _ALL(other)
+        return dict(self) == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Finding({', '.join(f'{k}={v!r}' for k, v in self.items())})"
+
+    # pickle (process pool, cache Streamlit) sebagai tuple nilai slot, bukan
+    # dict per baris; string yang di-intern tetap dibagi dalam satu pickle (memo)
+    def __reduce__(self):
+        return _from_slots, (_SLOT_VALUES(self),)
+
+_ALL = attrgetter(*_NAMES)
+_SLOT_VALUES = attrgetter(*Finding.__slots__)
+
+def _from_slots(values: tuple) -> Finding:
+    f = Finding.__new__(Finding)
+    for k, v in zip(Finding.__slots__, values):
+        setattr(f, k, v)
+    return f
+
+def column(rows: list, key: str) -> list:
+    """Nilai ``key`` dari semua baris (``None`` kalau kosong / tidak ada), untuk exporter kolumnar."""
+    if key not in _KEYS:
+        return [r.get(key) for r in rows]
+    get = attrgetter(key)
+    return [get(r) if type(r) is Finding else r.get(key) for r in rows]
+
+def values_getter(fields) -> Callable[[Mapping], tuple]:
+    """
+    ``getter(row) -> tuple`` nilai ``fields`` (None / kosong -> "") untuk
+    Finding maupun dict; dipakai exporter di loop per baris.
+    """
+    fields = tuple(fields)
+    if len(fields) < 2 or not _KEYS.issuperset(fields):
+        return lambda r: tuple(r.get(k, "") for k in fields)
+    attrs = attrgetter(*fields)
+
+    def getter(r):
+        if type(r) is Finding:
+            vals = attrs(r)
+            return vals if None not in vals else tuple("" if v is None else v for v in vals)
+        return tuple(r.get(k, "") for k in fields)
+    return getter
+
+def dict_getter(fields) -> Callable[[Mapping], dict]:
+    """
+    ``getter(row) -> dict`` {field: nilai} (None / kosong -> "") untuk
+    Finding maupun dict; dipakai encoder NDJSON.
+    """
+    fields = tuple(fields)
+    values = values_getter(fields)
+    return lambda r: dict(zip(fields, values(r)))
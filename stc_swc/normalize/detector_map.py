@@ -0,0 +1,107 @@
+"""
+Mapping nama detector (Slither check / judul temuan) → SWC-ID.
+
+Urutan resolusi:
+1. exact match (hash lookup) pada nama detector yang sudah dinormalisasi,
+2. prefix fallback per segmen ``-`` (mis. ``reentrancy-foo`` → ``reentrancy``),
+3. satu regex gabungan (dikompilasi sekali) untuk mencari pola di judul bebas.
+
+Hasil di-memo per judul, jadi detector yang sama berulang cuma sekali resolve.
+"""
+from __future__ import annotations
+import re
+from functools import lru_cache
+
+# Slither detector → SWC (tanpa prefix "SWC-", sama seperti key registry)
+DETECTOR_SWC = {
+    # reentrancy
+    "reentrancy": "107",
+    "reentrancy-eth": "107",
+    "reentrancy-no-eth": "107",
+    "reentrancy-benign": "107",
+    "reentrancy-events": "107",
+    "reentrancy-unlimited-gas": "107",
+    # compiler / pragma
+    "solc-version": "103",
+    "pragma": "103",
+    # unchecked return value / low-level call
+    "low-level-calls": "104",
+    "unchecked-lowlevel": "104",
+    "unchecked-transfer": "104",
+    "unused-return": "104",
+    # ether withdrawal / selfdestruct
+    "arbitrary-send": "105",
+    "arbitrary-send-eth": "105",
+    "arbitrary-send-erc20": "105",
+    "arbitrary-send-erc20-permit": "105",
+    "suicidal": "106",
+    "unprotected-upgrade": "106",
+    # uninitialized storage
+    "uninitialized-storage": "109",
+    # deprecated
+    "deprecated-standards": "111",
+    # delegatecall
+    "controlled-delegatecall": "112",
+    "delegatecall-loop": "112",
+    # DoS
+    "unchecked-send": "113",
+    "calls-loop": "113",
+    # lain-lain
+    "tx-origin": "115",
+    "timestamp": "116",
+    "shadowing-state": "119",
+    "shadowing-abstract": "119",
+    "weak-prng": "120",
+    "controlled-array-length": "124",
+    "uninitialized-fptr-cst": "127",
+    "costly-loop": "128",
+    "rtlo": "130",
+    "unused-state": "131",
+    "incorrect-equality": "132",
+    "encode-packed-collision": "133",
+    "redundant-statements": "135",
+}
+
+# pola substring untuk judul bebas (mis. "Reentrancy in Bank.withdraw()")
+PATTERN_SWC = {
+    "reentrancy": "107",
+    "solc-version": "103",
+    "low-level-calls": "104",
+    "unchecked-send": "113",
+    "tx-origin": "115",
+    "tx.origin": "115",
+    "delegatecall": "112",
+    "selfdestruct": "106",
+}
+
+_PATTERNS = {**{k: v for k, v in DETECTOR_SWC.items() if "-" in k}, **PATTERN_SWC}
+
+@lru_cache(maxsize=None)
+def _pattern_re() -> re.Pattern:
+    # dikompilasi saat resolve pertama yang butuh pattern, bukan saat import;
+    # alternation terpanjang dulu supaya "reentrancy-eth" menang atas "reentrancy"
+    return re.compile("|".join(re.escape(k) for k in sorted(_PATTERNS, key=len, reverse=True)))
+
+def _norm(title: str) -> str:
+    return title.strip().lower().replace("_", "-")
+
+@lru_cache(maxsize=4096)
+def resolve_swc(title: str | None) -> str | None:
+    """Cari SWC-ID (mis. ``"107"``) untuk nama detector / judul; ``None`` kalau tidak dikenal."""
+    if not title:
+        return None
+    key = _norm(title)
+
+    swc = DETECTOR_SWC.get(key)
+    if swc:
+        return swc
+
+    head = key
+    while "-" in head:
+        head = head.rsplit("-", 1)[0]
+        swc = DETECTOR_SWC.get(head)
+        if swc:
+            return swc
+
+    m = _pattern_re().search(key)
+    return _PATTERNS[m.group()] if m else None
@@ -0,0 +1,40 @@
+"""
+Finding ID deterministik (content-addressed).
+
+Report yang sama dikonversi berkali-kali selalu menghasilkan ``finding_id``
+yang sama, jadi store downstream bisa upsert per key tanpa membandingkan
+semua kolom.
+"""
+from __future__ import annotations
+import hashlib
+
+_SEP = "\x1f"
+
+def _norm_text(s) -> str:
+    return " ".join(str(s or "").lower().split())
+
+def _norm_swc(s) -> str:
+    return str(s or "").upper().replace("SWC-", "").strip()
+
+def _norm_line(x) -> str:
+    try:
+        return str(int(float(x)))
+    except (TypeError, ValueError):
+        return "0"
+
+def finding_digest(tool: str, contract: str, file: str, swc_id, line_start, line_end, title: str) -> bytes:
+    """Hash 128-bit (16 byte mentah) atas identitas temuan."""
+    key = _SEP.join((
+        _norm_text(tool),
+        str(contract or "").strip(),
+        str(file or "").strip(),
+        _norm_swc(swc_id),
+        _norm_line(line_start),
+        _norm_line(line_end),
+        _norm_text(title),
+    ))
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+def finding_fingerprint(tool: str, contract: str, file: str, swc_id, line_start, line_end, title: str) -> str:
+    """Hash 128-bit (hex 32 char) atas identitas temuan."""
+    return finding_digest(tool, contract, file, swc_id, line_start, line_end, title).hex()
@@ -1,8 +1,17 @@
 from __future__ import annotations
-from uuid import uuid4
+import sys
+from collections.abc import Mapping
+from typing import Iterable, Iterator
 from datetime import datetime
 
+from stc_swc.finding import Finding
 from stc_swc.normalize.swc_registry import get_swc_meta
+from stc_swc.normalize.detector_map import resolve_swc
+from stc_swc.normalize.fingerprint import finding_digest
+
+def _intern(s):
+    # hanya str murni yang bisa di-intern (nilai aneh dari report dibiarkan)
+    return sys.intern(s) if type(s) is str else s
 
 _SEV_MAP = {"critical": "critical", "high": "high", "medium": "medium", "low": "low"}
 
@@ -12,12 +21,43 @@ def _norm_severity(s: str | None) -> str:
     s = str(s).strip().lower()
     return _SEV_MAP.get(s, s)
 
-def to_stc_schema(raw: dict, tool: str, timestamp_iso: str | None = None) -> dict:
+def _to_int(x):
+    try:
+        return int(x)
+    except Exception:
+        return 0
+
+def _from_mapping(raw: Mapping) -> Finding:
+    # dict dari sumber lain (app, test, kode lama); key asing diabaikan
+    g = raw.get
+    return Finding(
+        swc_id=g("swc_id"), title=g("title"), severity=g("severity"), remediation=g("remediation"),
+        line_start=g("line_start") or g("line"), line_end=g("line_end"),
+        contract=g("contract"), file=g("file"), network=g("network"),
+        confidence=g("confidence"), status=g("status"), commit_hash=g("commit_hash"),
+    )
+
+def to_stc_schema(raw: Mapping, tool: str, timestamp_iso: str | None = None,
+                  ints: dict | None = None) -> Finding:
+    """
+    Normalisasi satu temuan mentah. ``Finding`` dari extractor diisi ulang
+    in-place (tanpa alokasi record baru); dict biasa -> ``Finding`` baru.
+    String yang berulang antar baris di-intern, remediation = string
+    registry milik SWC-ID tsb (dibagi semua baris, tidak disalin).
+    ``ints`` = tabel intern nomor baris milik satu konversi (lihat
+    ``iter_stc_schema``); nomor baris > 256 tidak di-cache Python.
+    """
+    f = raw if type(raw) is Finding else _from_mapping(raw)
+
     # ambil nilai awal dari parser
-    swc_id      = (raw.get("swc_id") or "").strip()
-    title       = (raw.get("title") or "").strip()
-    severity    = _norm_severity(raw.get("severity"))
-    remediation = (raw.get("remediation") or "").strip()
+    swc_id      = (f.swc_id or "").strip()
+    title       = (f.title or "").strip()
+    severity    = _norm_severity(f.severity)
+    remediation = (f.remediation or "").strip()
+
+    # Slither tidak memberi SWC-ID -> resolve dari nama detector
+    if not swc_id:
+        swc_id = resolve_swc(title) or ""
 
     # enrich dari registry kalau ada SWC-ID
     if swc_id:
@@ -32,31 +72,40 @@ def to_stc_schema(raw: dict, tool: str, timestamp_iso: str | None = None) -> dic
 
     # timestamp & line fallback
     ts = timestamp_iso or datetime.utcnow().isoformat(timespec="seconds")
-    line_start = raw.get("line_start") or raw.get("line") or 0
-    line_end   = raw.get("line_end") or line_start
-
-    def _to_int(x):
-        try:
-            return int(x)
-        except Exception:
-            return 0
-
-    return {
-        "finding_id": str(uuid4()),
-        "timestamp": ts,
-        "network":   raw.get("network") or "ethereum",
-        "contract":  raw.get("contract") or "",
-        "file":      raw.get("file") or "",
-        "line_start": _to_int(line_start),
-        "line_end":   _to_int(line_end),
-        "swc_id":     swc_id,
-        "title":      title,          # <- hasil enrich
-        "severity":   severity,       # <- hasil enrich
-        "confidence": raw.get("confidence") or "medium",
-        "status":     raw.get("status") or "unresolved",
-        "remediation": remediation,   # <- hasil enrich
-        "commit_hash": raw.get("commit_hash") or "",
-    }
-
-def to_stc_schema_batch(raw_list: list[dict], tool: str, timestamp_iso: str | None = None) -> list[dict]:
-    return [to_stc_schema(r, tool=tool, timestamp_iso=timestamp_iso) for r in raw_list]
+    line_start = _to_int(f.line_start or 0)
+    line_end   = _to_int(f.line_end or line_start)
+    if ints is not None:
+        line_start = ints.setdefault(line_start, line_start)
+        line_end   = ints.setdefault(line_end, line_end)
+    contract   = _intern(f.contract or "")
+    file_path  = _intern(f.file or "")
+
+    # deterministik: report yang sama -> id yang sama
+    f.finding_id  = finding_digest(tool, contract, file_path, swc_id, line_start, line_end, title)
+    f.timestamp   = _intern(ts)
+    f.network     = _intern(f.network or "ethereum")
+    f.contract    = contract
+    f.file        = file_path
+    f.line_start  = line_start
+    f.line_end    = line_end
+    f.swc_id      = sys.intern(swc_id)
+    f.title       = sys.intern(title)          # <- hasil enrich
+    f.severity    = sys.intern(severity)       # <- hasil enrich
+    f.confidence  = f.confidence or "medium"
+    f.status      = _intern(f.status or "unresolved")
+    f.remediation = sys.intern(remediation)    # <- hasil enrich
+    f.commit_hash = _intern(f.commit_hash or "")
+    f.tool        = _intern(tool)              # tidak ikut diexport; dipakai merge lintas tool
+    # field mentah extractor tidak ikut output
+    f.description = f.function = None
+    return f
+
+def iter_stc_schema(raw_iter: Iterable[Mapping], tool: str, timestamp_iso: str | None = None) -> Iterator[Finding]:
+    # tabel intern hidup selama satu report saja: proses long-running
+    # (serve / watch) tidak menumpuk int dari semua report yang pernah lewat
+    ints: dict[int, int] = {}
+    for r in raw_iter:
+        yield to_stc_schema(r, tool=tool, timestamp_iso=timestamp_iso, ints=ints)
+
+def to_stc_schema_batch(raw_list: Iterable[Mapping], tool: str, timestamp_iso: str | None = None) -> list[Finding]:
+    return list(iter_stc_schema(raw_list, tool=tool, timestamp_iso=timestamp_iso))
@@ -0,0 +1,149 @@
+"""
+Merge temuan lintas tool (mis. Mythril + Slither pada kontrak yang sama).
+
+Temuan dikelompokkan per (file, contract, swc_id), lalu range baris
+``line_start``..``line_end`` di tiap kelompok di-sort-and-sweep: range yang
+overlap digabung jadi satu record yang mencatat semua tool penyumbangnya.
+Satu cluster berisi paling banyak satu temuan per tool; dua temuan dari
+tool yang sama tidak pernah digabung. Kompleksitas O(n log n), tanpa
+perbandingan berpasangan antar semua baris.
+
+Tool melaporkan path dengan basis berbeda (Mythril ``SimpleBank.sol``,
+Slither ``contracts/SimpleBank.sol``). Path yang merupakan suffix
+komponen dari tepat satu path lain dengan basename sama dianggap file
+itu; kalau ambigu (``a/Token.sol`` vs ``b/Token.sol``) path dibiarkan
+berbeda.
+
+Dipakai lewat ``cli.py --merge``; kolom ``MERGE_FIELDS`` ikut diekspor.
+"""
+from __future__ import annotations
+import posixpath
+from typing import Iterable
+
+from stc_swc.normalize.fingerprint import finding_fingerprint
+
+_SEV_RANK = {"critical": 4, "high": 3, "medium": 2, "low": 1}
+
+# kolom tambahan hasil merge (string, dipisah ";") di luar schema export biasa
+MERGE_FIELDS = ("tools", "merged_ids")
+SEP = ";"
+
+def _file_key(path: str) -> str:
+    # path relatif yang dinormalisasi ("./contracts\\A.sol" == "contracts/A.sol")
+    p = str(path or "").replace("\\", "/")
+    return posixpath.normpath(p).lower().lstrip("/") if p else ""
+
+def _resolve_suffixes(keys) -> dict[str, str]:
+    """
+    Petakan file key ke path terpanjang yang berakhiran key itu (per
+    komponen), kalau path terpanjangnya unik; selain itu key ke dirinya sendiri.
+    """
+    by_name: dict[str, list[str]] = {}
+    for k in keys:
+        by_name.setdefault(posixpath.basename(k), []).append(k)
+    out = {}
+    for same in by_name.values():
+        for k in same:
+            longer = {o for o in same if o != k and o.endswith("/" + k)}
+            # hanya yang paling panjang (tidak punya path lain yang berakhiran dia)
+            tops = {o for o in longer if not any(x != o and x.endswith("/" + o) for x in longer)}
+            out[k] = tops.pop() if len(tops) == 1 else k
+    return out
+
+def _swc_key(swc_id) -> str:
+    return str(swc_id or "").upper().replace("SWC-", "").strip()
+
+def _to_int(x) -> int:
+    try:
+        return int(x)
+    except (TypeError, ValueError):
+        return 0
+
+def _conf(x) -> float:
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return 0.0
+
+def _primary(members: list[dict]) -> dict:
+    # wakil cluster: severity tertinggi, lalu confidence tertinggi
+    return max(members, key=lambda r: (_SEV_RANK.get(str(r.get("severity") or "").lower(), 0),
+                                       _conf(r.get("confidence"))))
+
+def _collapse(members: list[dict]) -> dict:
+    if len(members) == 1:
+        r = dict(members[0])
+        tool = r.get("tool") or ""
+        r["tools"] = tool
+        r["merged_ids"] = r.get("finding_id", "")
+        return r
+
+    head = _primary(members)
+    tools = sorted({m.get("tool") or "" for m in members} - {""})
+    line_start = min(_to_int(m.get("line_start")) for m in members)
+    line_end = max(max(_to_int(m.get("line_end")), _to_int(m.get("line_start"))) for m in members)
+
+    out = dict(head)
+    out.update({
+        "finding_id": finding_fingerprint("+".join(tools), head.get("contract"), head.get("file"),
+                                          head.get("swc_id"), line_start, line_end, head.get("title")),
+        "line_start": line_start,
+        "line_end": line_end,
+        "tool": "+".join(tools),
+        "tools": SEP.join(tools),
+        "merged_ids": SEP.join(m.get("finding_id", "") for m in members),
+        "remediation": next((m.get("remediation") for m in members if m.get("remediation")), ""),
+    })
+    return out
+
+def merge_findings(rows: Iterable[dict]) -> list[dict]:
+    """
+    Gabungkan temuan dari tool berbeda yang SWC-nya sama dan range
+    barisnya overlap di (file, contract) yang sama. Temuan tanpa SWC-ID
+    atau tanpa lokasi (line_start <= 0) dibiarkan apa adanya. Urutan
+    output mengikuti kemunculan pertama tiap cluster di input. Tiap baris
+    output membawa ``tools`` dan ``merged_ids`` (dipisah ``SEP``).
+    """
+    rows = list(rows)
+    singles = []
+    located = []
+
+    for idx, r in enumerate(rows):
+        swc = _swc_key(r.get("swc_id"))
+        start = _to_int(r.get("line_start"))
+        if not swc or start <= 0:
+            singles.append(idx)
+            continue
+        end = max(start, _to_int(r.get("line_end")))
+        located.append((_file_key(r.get("file")), r.get("contract") or "", swc, start, end, idx))
+
+    files = _resolve_suffixes({loc[0] for loc in located})
+    groups: dict[tuple, list[tuple[int, int, int]]] = {}
+    for file_key, contract, swc, start, end, idx in located:
+        groups.setdefault((files[file_key], contract, swc), []).append((start, end, idx))
+
+    clusters: list[list[int]] = [[i] for i in singles]
+    for intervals in groups.values():
+        intervals.sort()
+        # cluster yang masih terbuka: [end, tools, anggota]
+        open_: list[list] = []
+        for start, end, idx in intervals:
+            tool = rows[idx].get("tool") or ""
+            still = []
+            for c in open_:
+                if c[0] < start:
+                    clusters.append(c[2])
+                else:
+                    still.append(c)
+            open_ = still
+            c = next((c for c in open_ if tool not in c[1]), None)
+            if c is None:
+                open_.append([end, {tool}, [idx]])
+            else:
+                c[0] = max(c[0], end)
+                c[1].add(tool)
+                c[2].append(idx)
+        clusters.extend(c[2] for c in open_)
+
+    clusters.sort(key=min)
+    return [_collapse([rows[i] for i in sorted(c)]) for c in clusters]
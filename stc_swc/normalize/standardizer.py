@@ -1,8 +1,12 @@
 # tools_scan.py  — SWC standardizer
+from __future__ import annotations
 import json, os, hashlib, subprocess, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
-import pandas as pd
+
+from stc_swc.normalize.detector_map import resolve_swc
+from stc_swc.normalize.fingerprint import finding_fingerprint
 
 SEV_MAP = {
     "crit": "critical", "critical": "critical",
@@ -45,9 +49,6 @@ def coerce_float(x) -> Optional[float]:
     except Exception:
         return None
 
-def fallback_finding_id(contract: str, swc_id: str, line_start: Optional[int]) -> str:
-    return f"{contract}::{swc_id}::{line_start or 0}"
-
 def load_kb(kb_path: str = "swc_kb.json") -> Dict[str, Dict[str, Any]]:
     try:
         with open(kb_path, "r", encoding="utf-8") as f:
@@ -69,7 +70,7 @@ def parse_slither(slither_json: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
     """Keluarkan dict minimal: swc_id, title, severity, confidence, file, line_start, line_end."""
     # Slither JSON shape bisa bervariasi; kita ambil path aman
     for f in slither_json.get("results", {}).get("detectors", []):
-        swc_id = str(f.get("check", "")).replace("SWC-", "").strip()
+        swc_id = resolve_swc(f.get("check"))
         sev = f.get("impact") or f.get("severity")
         title = f.get("description") or f.get("check") or f.get("name") or ""
         conf = f.get("confidence")  # kadang tidak ada
@@ -117,62 +118,118 @@ def parse_mythril(myth_json: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
 # Standardizer
 # -----------------------------
 
+STD_COLUMNS = ["finding_id","timestamp","network","contract","file",
+               "line_start","line_end","swc_id","title","severity",
+               "confidence","status","remediation","commit_hash"]
+
+# numpy/pandas (~ratusan ms) baru diimport saat DataFrame benar-benar dibangun
+def _np_pd():
+    import numpy as np
+    import pandas as pd
+    return np, pd
+
+@lru_cache(maxsize=None)
+def _severity_dtype():
+    _, pd = _np_pd()
+    return pd.CategoricalDtype(["low", "medium", "high", "critical"], ordered=True)
+
+def __getattr__(name):
+    # SEVERITY_DTYPE tetap bisa diimport dari modul ini tanpa memuat pandas di awal
+    if name == "SEVERITY_DTYPE":
+        return _severity_dtype()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _map_unique(values: list, fn) -> pd.Categorical:
+    """Terapkan ``fn`` sekali per nilai unik (bukan per baris) -> Categorical."""
+    _, pd = _np_pd()
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    mapped = [fn(u) for u in uniques]
+    out = pd.Series(mapped + [fn(None)], dtype=object).to_numpy()
+    # code -1 (None/NaN) -> slot terakhir = fn(None)
+    return pd.Categorical(out[codes])
+
+def kb_frame(kb: Dict[str, Dict[str, Any]]) -> pd.Series:
+    """KB dict -> Series remediation ber-index swc key, siap di-join."""
+    _, pd = _np_pd()
+    return pd.Series(
+        {k: (v or {}).get("remediation") or (v or {}).get("explanation") or None for k, v in kb.items()},
+        dtype=object,
+    )
+
+def _norm_swc(x) -> str:
+    return str(x or "").replace("SWC-", "").strip()
+
 def to_standard_df(records: Iterable[Dict[str, Any]],
                    network: str,
                    contract: str,
                    commit_hash: Optional[str],
-                   kb_path: str = "swc_kb.json") -> pd.DataFrame:
-    kb = load_kb(kb_path)
-    ts = now_utc_iso()
-    rows = []
+                   kb_path: str = "swc_kb.json",
+                   *, tool: str) -> pd.DataFrame:
+    """
+    ``tool`` wajib: ikut di-hash ke ``finding_id``, jadi harus sama dengan
+    tool yang dipakai ``mapper.to_stc_schema`` supaya ID keduanya cocok.
+    """
+    np, pd = _np_pd()
+    kb = kb_frame(load_kb(kb_path))
+    ts = pd.Timestamp(now_utc_iso())
+    commit = get_commit_hash(commit_hash)  # sekali per call, bukan per temuan
+
+    # kumpulkan kolom mentah dalam satu lintasan
+    swc_raw, title_raw, sev_raw, conf_raw, file_raw, ls_raw, le_raw = [], [], [], [], [], [], []
     for r in records:
-        swc_id = (str(r.get("swc_id", "")).replace("SWC-", "").strip()) or None
-        severity = norm_severity(r.get("severity"))
-        confidence = coerce_float(r.get("confidence"))
-        file_rel = r.get("file") or ""
-        rows.append({
-            "finding_id": "",
-            "timestamp": ts,
-            "network": str(network or "").lower(),
-            "contract": contract or "",
-            "file": file_rel,
-            "line_start": coerce_int(r.get("line_start")),
-            "line_end":   coerce_int(r.get("line_end")),
-            "swc_id": swc_id,
-            "title": (r.get("title") or (f"SWC-{swc_id} finding" if swc_id else "SWC finding")).strip(),
-            "severity": severity,
-            "confidence": confidence,
-            "status": "unresolved",
-            "remediation": None,  # isi dari KB di bawah
-            "commit_hash": get_commit_hash(commit_hash),
-        })
-    df = pd.DataFrame(rows)
-
-    # finding_id fallback
-    df["finding_id"] = df.apply(lambda x: fallback_finding_id(x["contract"], x["swc_id"] or "", x["line_start"])
-                                if not x.get("finding_id") else x["finding_id"], axis=1)
-
-    # remediation dari KB jika ada
-    if not df.empty:
-        def kb_text(x):
-            k = (x or "").replace("SWC-", "")
-            info = kb.get(k or "", {})
-            return info.get("remediation") or info.get("explanation") or None
-        df["remediation"] = df["swc_id"].map(kb_text)
-
-    # tipe kolom bersih
-    df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
-    df["severity"]  = df["severity"].astype("string")
-    df["title"]     = df["title"].astype("string")
-    df["status"]    = df["status"].astype("string")
-    for c in ["finding_id","network","contract","file","swc_id","remediation","commit_hash"]:
-        df[c] = df[c].fillna("").astype("string")
-    df["confidence"] = pd.to_numeric(df["confidence"], errors="coerce")
-    df["line_start"] = pd.to_numeric(df["line_start"], errors="coerce").astype("Int64")
-    df["line_end"]   = pd.to_numeric(df["line_end"],   errors="coerce").astype("Int64")
-
-    # urutan final
-    cols = ["finding_id","timestamp","network","contract","file",
-            "line_start","line_end","swc_id","title","severity",
-            "confidence","status","remediation","commit_hash"]
-    return df[cols]
+        # sama seperti mapper: tanpa SWC-ID -> resolve dari nama detector
+        swc_raw.append(r.get("swc_id") or resolve_swc(r.get("title")))
+        title_raw.append(r.get("title"))
+        sev_raw.append(r.get("severity"))
+        conf_raw.append(r.get("confidence"))
+        file_raw.append(r.get("file"))
+        ls_raw.append(r.get("line_start"))
+        le_raw.append(r.get("line_end"))
+    n = len(swc_raw)
+
+    swc = _map_unique(swc_raw, _norm_swc)
+    severity = _map_unique(sev_raw, norm_severity).astype(_severity_dtype())
+
+    def _ints(vals):
+        v = pd.to_numeric(pd.Series(vals, dtype=object), errors="coerce")
+        return pd.Series(np.trunc(v.to_numpy(dtype="float64")), dtype="float64").astype("Int64")
+
+    line_start = _ints(ls_raw)
+    line_end = _ints(le_raw).fillna(line_start)
+
+    swc_s = pd.Series(swc, dtype="string")
+    title = pd.Series(title_raw, dtype=object).fillna("").astype("string").str.strip()
+    no_title = title == ""
+    if no_title.any():
+        has_swc = swc_s != ""
+        title = title.mask(no_title & has_swc, "SWC-" + swc_s + " finding")
+        title = title.mask(no_title & ~has_swc, "SWC finding")
+
+    contract = contract or ""
+    finding_id = pd.Series(
+        [finding_fingerprint(tool, contract, f, s, a, b, t)
+         for f, s, a, b, t in zip(file_raw, swc_s.tolist(), line_start.tolist(), line_end.tolist(), title.tolist())],
+        dtype="string",
+    )
+
+    # remediation: join per kategori SWC ke KB, lalu sebar via codes
+    rem_by_cat = kb.reindex(swc.categories).to_numpy() if len(kb) else np.full(len(swc.categories), None, dtype=object)
+    rem_values = np.append(rem_by_cat, None)[swc.codes]
+
+    df = pd.DataFrame({
+        "finding_id": finding_id,
+        "timestamp": pd.Series([ts] * n, dtype="datetime64[ns]") if n else pd.Series([], dtype="datetime64[ns]"),
+        "network": pd.Categorical([str(network or "").lower()] * n),
+        "contract": pd.Series([contract] * n, dtype="string"),
+        "file": pd.Series(file_raw, dtype=object).fillna("").astype("string"),
+        "line_start": line_start,
+        "line_end": line_end,
+        "swc_id": swc,
+        "title": title,
+        "severity": severity,
+        "confidence": pd.to_numeric(pd.Series(conf_raw, dtype=object), errors="coerce").astype("float64"),
+        "status": pd.Categorical(["unresolved"] * n),
+        "remediation": pd.Series(rem_values, dtype=object).fillna("").astype("string"),
+        "commit_hash": pd.Series([commit] * n, dtype="string"),
+    })
+    return df[STD_COLUMNS]
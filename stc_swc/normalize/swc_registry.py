@@ -1,13 +1,32 @@
 from pathlib import Path
+import hashlib
 import json
+from stc_swc import stats
 _REGISTRY = None
+_PATH = Path(__file__).parent / "swc_registry_full.json"
+_DIGEST = {}  # (size, mtime_ns) -> digest; registry_version() tidak hash ulang tiap call
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
 def _load():
     global _REGISTRY
     if _REGISTRY is not None: return
-    p = Path(__file__).parent / "swc_registry_full.json"
-    _REGISTRY = json.loads(p.read_text(encoding="utf-8")) if p.exists() else {}
+    p = _PATH
+    _REGISTRY = json.loads(p.read_bytes()) if p.exists() else {}
 def get_swc_meta(swc_id: str):
     _load()
     if not swc_id: return None
     key = str(swc_id).replace("SWC-","")
-    return _REGISTRY.get(key)
+    meta = _REGISTRY.get(key)
+    stats.count("registry.hit" if meta is not None else "registry.miss")
+    return meta
+def registry_version() -> str:
+    """Digest isi swc_registry_full.json (berubah kalau registry di-refresh)."""
+    try:
+        st = _PATH.stat()
+    except FileNotFoundError:
+        return ""
+    key = (st.st_size, st.st_mtime_ns)
+    if key not in _DIGEST:
+        _DIGEST.clear()
+        _DIGEST[key] = _digest(_PATH.read_bytes())
+    return _DIGEST[key]
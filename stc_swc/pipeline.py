@@ -0,0 +1,98 @@
+"""
+Pipeline streaming: parse → normalize → export dalam satu lintasan.
+
+Baris hasil normalisasi dikumpulkan per batch kecil lalu dikirim ke setiap
+writer (CSV, NDJSON, ...) lewat queue ber-batas. Tiap writer jalan di
+thread sendiri, jadi penulisan file overlap dengan parsing dan memori
+puncak hanya O(batch_size * max_pending), bukan O(report).
+
+Kalau producer (parse / normalize) gagal, iterator baris di setiap sink
+ikut raise ``Aborted`` alih-alih berakhir normal, jadi writer tidak
+menyelesaikan output setengah jadi (file sementara tidak di-rename,
+dataset partisi tidak di-swap, transaksi SQLite di-rollback).
+"""
+from __future__ import annotations
+import queue
+import threading
+from typing import Callable, Iterable, Iterator
+
+from stc_swc.normalize.mapper import iter_stc_schema
+
+BATCH_SIZE = 1000
+MAX_PENDING = 8
+
+_DONE = object()
+_ABORT = object()
+
+class Aborted(Exception):
+    """Producer ``fan_out`` gagal; sink harus membuang hasilnya."""
+
+Sink = Callable[[Iterable[dict]], object]
+
+def _drain(q: queue.Queue) -> Iterator[dict]:
+    while True:
+        batch = q.get()
+        if batch is _DONE:
+            return
+        if batch is _ABORT:
+            raise Aborted("producer gagal, output dibatalkan")
+        yield from batch
+
+def _run_sink(sink: Sink, q: queue.Queue, errors: list):
+    rows = _drain(q)
+    try:
+        sink(rows)
+    except BaseException as e:
+        errors.append(e)
+    # kalau sink berhenti lebih awal, buang sisa batch supaya producer
+    # tidak pernah nyangkut di q.put()
+    try:
+        for _ in rows:
+            pass
+    except Aborted:
+        pass
+
+def fan_out(rows: Iterable[dict], sinks: list[Sink],
+            batch_size: int = BATCH_SIZE, max_pending: int = MAX_PENDING) -> int:
+    """
+    Kirim ``rows`` ke semua ``sinks`` sekaligus; tiap sink adalah callable
+    yang menerima iterable baris (mis. ``lambda rs: write_csv(rs, path)``).
+    Return jumlah baris.
+    """
+    queues = [queue.Queue(maxsize=max_pending) for _ in sinks]
+    errors: list[BaseException] = []
+    threads = [threading.Thread(target=_run_sink, args=(s, q, errors), daemon=True)
+               for s, q in zip(sinks, queues)]
+    for t in threads:
+        t.start()
+
+    n = 0
+    batch = []
+    end = _ABORT
+    try:
+        for r in rows:
+            batch.append(r)
+            if len(batch) >= batch_size:
+                for q in queues:
+                    q.put(batch)
+                n += len(batch)
+                batch = []
+        if batch:
+            for q in queues:
+                q.put(batch)
+            n += len(batch)
+        end = _DONE
+    finally:
+        for q in queues:
+            q.put(end)
+        for t in threads:
+            t.join()
+
+    if errors:
+        raise errors[0]
+    return n
+
+def run_pipeline(raw_findings: Iterable[dict], tool: str, sinks: list[Sink],
+                 timestamp_iso: str | None = None, **kw) -> int:
+    """Normalisasi ``raw_findings`` (boleh generator dari ``iter_report``) dan stream ke ``sinks``."""
+    return fan_out(iter_stc_schema(raw_findings, tool=tool, timestamp_iso=timestamp_iso), sinks, **kw)
@@ -0,0 +1,47 @@
+"""
+Backend JSON yang bisa diganti: orjson kalau terinstall, fallback stdlib.
+
+Dipakai extractor (decode report) dan exporter (encode NDJSON). Kedua
+backend menghasilkan JSON compact UTF-8 tanpa escape non-ASCII.
+"""
+from __future__ import annotations
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - tergantung environment
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+def loads(data: str | bytes | memoryview):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # orjson menolak integer > 64-bit dsb; stdlib lebih longgar
+            # (dan memberi pesan error standar kalau memang rusak)
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+def dumps(obj) -> bytes:
+    """Encode ``obj`` ke bytes JSON compact."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return _ENCODER.encode(obj).encode("utf-8")
+
+def dumps_line(obj) -> bytes:
+    """Seperti ``dumps`` tapi diakhiri newline (satu baris NDJSON)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return (_ENCODER.encode(obj) + "\n").encode("utf-8")
@@ -0,0 +1,296 @@
+"""
+Layanan HTTP lokal (asyncio, tanpa dependensi tambahan) untuk konversi
+report dari kode lain.
+
+  GET  /healthz                     -> {"status": "ok", ...}
+  POST /convert?tool=auto&timestamp=ISO
+       body = report Mythril / Slither (JSON, boleh gzip / zstd)
+       -> 200 application/x-ndjson, di-stream chunked per ~64 KB
+
+Parse + normalize jalan di thread pool; baris NDJSON dikirim ke client
+begitu dihasilkan lewat queue ber-batas, jadi client yang lambat menahan
+producer, bukan menumpuk di memory. Jumlah konversi paralel dan ukuran
+body dibatasi (503 / 413). Error sebelum baris pertama -> status 4xx/5xx
+dengan body JSON; error di tengah stream -> koneksi ditutup tanpa chunk
+penutup, jadi client melihat respons tidak lengkap.
+
+  python -m stc_swc.serve --port 8765
+  curl --data-binary @report.json "http://127.0.0.1:8765/convert?tool=auto"
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from stc_swc.batch import AUTO, PARSERS, parser, resolve_tool
+from stc_swc.version import __version__
+
+HOST = "127.0.0.1"
+PORT = 8765
+MAX_CONCURRENT = 4
+MAX_BODY = 64 << 20
+MAX_HEADER = 16 << 10
+READ_TIMEOUT = 30.0
+LINGER_TIMEOUT = 5.0
+CHUNK_BYTES = 64 << 10
+MAX_PENDING = 8   # chunk yang boleh menunggu dikirim per request
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            408: "Request Timeout", 411: "Length Required", 413: "Payload Too Large",
+            431: "Request Header Fields Too Large", 500: "Internal Server Error",
+            503: "Service Unavailable"}
+
+class _Cancelled(Exception):
+    pass
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str, headers: dict | None = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+def _head(status: int, headers: dict) -> bytes:
+    lines = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}"]
+    lines += [f"{k}: {v}" for k, v in {**headers, "Connection": "close"}.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+async def _send_json(writer, status: int, obj, headers: dict | None = None):
+    body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    writer.write(_head(status, {**(headers or {}), "Content-Type": "application/json",
+                                "Content-Length": len(body)}) + body)
+    await writer.drain()
+
+def _produce(data, tool: str, timestamp_iso: str | None, put, cancelled: threading.Event):
+    """Jalan di thread pool: normalize + encode NDJSON, kirim per ~CHUNK_BYTES."""
+    from stc_swc.export.ndjson_exporter import FIELDS_FULL
+    from stc_swc.normalize.mapper import iter_stc_schema
+    from stc_swc.finding import dict_getter
+    from stc_swc.serializer import dumps_line
+
+    as_dict = dict_getter(FIELDS_FULL)
+    buf, size = [], 0
+    for row in iter_stc_schema(parser(tool)(data), tool=tool, timestamp_iso=timestamp_iso):
+        line = dumps_line(as_dict(row))
+        buf.append(line)
+        size += len(line)
+        if size >= CHUNK_BYTES:
+            put(b"".join(buf))
+            buf, size = [], 0
+        if cancelled.is_set():
+            raise _Cancelled()
+    if buf:
+        put(b"".join(buf))
+
+class Server:
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT, max_body: int = MAX_BODY,
+                 read_timeout: float = READ_TIMEOUT):
+        self.max_concurrent = max_concurrent
+        self.max_body = max_body
+        self.read_timeout = read_timeout
+        self.active = 0
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="stc-convert")
+
+    async def start(self, host: str = HOST, port: int = PORT) -> asyncio.Server:
+        """Mulai listen; ``port=0`` = port bebas (lihat ``server.sockets[0].getsockname()``)."""
+        from stc_swc.normalize.swc_registry import get_swc_meta
+        get_swc_meta("103")   # registry dimuat sekali di awal, bukan di request pertama
+        return await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER)
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            await self._dispatch(reader, writer)
+        except HttpError as e:
+            try:
+                await _send_json(writer, e.status, {"error": str(e)}, e.headers)
+                await self._linger(reader, writer)
+            except ConnectionError:
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _linger(self, reader, writer):
+        # body yang belum dibaca (413 / 503) dibuang dulu sebelum close; kalau
+        # langsung close, kernel mengirim RST dan client kehilangan respons error
+        if writer.can_write_eof():
+            writer.write_eof()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + LINGER_TIMEOUT
+        left = self.max_body
+        try:
+            while left > 0:
+                chunk = await asyncio.wait_for(reader.read(min(left, 1 << 16)), deadline - loop.time())
+                if not chunk:
+                    break
+                left -= len(chunk)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _read_head(self, reader):
+        try:
+            raw = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.read_timeout)
+        except asyncio.LimitOverrunError:
+            raise HttpError(431, "header terlalu besar")
+        except asyncio.TimeoutError:
+            raise HttpError(408, "timeout membaca request")
+        lines = raw.decode("latin-1").split("\r\n")
+        try:
+            method, target, _ = lines[0].split(" ", 2)
+        except ValueError:
+            raise HttpError(400, "request line tidak valid")
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                k, v = line.split(":", 1)
+                headers[k.strip().lower()] = v.strip()
+        return method.upper(), urlsplit(target), headers
+
+    async def _dispatch(self, reader, writer):
+        method, url, headers = await self._read_head(reader)
+        if url.path == "/healthz":
+            if method != "GET":
+                raise HttpError(405, "pakai GET", {"Allow": "GET"})
+            from stc_swc.normalize.swc_registry import registry_version
+            return await _send_json(writer, 200, {
+                "status": "ok", "version": __version__, "registry_version": registry_version(),
+                "active": self.active, "max_concurrent": self.max_concurrent,
+            })
+        if url.path != "/convert":
+            raise HttpError(404, f"tidak ada endpoint {url.path}")
+        if method != "POST":
+            raise HttpError(405, "pakai POST", {"Allow": "POST"})
+
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        tool = query.get("tool", AUTO)
+        if tool != AUTO and tool not in PARSERS:
+            raise HttpError(400, f"tool tidak dikenal: {tool!r}")
+        if "content-length" not in headers:
+            raise HttpError(411, "Content-Length wajib (body chunked tidak didukung)")
+        try:
+            length = int(headers["content-length"])
+        except ValueError:
+            raise HttpError(400, "Content-Length tidak valid")
+        if length > self.max_body:
+            raise HttpError(413, f"body maksimal {self.max_body} bytes")
+        # ditolak sebelum body dibaca: konversi paralel sudah penuh
+        if self.active >= self.max_concurrent:
+            raise HttpError(503, "server sibuk, coba lagi", {"Retry-After": "1"})
+
+        self.active += 1
+        try:
+            if headers.get("expect", "").lower() == "100-continue":
+                writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                await writer.drain()
+            try:
+                data = await asyncio.wait_for(reader.readexactly(length), self.read_timeout)
+            except asyncio.TimeoutError:
+                raise HttpError(408, "timeout membaca body")
+            try:
+                tool = resolve_tool(data, tool)
+            except ValueError as e:
+                raise HttpError(400, str(e))
+            await self._stream(writer, data, tool, query.get("timestamp") or None)
+        finally:
+            self.active -= 1
+
+    async def _stream(self, writer, data, tool, timestamp_iso):
+        loop = asyncio.get_running_loop()
+        q: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING)
+        cancelled = threading.Event()
+
+        def put(chunk):
+            # blok di thread producer sampai ada slot -> backpressure ke parser
+            asyncio.run_coroutine_threadsafe(q.put(chunk), loop).result()
+            if cancelled.is_set():
+                raise _Cancelled()
+
+        def work():
+            try:
+                _produce(data, tool, timestamp_iso, put, cancelled)
+            finally:
+                # None = selesai (sukses / error); error diambil dari ``job``
+                if not cancelled.is_set():
+                    asyncio.run_coroutine_threadsafe(q.put(None), loop).result()
+
+        def cancel():
+            # hentikan producer & kosongkan queue supaya put() yang sedang blok lanjut lalu berhenti
+            cancelled.set()
+            while not q.empty():
+                q.get_nowait()
+
+        job = loop.run_in_executor(self.executor, work)
+        # _Cancelled dari producer yang dihentikan bukan error; ambil supaya tidak di-log asyncio
+        job.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        async def next_chunk():
+            chunk = await q.get()
+            if chunk is None:
+                await job   # raise error producer (kalau ada)
+            return chunk
+
+        try:
+            first = await next_chunk()
+        except _Cancelled:
+            return
+        except Exception as e:
+            raise HttpError(400, f"{type(e).__name__}: {e}")
+
+        writer.write(_head(200, {"Content-Type": "application/x-ndjson",
+                                 "Transfer-Encoding": "chunked", "X-STC-Tool": tool}))
+        try:
+            chunk = first
+            while chunk is not None:
+                writer.write(b"%x\r\n%b\r\n" % (len(chunk), chunk))
+                await writer.drain()
+                chunk = await next_chunk()
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            cancel()
+            raise
+        except Exception:
+            # error di tengah stream: status 200 sudah terkirim -> tutup koneksi
+            # tanpa chunk penutup supaya client tahu responsnya tidak lengkap
+            cancel()
+
+async def serve(host: str = HOST, port: int = PORT, **limits):
+    srv = Server(**limits)
+    server = await srv.start(host, port)
+    addr = server.sockets[0].getsockname()
+    print(f"[serve] listen di http://{addr[0]}:{addr[1]} (maks {srv.max_concurrent} konversi paralel, "
+          f"body ≤ {srv.max_body >> 20} MB)", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        srv.close()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m stc_swc.serve",
+                                 description="HTTP lokal: POST report -> stream NDJSON ter-normalisasi")
+    ap.add_argument("--host", default=HOST)
+    ap.add_argument("--port", type=int, default=PORT)
+    ap.add_argument("--max-concurrent", type=int, default=MAX_CONCURRENT,
+                    help="Konversi paralel maksimal; request berikutnya dapat 503")
+    ap.add_argument("--max-body-mb", type=int, default=MAX_BODY >> 20, help="Ukuran body maksimal (MB)")
+    ap.add_argument("--read-timeout", type=float, default=READ_TIMEOUT, help="Timeout baca request (detik)")
+    args = ap.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, max_concurrent=args.max_concurrent,
+                          max_body=args.max_body_mb << 20, read_timeout=args.read_timeout))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
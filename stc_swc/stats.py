@@ -0,0 +1,209 @@
+"""
+Instrumentasi per stage (extract / normalize / export) untuk konversi.
+
+Collector ``Stats`` mencatat wall time, jumlah baris, bytes masuk/keluar
+per stage plus counter bebas (mis. hit/miss registry). Waktu dihitung
+*eksklusif*: stage yang bersarang (extract dipanggil dari dalam generator
+normalize) tidak ikut terhitung di stage induknya, jadi jumlah semua stage
+tidak dobel.
+
+Collector aktif dipasang lewat ``collect()``; tanpa itu semua hook
+(``timed``, ``stage``, ``count``, ``sink``) langsung mengembalikan objek
+aslinya / tidak melakukan apa-apa, jadi overhead saat mati praktis nol.
+"""
+from __future__ import annotations
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Iterable, Iterator
+
+# urutan tampil stage di laporan (prefix; "export.csv" ikut "export")
+STAGE_ORDER = ("extract", "enrich", "normalize", "reuse", "export")
+
+_GLOBAL: Stats | None = None
+_local = threading.local()
+
+class Stats:
+    def __init__(self, process_wide: bool = True):
+        self.stages: dict[str, dict] = {}
+        self.counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._tls = threading.local()
+        self._t0 = time.perf_counter()
+        # statistik lru_cache resolve_swc milik seluruh proses -> hanya
+        # bermakna untuk collector global, bukan per thread
+        self._lru0 = None
+        if process_wide:
+            from stc_swc.normalize.detector_map import resolve_swc
+            self._lru0 = resolve_swc.cache_info()
+
+    def add(self, stage: str, wall_s: float = 0.0, rows: int = 0,
+            bytes_in: int = 0, bytes_out: int = 0):
+        with self._lock:
+            s = self.stages.get(stage)
+            if s is None:
+                s = self.stages[stage] = {"wall_s": 0.0, "rows": 0, "bytes_in": 0, "bytes_out": 0}
+            s["wall_s"] += wall_s
+            s["rows"] += rows
+            s["bytes_in"] += bytes_in
+            s["bytes_out"] += bytes_out
+
+    def count(self, key: str, n: int = 1):
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + n
+
+    # --- timing eksklusif: stack frame [nama, mulai] per thread;
+    #     nama None = waktu menunggu input (tidak dicatat ke stage mana pun)
+    def _stack(self) -> list:
+        st = getattr(self._tls, "stack", None)
+        if st is None:
+            st = self._tls.stack = []
+        return st
+
+    def _push(self, name: str | None):
+        st = self._stack()
+        now = time.perf_counter()
+        if st:
+            top = st[-1]
+            if top[0] is not None:
+                self.add(top[0], wall_s=now - top[1])
+        st.append([name, now])
+
+    def _pop(self):
+        st = self._stack()
+        now = time.perf_counter()
+        name, start = st.pop()
+        if name is not None:
+            self.add(name, wall_s=now - start)
+        if st:
+            st[-1][1] = now
+
+    @contextmanager
+    def stage(self, name: str):
+        self._push(name)
+        try:
+            yield self
+        finally:
+            self._pop()
+
+    def iter(self, name: str, it: Iterable, idle: bool = False) -> Iterator:
+        """
+        Bungkus iterator: baris dihitung ke ``name``; waktu di dalam
+        ``next()`` ikut ``name`` atau, kalau ``idle``, dianggap menunggu
+        (untuk input writer yang datang dari queue).
+        """
+        frame = None if idle else name
+        it = iter(it)
+        n = 0
+        try:
+            while True:
+                self._push(frame)
+                try:
+                    row = next(it)
+                except StopIteration:
+                    return
+                finally:
+                    self._pop()
+                n += 1
+                yield row
+        finally:
+            self.add(name, rows=n)
+
+    def merge(self, other: dict):
+        """Gabungkan hasil ``as_dict()`` collector lain (mis. dari worker process)."""
+        for name, s in other.get("stages", {}).items():
+            self.add(name, s["wall_s"], s["rows"], s["bytes_in"], s["bytes_out"])
+        for key, n in other.get("counters", {}).items():
+            self.count(key, n)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            counters = dict(self.counters)
+            stages = {k: dict(v) for k, v in self.stages.items()}
+        if self._lru0 is not None:
+            from stc_swc.normalize.detector_map import resolve_swc
+            lru = resolve_swc.cache_info()
+            counters["resolve_swc.hit"] = counters.get("resolve_swc.hit", 0) + lru.hits - self._lru0.hits
+            counters["resolve_swc.miss"] = counters.get("resolve_swc.miss", 0) + lru.misses - self._lru0.misses
+        for s in stages.values():
+            s["rows_per_s"] = round(s["rows"] / s["wall_s"]) if s["wall_s"] > 0 else None
+        rank = lambda k: (STAGE_ORDER.index(k.split(".")[0]) if k.split(".")[0] in STAGE_ORDER
+                          else len(STAGE_ORDER), k)
+        return {
+            "wall_s": time.perf_counter() - self._t0,
+            "stages": {k: stages[k] for k in sorted(stages, key=rank)},
+            "counters": dict(sorted(counters.items())),
+        }
+
+def current() -> Stats | None:
+    """Collector aktif: milik thread ini dulu (``collect(local=True)``), lalu global."""
+    return getattr(_local, "stats", None) or _GLOBAL
+
+@contextmanager
+def collect(local: bool = False):
+    """
+    Aktifkan collector baru selama blok ``with``. ``local=True`` hanya untuk
+    thread pemanggil (mis. konversi paralel di thread pool app), default
+    untuk seluruh proses (writer ``fan_out`` jalan di thread lain).
+    """
+    global _GLOBAL
+    st = Stats(process_wide=not local)
+    if local:
+        prev, _local.stats = getattr(_local, "stats", None), st
+    else:
+        prev, _GLOBAL = _GLOBAL, st
+    try:
+        yield st
+    finally:
+        if local:
+            _local.stats = prev
+        else:
+            _GLOBAL = prev
+
+# --- hook untuk call site: no-op kalau tidak ada collector aktif
+
+def timed(name: str, it: Iterable) -> Iterable:
+    st = current()
+    return it if st is None else st.iter(name, it)
+
+def stage(name: str):
+    st = current()
+    return nullcontext() if st is None else st.stage(name)
+
+def add(stage: str, **kw):
+    st = current()
+    if st is not None:
+        st.add(stage, **kw)
+
+def count(key: str, n: int = 1):
+    st = current()
+    if st is not None:
+        st.count(key, n)
+
+def size_of(path) -> int:
+    """Ukuran file, atau total isi direktori (dataset terpartisi); 0 kalau tidak ada."""
+    try:
+        if os.path.isdir(path):
+            return sum(os.path.getsize(os.path.join(d, f)) for d, _, fs in os.walk(path) for f in fs)
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+def sink(name: str, fn, path=None):
+    """
+    Bungkus sink ``fan_out``: waktu menulis -> stage ``name`` (menunggu
+    batch dari queue tidak dihitung), ``bytes_out`` = ukuran ``path``
+    setelah selesai.
+    """
+    st = current()
+    if st is None:
+        return fn
+
+    def run(rows):
+        with st.stage(name):
+            res = fn(st.iter(name, rows, idle=True))
+        if path is not None:
+            st.add(name, bytes_out=size_of(path))
+        return res
+    return run
@@ -0,0 +1,2 @@
+# naikkan setiap kali logika konversi berubah -> cache inkremental otomatis invalid
+__version__ = "1.2.0"
@@ -0,0 +1,183 @@
+"""
+Mode watch: satu proses long-running yang mengonversi report begitu
+muncul / berubah di sebuah direktori.
+
+Direktori di-poll (mtime + size); file baru dianggap siap setelah stat-nya
+sama di dua poll berturut-turut dan mtime-nya sudah ``settle`` detik ke
+belakang, jadi report yang masih ditulis scanner tidak ikut terbaca
+setengah jadi. Konversi lewat ``convert_incremental`` (cache manifest +
+worker pool), sehingga file baru cukup di-append ke output dan file yang
+dihapus ikut hilang dari output.
+
+Checkpoint (path -> size, mtime, digest) disimpan atomik di ``out_dir``;
+setelah restart, file yang stat-nya tidak berubah tidak di-hash maupun
+dikonversi ulang. File yang gagal dikonversi tidak masuk checkpoint, jadi
+dicoba lagi di run berikutnya walaupun mtime-nya tidak berubah.
+
+out_dir boleh berada di dalam (atau sama dengan) direktori yang dipantau:
+subtree out_dir, checkpoint, manifest cache dan store SQLite tidak pernah
+ikut di-scan sebagai report, jadi watcher tidak memicu dirinya sendiri.
+"""
+from __future__ import annotations
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from stc_swc.batch import AUTO, PARSERS, expand_inputs, parser
+
+CHECKPOINT_NAME = "swc_watch.checkpoint"
+# nama lama (<= 1.2.0), masih dibaca kalau checkpoint baru belum ada
+_LEGACY_CHECKPOINT_NAME = "swc_watch.checkpoint.json"
+POLL_INTERVAL = 2.0
+SETTLE_SECONDS = 2.0
+
+def _stat(path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+def load_checkpoint(path) -> dict:
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8")).get("files", {})
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_checkpoint(path, files: dict):
+    p = Path(path)
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_text(json.dumps({"files": files}, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, p)
+
+def warm_up():
+    """Muat registry SWC & modul extractor sekali di awal (diwarisi worker hasil fork)."""
+    from stc_swc.normalize.swc_registry import get_swc_meta
+    get_swc_meta("103")
+    for tool in PARSERS:
+        parser(tool)
+
+class Watcher:
+    def __init__(self, root, out_dir, formats: list[str], tool: str = AUTO,
+                 timestamp_iso: str | None = None, jobs: int = 1,
+                 compression: str | None = None, level: int | None = None,
+                 db=None, checkpoint=None,
+                 settle: float = SETTLE_SECONDS, log=print):
+        self.root = str(root)
+        self.out_dir = Path(out_dir)
+        self.formats = formats
+        self.tool = tool
+        self.timestamp_iso = timestamp_iso
+        self.jobs = jobs
+        self.compression = compression
+        self.level = level
+        self.db = db
+        self.checkpoint = Path(checkpoint or self.out_dir / CHECKPOINT_NAME)
+        self.settle = settle
+        self.log = log
+        self.files = load_checkpoint(self.checkpoint)   # path -> {"size", "mtime_ns", "digest"}
+        if not self.files and checkpoint is None:
+            self.files = load_checkpoint(self.out_dir / _LEGACY_CHECKPOINT_NAME)
+        self._seen: dict[str, tuple] = {}                # stat poll sebelumnya (debounce)
+        self.failed: dict[str, str] = {}                 # path -> error konversi terakhir
+
+        # artefak converter sendiri tidak boleh terbaca sebagai report
+        from stc_swc.cache import LEGACY_MANIFEST_NAME
+        out = self.out_dir.resolve()
+        self._skip_dir = out if out != Path(self.root).resolve() else None
+        self._skip_files = {str(p.resolve()) for p in (
+            self.checkpoint, self.out_dir / _LEGACY_CHECKPOINT_NAME,
+            self.out_dir / LEGACY_MANIFEST_NAME, *([Path(db)] if db else []))}
+
+    def _is_artifact(self, path: str) -> bool:
+        p = Path(path).resolve()
+        if self._skip_dir is not None and p.is_relative_to(self._skip_dir):
+            return True
+        return str(p) in self._skip_files
+
+    def _settled(self, path: str, stat: tuple, now: float) -> bool:
+        prev = self._seen.get(path)
+        self._seen[path] = stat
+        return prev == stat and now - stat[1] / 1e9 >= self.settle
+
+    def poll(self, now: float | None = None) -> tuple[list[str], list[str], int]:
+        """Scan sekali -> (file siap yang baru/berubah, file yang hilang, jumlah masih ditulis)."""
+        now = time.time() if now is None else now
+        current = {p: s for p in expand_inputs([self.root])
+                   if not self._is_artifact(p) and (s := _stat(p)) is not None}
+        ready, pending = [], 0
+        for path, stat in current.items():
+            known = self.files.get(path)
+            if known and (known["size"], known["mtime_ns"]) == stat:
+                self._seen.pop(path, None)
+                continue
+            if self._settled(path, stat, now):
+                ready.append(path)
+            else:
+                pending += 1
+        for path in list(self._seen):
+            if path not in current:
+                del self._seen[path]
+        removed = [p for p in self.files if p not in current]
+        return ready, removed, pending
+
+    def convert(self, ready: list[str], removed: list[str]) -> dict | None:
+        from stc_swc.cache import convert_incremental, file_digest
+
+        fresh = {}
+        for path in ready:
+            stat = _stat(path)
+            if stat is None:
+                continue
+            fresh[path] = {"size": stat[0], "mtime_ns": stat[1], "digest": file_digest(path)}
+        touched = [p for p, e in fresh.items()
+                   if p in self.files and self.files[p]["digest"] == e["digest"]]
+        for path in removed:
+            self.files.pop(path, None)
+        changed = removed or len(touched) < len(fresh)
+        self.files.update(fresh)
+
+        summary = None
+        if changed:
+            failures = []
+            inputs = sorted(self.files)
+            summary = convert_incremental(
+                inputs, self.tool, self.out_dir, self.formats,
+                timestamp_iso=self.timestamp_iso, jobs=self.jobs, failures=failures,
+                compression=self.compression, level=self.level, db=self.db,
+                digests={p: e["digest"] for p, e in self.files.items()})
+            # semua input ikut dikonversi ulang kalau gagal sebelumnya
+            # (manifest ok=False) -> ``failures`` = daftar gagal terkini
+            self.failed = dict(failures)
+            for path, err in failures:
+                self.log(f"FAIL {path}: {err}")
+            self.log(f"[watch] {len(fresh) - len(touched)} baru/berubah, {len(removed)} dihapus → "
+                     f"{summary['mode']}, {summary['rows']} temuan")
+        # checkpoint baru disimpan setelah output selesai ditulis: kalau proses
+        # mati di tengah, file yang sama diproses lagi (manifest cache -> idempoten)
+        save_checkpoint(self.checkpoint, {p: e for p, e in self.files.items() if p not in self.failed})
+        (self.out_dir / _LEGACY_CHECKPOINT_NAME).unlink(missing_ok=True)
+        return summary
+
+    def run(self, interval: float = POLL_INTERVAL, once: bool = False,
+            stop: threading.Event | None = None):
+        """
+        Loop poll -> konversi sampai ``stop`` di-set. ``once``: berhenti
+        begitu tidak ada lagi file yang menunggu (untuk cron / CI).
+        Return jumlah file yang konversinya gagal.
+        """
+        stop = stop or threading.Event()
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        warm_up()
+        self.log(f"[watch] memantau {self.root} (poll {interval}s, settle {self.settle}s), "
+                 f"{len(self.files)} file di checkpoint")
+        while not stop.is_set():
+            ready, removed, pending = self.poll()
+            if ready or removed:
+                self.convert(ready, removed)
+            elif once and not pending:
+                break
+            stop.wait(interval)
+        return len(self.failed)
@@ -0,0 +1,37 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).resolve().parent.parent / "stc_swc" / "outputs"
+
+@pytest.fixture
+def mythril_report() -> Path:
+    return FIXTURES / "mythril_output.json"
+
+@pytest.fixture
+def slither_report() -> Path:
+    return FIXTURES / "slither_output.json"
+
+@pytest.fixture
+def reports(tmp_path, mythril_report, slither_report) -> Path:
+    """Direktori berisi salinan kedua fixture (a_mythril.json, b_slither.json)."""
+    d = tmp_path / "reports"
+    d.mkdir()
+    shutil.copy(mythril_report, d / "a_mythril.json")
+    shutil.copy(slither_report, d / "b_slither.json")
+    return d
+
+@pytest.fixture
+def streaming(monkeypatch):
+    """Paksa reader inkremental (tanpa jalur parse satu dokumen orjson)."""
+    from stc_swc.extract import _stream
+    monkeypatch.setattr(_stream, "WHOLE_DOC_LIMIT", -1)
+
+@pytest.fixture
+def truncated_slither(tmp_path, slither_report, streaming) -> Path:
+    """Report Slither yang terpotong di detector ketiga: 2 baris ter-yield lalu gagal."""
+    data = slither_report.read_text(encoding="utf-8")
+    p = tmp_path / "truncated.json"
+    p.write_text(data[:data.index('"low-level-calls"')], encoding="utf-8")
+    return p
@@ -0,0 +1,50 @@
+import pytest
+
+from stc_swc.batch import (PartialFileError, expand_inputs, iter_batch, iter_files,
+                           resolve_tool, run_batch)
+
+TS = "2024-01-01T00:00:00Z"
+
+def test_expand_inputs_skips_metadata(reports):
+    (reports / "_manifest.json").write_text("{}")
+    (reports / "swc_findings.manifest").write_text("{}")
+    (reports / "sub").mkdir()
+    (reports / "sub" / "c.json").write_text("{}")
+    got = expand_inputs([str(reports)])
+    assert [p.rsplit("/", 1)[1] for p in got] == ["a_mythril.json", "b_slither.json", "c.json"]
+    # file yang disebut eksplisit tetap dipakai
+    assert expand_inputs([str(reports / "_manifest.json")]) == [str(reports / "_manifest.json")]
+
+def test_resolve_tool_rejects_wrong_tool(mythril_report):
+    assert resolve_tool(str(mythril_report)) == "mythril"
+    with pytest.raises(ValueError):
+        resolve_tool(str(mythril_report), "slither")
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_run_batch_keeps_file_order(reports, tmp_path, jobs):
+    bad = reports / "0_bad.json"
+    bad.write_text('{"issues": [')
+    paths = expand_inputs([str(reports)])
+    rows, failures = run_batch(paths, "auto", timestamp_iso=TS, jobs=jobs)
+    assert [f[0] for f in failures] == [str(bad)]
+    assert [r["tool"] for r in rows] == ["mythril"] * 3 + ["slither"] * 3
+
+def test_sequential_path_streams(slither_report, streaming):
+    (_, rows, outcome), = iter_files([str(slither_report)], "auto")
+    assert not isinstance(rows, list)
+    assert outcome["rows"] == 0
+    assert len(list(rows)) == 3
+    assert outcome == {"rows": 3, "error": None}
+
+def test_partial_report_raises_then_is_skipped(truncated_slither, mythril_report):
+    paths = [str(mythril_report), str(truncated_slither)]
+    seen = []
+    with pytest.raises(PartialFileError) as exc:
+        for r in iter_batch(paths, "auto", timestamp_iso=TS):
+            seen.append(r)
+    assert exc.value.path == str(truncated_slither)
+    assert len(seen) == 5
+
+    rows, failures = run_batch(paths, "auto", timestamp_iso=TS)
+    assert len(rows) == 3
+    assert [f[0] for f in failures] == [str(truncated_slither)]
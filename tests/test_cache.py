@@ -0,0 +1,86 @@
+import json
+import shutil
+
+import pytest
+
+from stc_swc.cache import MANIFEST_NAME, convert_incremental, load_manifest
+
+TS = "2024-01-01T00:00:00Z"
+FORMATS = ["csv", "ndjson"]
+
+def _run(inputs, out, **kw):
+    failures = []
+    summary = convert_incremental([str(p) for p in inputs], "auto", out, FORMATS,
+                                  timestamp_iso=TS, failures=failures, **kw)
+    return summary, failures
+
+M = ["External Call To User-Supplied Address", "Transaction Order Dependence",
+     "State access after external call"]
+S = ["reentrancy-eth", "solc-version", "low-level-calls"]
+
+def _titles(out):
+    with open(out / "swc_findings.ndjson", encoding="utf-8") as f:
+        return [json.loads(line)["title"] for line in f]
+
+def test_skip_append_replace(reports, tmp_path):
+    out = tmp_path / "out"
+    a, b = reports / "a_mythril.json", reports / "b_slither.json"
+
+    assert _run([a], out)[0]["mode"] == "full"
+    assert (out / MANIFEST_NAME).exists()
+    assert _run([a], out)[0]["mode"] == "skip"
+    assert _run([a, b], out)[0]["mode"] == "append"
+    assert _titles(out) == M + S
+
+    # report baru di depan -> tulis ulang, urutan tetap urutan input
+    c = reports / "0_slither.json"
+    shutil.copy(b, c)
+    summary, _ = _run([c, a, b], out)
+    assert (summary["mode"], summary["converted"], summary["skipped"]) == ("replace", 1, 2)
+    assert _titles(out) == S + M + S
+
+    fresh = tmp_path / "fresh"
+    _run([c, a, b], fresh)
+    assert (out / "swc_findings.csv").read_bytes() == (fresh / "swc_findings.csv").read_bytes()
+
+def test_all_failed_keeps_old_outputs(reports, tmp_path):
+    out = tmp_path / "out"
+    a = reports / "a_mythril.json"
+    _run([a], out)
+    before = (out / "swc_findings.csv").read_bytes()
+
+    bad = reports / "bad.json"
+    bad.write_text('{"issues": [')
+    summary, failures = _run([bad], out)
+    assert summary["mode"] == "failed"
+    assert [f[0] for f in failures] == [str(bad)]
+    assert (out / "swc_findings.csv").read_bytes() == before
+    assert not list(out.glob("*.tmp"))
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_partial_report_rolled_back_on_append(reports, tmp_path, truncated_slither, jobs):
+    out = tmp_path / "out"
+    a = reports / "a_mythril.json"
+    _run([a], out)
+    before = (out / "swc_findings.ndjson").read_bytes()
+
+    summary, failures = _run([a, truncated_slither], out, jobs=jobs)
+    assert summary["mode"] == "append"
+    assert [f[0] for f in failures] == [str(truncated_slither)]
+    assert (out / "swc_findings.ndjson").read_bytes() == before
+    entry = load_manifest(out)["inputs"][str(truncated_slither)]
+    assert (entry["ok"], entry["count"]) == (False, 0)
+
+def test_partial_report_rolls_back_sqlite(reports, tmp_path, truncated_slither):
+    from stc_swc.export.sqlite_store import count
+    db = tmp_path / "f.db"
+    summary, failures = _run([reports / "a_mythril.json", truncated_slither], tmp_path / "out", db=str(db))
+    assert summary["rows"] == 3
+    assert count(db) == 3
+
+def test_legacy_manifest_is_read(reports, tmp_path):
+    out = tmp_path / "out"
+    a = reports / "a_mythril.json"
+    _run([a], out)
+    (out / MANIFEST_NAME).rename(out / "swc_findings.manifest.json")
+    assert _run([a], out)[0]["mode"] == "skip"
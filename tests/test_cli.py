@@ -0,0 +1,35 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def cli(*args):
+    return subprocess.run([sys.executable, str(ROOT / "cli.py"), *map(str, args)],
+                          capture_output=True, text=True, cwd=ROOT)
+
+def test_out_dir_can_be_rerun_as_input(reports):
+    # artefak converter (manifest cache) tidak boleh terbaca sebagai report
+    for _ in range(2):
+        res = cli("--input", reports, "--out-dir", reports)
+        assert res.returncode == 0, res.stderr
+    assert "FAIL" not in res.stderr
+
+def test_partitioned_all_failed_keeps_old_dataset(reports, tmp_path):
+    out = tmp_path / "out"
+    assert cli("--input", reports, "--out-dir", out, "--layout", "partitioned").returncode == 0
+    before = sorted(p.relative_to(out) for p in out.rglob("*"))
+
+    bad = tmp_path / "bad.json"
+    bad.write_text('{"issues": [')
+    res = cli("--input", bad, "--out-dir", out, "--layout", "partitioned")
+    assert res.returncode == 1
+    assert "output lama tidak diubah" in res.stderr
+    assert sorted(p.relative_to(out) for p in out.rglob("*")) == before
+
+def test_merge_flag_exports_merge_columns(reports, tmp_path):
+    out = tmp_path / "out"
+    assert cli("--input", reports, "--out-dir", out, "--merge", "--format", "csv").returncode == 0
+    header, *lines = (out / "swc_findings.csv").read_text(encoding="utf-8").splitlines()
+    assert header.endswith(",tools,merged_ids")
+    assert sum("mythril;slither" in l for l in lines) == 1
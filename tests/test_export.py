@@ -0,0 +1,87 @@
+import csv
+import gzip
+import json
+
+import pytest
+
+from stc_swc.batch import run_batch
+from stc_swc.compression import open_read, open_write
+from stc_swc.export import sqlite_store
+from stc_swc.export.formats import output_path, writer
+from stc_swc.export.partitioned import MANIFEST_NAME, dataset_path, write_partitioned
+
+TS = "2024-01-01T00:00:00Z"
+
+@pytest.fixture
+def rows(mythril_report, slither_report):
+    rows, _ = run_batch([str(mythril_report), str(slither_report)], "auto", timestamp_iso=TS)
+    return rows
+
+def test_gzip_append_is_readable_as_one_stream(tmp_path):
+    p = tmp_path / "x.gz"
+    with open_write(p, "gzip") as f:
+        f.write(b"a\n")
+    with open_write(p, "gzip", append=True) as f:
+        f.write(b"b\n")
+    with open_read(p) as f:
+        assert f.read() == b"a\nb\n"
+
+def test_csv_and_ndjson_writers(rows, tmp_path):
+    csv_path = output_path(tmp_path, "csv", compression="gzip")
+    nd_path = output_path(tmp_path, "ndjson")
+    assert csv_path.name == "swc_findings.csv.gz"
+    writer("csv", "gzip")(rows[:2], str(csv_path))
+    writer("csv", "gzip")(rows[2:], str(csv_path), append=True)
+    writer("ndjson")(rows, str(nd_path))
+
+    with gzip.open(csv_path, "rt", encoding="utf-8") as f:
+        got = list(csv.DictReader(f))
+    assert [r["finding_id"] for r in got] == [r["finding_id"] for r in rows]
+    lines = [json.loads(l) for l in nd_path.read_text(encoding="utf-8").splitlines()]
+    assert lines[0]["line_start"] == rows[0]["line_start"]
+    assert lines[0]["swc_id"] == "107"
+
+def test_sqlite_upsert_and_query(rows, tmp_path):
+    db = tmp_path / "f.db"
+    assert sqlite_store.write_sqlite(rows, db) == len(rows)
+    sqlite_store.write_sqlite(rows, db)
+    assert sqlite_store.count(db) == len(rows)
+    hits = list(sqlite_store.query(db, swc="SWC-107"))
+    assert {h["title"] for h in hits} == {"reentrancy-eth", "External Call To User-Supplied Address",
+                                          "State access after external call"}
+    assert sqlite_store.count(db, group_by="severity")["high"] >= 1
+
+def test_sqlite_rolls_back_when_rows_raise(rows, tmp_path):
+    db = tmp_path / "f.db"
+
+    def broken():
+        yield from rows
+        raise RuntimeError("producer gagal")
+
+    with pytest.raises(RuntimeError):
+        sqlite_store.write_sqlite(broken(), db, batch_size=2)
+    assert sqlite_store.count(db) == 0
+
+def test_partitioned_dataset(rows, tmp_path):
+    root = dataset_path(tmp_path, "ndjson")
+    manifest = write_partitioned(rows, root, "ndjson", partition_by=["contract"], max_rows=2)
+    assert manifest["rows"] == len(rows)
+    assert (root / MANIFEST_NAME).exists()
+    parts = sorted(p.relative_to(root).parts[0] for p in root.rglob("*.ndjson"))
+    assert set(parts) == {"contract=SimpleBank", "contract=__HIVE_DEFAULT_PARTITION__"}
+    n = sum(len(p.read_text().splitlines()) for p in root.rglob("*.ndjson"))
+    assert n == len(rows)
+
+def test_partitioned_failure_keeps_old_dataset(rows, tmp_path):
+    root = dataset_path(tmp_path, "csv")
+    write_partitioned(rows, root, "csv")
+    before = sorted(p.relative_to(root) for p in root.rglob("*"))
+
+    def broken():
+        yield from rows[:2]
+        raise RuntimeError("producer gagal")
+
+    with pytest.raises(RuntimeError):
+        write_partitioned(broken(), root, "csv")
+    assert sorted(p.relative_to(root) for p in root.rglob("*")) == before
+    assert not root.with_name(root.name + ".tmp").exists()
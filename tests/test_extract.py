@@ -0,0 +1,56 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from stc_swc.extract import mythril, slither
+from stc_swc.extract._stream import iter_json_array
+from stc_swc.extract.sniff import sniff_tool
+
+def _doc(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_incremental_reader_matches_json_loads(slither_report, streaming, chunk_size):
+    expected = _doc(slither_report)["results"]["detectors"]
+    got = list(iter_json_array(str(slither_report), ("results", "detectors"), chunk_size=chunk_size))
+    assert got == expected
+
+def test_missing_key_yields_nothing(mythril_report, streaming):
+    assert list(iter_json_array(str(mythril_report), ("results", "detectors"))) == []
+
+@pytest.mark.parametrize("use_streaming", [False, True])
+def test_sources_path_bytes_fileobj_gzip(mythril_report, tmp_path, request, use_streaming):
+    if use_streaming:
+        request.getfixturevalue("streaming")
+    raw = mythril_report.read_bytes()
+    gz = tmp_path / "m.json.gz"
+    gz.write_bytes(gzip.compress(raw))
+
+    expected = [dict(f) for f in mythril.parse_report(str(mythril_report))]
+    assert len(expected) == 3
+    assert [dict(f) for f in mythril.parse_bytes(raw)] == expected
+    assert [dict(f) for f in mythril.parse_stream(io.BytesIO(raw))] == expected
+    assert [dict(f) for f in mythril.parse_report(str(gz))] == expected
+
+def test_mythril_reads_issue_level_location(mythril_report):
+    first = mythril.parse_report(str(mythril_report))[0]
+    assert (first["file"], first["line_start"], first["contract"]) == ("SimpleBank.sol", 13, "SimpleBank")
+
+def test_slither_locations(slither_report):
+    rows = slither.parse_report(str(slither_report))
+    assert [r["title"] for r in rows] == ["reentrancy-eth", "solc-version", "low-level-calls"]
+    assert rows[0]["file"] == "contracts/SimpleBank.sol"
+    assert (rows[0]["line_start"], rows[0]["line_end"]) == (11, 16)
+
+def test_sniff_tool(mythril_report, slither_report, tmp_path):
+    assert sniff_tool(str(mythril_report)) == "mythril"
+    assert sniff_tool(str(slither_report)) == "slither"
+    # key yang tidak dikenal dilewati walaupun nilainya besar / bersarang
+    other = tmp_path / "x.json"
+    other.write_text(json.dumps({"meta": {"issues": []}, "results": {"detectors": []}}))
+    assert sniff_tool(str(other)) == "slither"
+    unknown = tmp_path / "u.json"
+    unknown.write_text('{"foo": 1}')
+    assert sniff_tool(str(unknown)) is None
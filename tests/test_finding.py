@@ -0,0 +1,55 @@
+import pickle
+
+from stc_swc import serializer, stats
+from stc_swc.batch import run_batch
+from stc_swc.finding import Finding, dict_getter, values_getter
+from stc_swc.normalize.detector_map import resolve_swc
+from stc_swc.normalize.fingerprint import finding_digest, finding_fingerprint
+
+def test_finding_behaves_like_dict():
+    f = Finding(finding_id=bytes(range(16)), title="t", line_start=3)
+    assert f["title"] == "t" and "swc_id" not in f
+    assert f.get("swc_id", "-") == "-"
+    assert f.finding_id == bytes(range(16)).hex()
+    assert dict(f) == {"finding_id": bytes(range(16)).hex(), "title": "t", "line_start": 3}
+    f["swc_id"] = "107"
+    del f["title"]
+    assert sorted(f) == ["finding_id", "line_start", "swc_id"]
+    assert pickle.loads(pickle.dumps(f)) == f
+
+def test_getters_fill_missing_with_empty_string():
+    f = Finding(title="t", line_start=3)
+    d = {"title": "t", "line_start": 3}
+    get = values_getter(("title", "swc_id", "line_start"))
+    assert get(f) == get(d) == ("t", "", 3)
+    as_dict = dict_getter(("title", "swc_id"))
+    assert as_dict(f) == as_dict(d) == {"title": "t", "swc_id": ""}
+
+def test_fingerprint_is_stable_and_normalised():
+    a = finding_fingerprint("slither", "C", "a.sol", "SWC-107", 1, 2, "Reentrancy  ETH")
+    b = finding_fingerprint("Slither", "C", "a.sol", "107", "1", 2.0, "reentrancy eth")
+    assert a == b == finding_digest("slither", "C", "a.sol", "107", 1, 2, "reentrancy eth").hex()
+    assert a != finding_fingerprint("mythril", "C", "a.sol", "107", 1, 2, "reentrancy eth")
+
+def test_same_report_same_ids(slither_report):
+    ids = [[r["finding_id"] for r in run_batch([str(slither_report)], "auto")[0]] for _ in range(2)]
+    assert ids[0] == ids[1]
+
+def test_resolve_swc_detector_names():
+    assert resolve_swc("reentrancy-eth") == "107"
+    assert resolve_swc("Reentrancy_ETH") == "107"
+    assert resolve_swc("no-such-detector-xyz") is None
+
+def test_serializer_roundtrip():
+    obj = {"a": "ü", "n": [1, 2.5, None]}
+    assert serializer.loads(serializer.dumps(obj)) == obj
+    assert serializer.dumps_line(obj).endswith(b"\n")
+    assert "ü".encode() in serializer.dumps(obj)
+
+def test_stats_collects_stages(mythril_report):
+    with stats.collect() as st:
+        run_batch([str(mythril_report)], "auto")
+    d = st.as_dict()
+    assert d["stages"]["normalize"]["rows"] == 3
+    assert d["stages"]["extract"]["bytes_in"] == mythril_report.stat().st_size
+    assert stats.current() is None
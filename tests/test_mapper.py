@@ -0,0 +1,19 @@
+from stc_swc.batch import parser
+from stc_swc.normalize import mapper
+from stc_swc.normalize.mapper import iter_stc_schema, to_stc_schema
+
+def test_slither_swc_resolved_and_enriched(slither_report):
+    rows = list(iter_stc_schema(parser("slither")(str(slither_report)), tool="slither",
+                                timestamp_iso="2024-01-01T00:00:00Z"))
+    by_title = {r["title"]: r for r in rows}
+    assert by_title["reentrancy-eth"]["swc_id"] == "107"
+    assert by_title["reentrancy-eth"]["remediation"]
+    assert all(r["tool"] == "slither" for r in rows)
+    assert len({r["finding_id"] for r in rows}) == len(rows)
+
+def test_line_numbers_interned_per_conversion_only():
+    assert not hasattr(mapper, "_INTS")
+    raw = [{"swc_id": "107", "title": "t", "line_start": 1000 + i // 2} for i in range(4)]
+    rows = list(iter_stc_schema(raw, tool="mythril"))
+    assert rows[0]["line_start"] is rows[1]["line_start"]
+    assert to_stc_schema({"swc_id": "107", "line_start": 5000}, tool="mythril")["line_end"] == 5000
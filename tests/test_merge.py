@@ -0,0 +1,35 @@
+from stc_swc.batch import run_batch
+from stc_swc.normalize.merge import _resolve_suffixes, merge_findings
+
+TS = "2024-01-01T00:00:00Z"
+
+def _row(tool, line_start, line_end, file="contracts/A.sol", swc="107", fid=None):
+    return {"tool": tool, "file": file, "contract": "A", "swc_id": swc,
+            "line_start": line_start, "line_end": line_end, "finding_id": fid or f"{tool}{line_start}"}
+
+def test_bundled_fixtures_merge(mythril_report, slither_report):
+    rows, failures = run_batch([str(mythril_report), str(slither_report)], "auto", timestamp_iso=TS)
+    assert not failures
+    merged = merge_findings(rows)
+
+    assert len(merged) == len(rows) - 1
+    both = [r for r in merged if r["tools"] == "mythril;slither"]
+    assert len(both) == 1
+    assert both[0]["swc_id"] == "107"
+    assert both[0]["file"] == "contracts/SimpleBank.sol"
+    assert (both[0]["line_start"], both[0]["line_end"]) == (11, 16)
+
+def test_same_tool_never_clusters():
+    merged = merge_findings([_row("slither", 10, 20), _row("mythril", 12, 12), _row("mythril", 15, 15)])
+    assert [r["tools"] for r in merged] == ["mythril;slither", "mythril"]
+    assert merged[0]["merged_ids"] == "slither10;mythril12"
+
+def test_no_overlap_no_merge():
+    merged = merge_findings([_row("slither", 1, 5), _row("mythril", 6, 6)])
+    assert [r["tools"] for r in merged] == ["slither", "mythril"]
+
+def test_basename_fallback_only_when_unambiguous():
+    assert _resolve_suffixes({"a.sol", "contracts/a.sol"}) == {"a.sol": "contracts/a.sol",
+                                                                "contracts/a.sol": "contracts/a.sol"}
+    keys = {"token.sol", "a/token.sol", "b/token.sol"}
+    assert _resolve_suffixes(keys) == {k: k for k in keys}
@@ -0,0 +1,29 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from stc_swc.batch import run_batch
+from stc_swc.export.parquet_exporter import _to_ts
+
+UTC_MIDNIGHT = datetime(2024, 1, 1)
+
+@pytest.mark.parametrize("value", [
+    "2024-01-01T07:00:00+07:00",
+    "2023-12-31T19:00:00-05:00",
+    "2024-01-01T00:00:00Z",
+    "2024-01-01T00:00:00",
+    datetime(2024, 1, 1, 7, tzinfo=timezone(timedelta(hours=7))),
+])
+def test_timestamp_offset_is_converted_to_utc(value):
+    assert _to_ts(value) == UTC_MIDNIGHT
+
+def test_write_parquet_roundtrip(tmp_path, mythril_report):
+    pq = pytest.importorskip("pyarrow.parquet")
+    from stc_swc.export.parquet_exporter import write_parquet
+
+    rows, _ = run_batch([str(mythril_report)], "mythril", timestamp_iso="2024-01-01T07:00:00+07:00")
+    out = tmp_path / "f.parquet"
+    write_parquet(rows, str(out))
+    table = pq.read_table(out)
+    assert table.num_rows == len(rows)
+    assert set(table.column("timestamp").to_pylist()) == {UTC_MIDNIGHT}
@@ -0,0 +1,41 @@
+import pytest
+
+from stc_swc.pipeline import Aborted, fan_out
+
+def test_fan_out_every_sink_sees_every_row():
+    got = {"a": [], "b": []}
+    n = fan_out(({"i": i} for i in range(2500)),
+                [lambda rs: got["a"].extend(rs), lambda rs: got["b"].extend(rs)], batch_size=100)
+    assert n == 2500
+    assert got["a"] == got["b"] == [{"i": i} for i in range(2500)]
+
+def test_producer_error_aborts_sinks():
+    finished, aborted = [], []
+
+    def sink(rows):
+        try:
+            for _ in rows:
+                pass
+        except Aborted:
+            aborted.append(True)
+            raise
+        finished.append(True)
+
+    def rows():
+        yield from ({"i": i} for i in range(10))
+        raise ValueError("rusak")
+
+    with pytest.raises(ValueError):
+        fan_out(rows(), [sink, sink], batch_size=3)
+    assert aborted == [True, True]
+    assert not finished
+
+def test_sink_error_is_raised_and_producer_not_blocked():
+    def bad(rows):
+        next(iter(rows))
+        raise OSError("disk penuh")
+
+    got = []
+    with pytest.raises(OSError):
+        fan_out(({"i": i} for i in range(10_000)), [bad, got.extend], batch_size=10, max_pending=2)
+    assert len(got) == 10_000
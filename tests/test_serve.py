@@ -0,0 +1,60 @@
+import asyncio
+import gzip
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from stc_swc.serve import Server
+
+def _serve(requests_fn, **limits):
+    """Jalankan Server di port bebas, panggil ``requests_fn(base_url)`` di thread lain."""
+    async def main():
+        srv = Server(**limits)
+        server = await srv.start("127.0.0.1", 0)
+        host, port = server.sockets[0].getsockname()[:2]
+        try:
+            async with server:
+                return await asyncio.get_running_loop().run_in_executor(
+                    None, requests_fn, f"http://{host}:{port}")
+        finally:
+            srv.close()
+    return asyncio.run(main())
+
+def _post(url, body):
+    req = urllib.request.Request(url, data=body, method="POST")
+    with urllib.request.urlopen(req, timeout=10) as resp:
+        return resp.status, dict(resp.headers), resp.read()
+
+def test_healthz():
+    def go(base):
+        with urllib.request.urlopen(base + "/healthz", timeout=10) as resp:
+            return json.loads(resp.read())
+    assert _serve(go)["status"] == "ok"
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_convert_streams_ndjson(slither_report, compress):
+    body = slither_report.read_bytes()
+    if compress:
+        body = gzip.compress(body)
+    status, headers, data = _serve(lambda base: _post(base + "/convert?timestamp=2024-01-01T00:00:00Z", body))
+    assert status == 200
+    assert headers["X-STC-Tool"] == "slither"
+    rows = [json.loads(l) for l in data.splitlines()]
+    assert [r["title"] for r in rows] == ["reentrancy-eth", "solc-version", "low-level-calls"]
+    assert {r["timestamp"] for r in rows} == {"2024-01-01T00:00:00Z"}
+
+def test_errors_before_first_row(mythril_report):
+    def go(base):
+        codes = []
+        for url, body in [(base + "/convert", b'{"foo": 1}'),
+                          (base + "/convert?tool=slither", mythril_report.read_bytes()),
+                          (base + "/nope", b"{}"),
+                          (base + "/convert", b"x" * (64 << 10))]:
+            try:
+                _post(url, body)
+            except urllib.error.HTTPError as e:
+                codes.append(e.code)
+        return codes
+    assert _serve(go, max_body=32 << 10) == [400, 400, 404, 413]
@@ -0,0 +1,24 @@
+import pytest
+
+from stc_swc.batch import parser
+from stc_swc.normalize.mapper import to_stc_schema_batch
+
+pytest.importorskip("pandas")
+from stc_swc.normalize.standardizer import to_standard_df  # noqa: E402
+
+@pytest.mark.parametrize("tool", ["mythril", "slither"])
+def test_finding_id_matches_mapper(tool, mythril_report, slither_report):
+    path = mythril_report if tool == "mythril" else slither_report
+    raw = list(parser(tool)(str(path)))
+    # standardizer tanpa swc_id: harus resolve dari nama detector seperti mapper
+    records = [{**dict(r), "swc_id": None if tool == "slither" else r["swc_id"]} for r in raw]
+    mapped = to_stc_schema_batch(raw, tool=tool)
+
+    for i, m in enumerate(mapped):
+        df = to_standard_df([records[i]], "ethereum", m.contract, "abc", tool=tool)
+        assert df["finding_id"].iloc[0] == m.finding_id
+        assert df["swc_id"].iloc[0] == m.swc_id
+
+def test_tool_is_required():
+    with pytest.raises(TypeError):
+        to_standard_df([], "ethereum", "A", "abc")
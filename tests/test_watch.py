@@ -0,0 +1,38 @@
+import shutil
+
+from stc_swc.watch import CHECKPOINT_NAME, Watcher, load_checkpoint
+
+def _watcher(root, out, **kw):
+    return Watcher(root, out, ["csv", "ndjson"], timestamp_iso="2024-01-01T00:00:00Z",
+                   settle=0, log=lambda msg: None, **kw)
+
+def test_once_with_out_dir_inside_watched_dir(reports):
+    out = reports / "out"
+    w = _watcher(reports, out, db=str(reports / "findings.json"))
+    assert w.run(interval=0, once=True) == 0
+    assert sorted(load_checkpoint(out / CHECKPOINT_NAME)) == sorted(str(p) for p in reports.glob("*.json")
+                                                                   if p.name != "findings.json")
+
+    # restart: tidak ada file baru -> tidak ada konversi, artefak sendiri tidak di-scan
+    w2 = _watcher(reports, out, db=str(reports / "findings.json"))
+    ready, removed, pending = w2.poll()
+    assert (ready, removed, pending) == ([], [], 0)
+
+def test_out_dir_equal_to_watched_dir(reports):
+    w = _watcher(reports, reports)
+    assert w.run(interval=0, once=True) == 0
+    assert _watcher(reports, reports).poll() == ([], [], 0)
+
+def test_failed_file_is_retried_after_restart(reports, tmp_path, mythril_report):
+    out = tmp_path / "out"
+    bad = reports / "c_bad.json"
+    bad.write_text('{"issues": [')
+    w = _watcher(reports, out)
+    assert w.run(interval=0, once=True) == 1
+    assert str(bad) not in load_checkpoint(out / CHECKPOINT_NAME)
+
+    shutil.copy(mythril_report, bad)
+    w2 = _watcher(reports, out)
+    assert w2.run(interval=0, once=True) == 0
+    assert str(bad) in load_checkpoint(out / CHECKPOINT_NAME)
+    assert len((out / "swc_findings.csv").read_text().splitlines()) == 1 + 9
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-stage converter: extract, to_stc_schema_batch, to_standard_df,
+dan tiap exporter (csv / ndjson / parquet), plus pipeline streaming end-to-end.
+
+Tiap stage mencatat wall time, rows/sec, dan peak RSS (sampling
+/proc/self/statm selama stage berjalan). Hasil disimpan sebagai JSON
+baseline; ``--compare`` membandingkan dengan baseline lama dan exit 1
+kalau ada stage yang melambat melebihi ``--tolerance``.
+
+Contoh:
+  python tools/bench.py --sizes 1000 100000 --out bench/baseline.json
+  python tools/bench.py --sizes 1000 100000 --out bench/new.json --compare bench/baseline.json
+"""
+from pathlib import Path
+import argparse, gc, json, os, platform, resource, sys, tempfile, threading, time
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from gen_synthetic_reports import write_report
+from stc_swc.extract.mythril import parse_report as parse_mythril, iter_report as iter_mythril
+from stc_swc.extract.slither import parse_report as parse_slither, iter_report as iter_slither
+from stc_swc.normalize.mapper import to_stc_schema_batch
+from stc_swc.export.csv_exporter import write_csv
+from stc_swc.export.ndjson_exporter import write_ndjson
+from stc_swc.pipeline import run_pipeline
+from stc_swc.version import __version__
+
+PARSERS = {"mythril": (parse_mythril, iter_mythril), "slither": (parse_slither, iter_slither)}
+_PAGE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE
+    except OSError:
+        # fallback non-Linux: maxrss (monoton, KB di Linux / byte di macOS)
+        r = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return r if sys.platform == "darwin" else r * 1024
+
+class _RssSampler(threading.Thread):
+    def __init__(self, interval: float = 0.005):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.start_rss = self.peak = _rss_bytes()
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            self.peak = max(self.peak, _rss_bytes())
+
+    def stop(self):
+        self._done.set()
+        self.join()
+        self.peak = max(self.peak, _rss_bytes())
+
+def measure(stage: str, fn, rows_of=len):
+    gc.collect()
+    sampler = _RssSampler()
+    sampler.start()
+    t0 = time.perf_counter()
+    out = fn()
+    wall = time.perf_counter() - t0
+    sampler.stop()
+    n = rows_of(out)
+    res = {
+        "stage": stage,
+        "rows": n,
+        "wall_s": round(wall, 4),
+        "rows_per_s": round(n / wall, 1) if wall > 0 else None,
+        "rss_peak_mb": round(sampler.peak / 1e6, 1),
+        "rss_delta_mb": round((sampler.peak - sampler.start_rss) / 1e6, 1),
+    }
+    return out, res
+
+def bench_one(tool: str, size: int, workdir: Path, args) -> list:
+    report = workdir / f"{tool}_{size}.json"
+    if not report.exists():
+        write_report(tool, report, size, contracts=args.contracts, seed=args.seed)
+    parse, iter_report = PARSERS[tool]
+    results = []
+
+    def add(res):
+        res.update({"tool": tool, "size": size, "input_mb": round(report.stat().st_size / 1e6, 1)})
+        results.append(res)
+        print(f"{tool:8} {size:>8} {res['stage']:20} {res['wall_s']:>9.3f}s "
+              f"{res['rows_per_s'] or 0:>12.0f} rows/s  peak {res['rss_peak_mb']:>8.1f} MB", file=sys.stderr)
+
+    raw, res = measure("extract", lambda: parse(str(report)))
+    add(res)
+
+    # to_standard_df dulu: to_stc_schema_batch menormalisasi Finding ``raw`` in-place
+    try:
+        from stc_swc.normalize.standardizer import to_standard_df
+    except ImportError:
+        to_standard_df = None
+    if to_standard_df is not None:
+        _, res = measure("to_standard_df",
+                         lambda: to_standard_df(raw, "ethereum", "Bench", commit_hash="bench", tool=tool))
+        add(res)
+    rows, res = measure("to_stc_schema_batch", lambda: to_stc_schema_batch(raw, tool=tool))
+    add(res)
+    del raw
+
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        tmp = Path(tmp)
+        _, res = measure("export_csv", lambda: write_csv(rows, str(tmp / "out.csv")), rows_of=int)
+        add(res)
+        _, res = measure("export_ndjson", lambda: write_ndjson(rows, str(tmp / "out.ndjson")), rows_of=int)
+        add(res)
+        try:
+            from stc_swc.export.parquet_exporter import write_parquet
+            import pyarrow  # noqa: F401
+        except ImportError:
+            write_parquet = None
+        if write_parquet is not None:
+            _, res = measure("export_parquet", lambda: write_parquet(rows, str(tmp / "out.parquet")), rows_of=int)
+            add(res)
+        del rows
+
+        _, res = measure("pipeline_stream", lambda: run_pipeline(
+            iter_report(str(report)), tool,
+            [lambda rs: write_csv(rs, str(tmp / "p.csv")), lambda rs: write_ndjson(rs, str(tmp / "p.ndjson"))],
+        ), rows_of=int)
+        add(res)
+    return results
+
+def compare(new: dict, old: dict, tolerance: float) -> list:
+    key = lambda r: (r["tool"], r["size"], r["stage"])
+    base = {key(r): r for r in old.get("results", [])}
+    regressions = []
+    for r in new["results"]:
+        b = base.get(key(r))
+        if not b or not b.get("wall_s"):
+            continue
+        ratio = r["wall_s"] / b["wall_s"]
+        flag = ratio > 1 + tolerance
+        print(f"{'REGRESSION' if flag else 'ok':10} {r['tool']:8} {r['size']:>8} {r['stage']:20} "
+              f"{b['wall_s']:.3f}s → {r['wall_s']:.3f}s (x{ratio:.2f})")
+        if flag:
+            regressions.append((key(r), ratio))
+    return regressions
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark per-stage STC converter")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    ap.add_argument("--tools", nargs="+", default=["mythril", "slither"], choices=["mythril", "slither"])
+    ap.add_argument("--contracts", type=int, default=20)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), "stc-bench"),
+                    help="Tempat report sintetis (di-cache antar run)")
+    ap.add_argument("--out", default="bench/latest.json", help="File JSON hasil benchmark")
+    ap.add_argument("--compare", help="Baseline JSON lama untuk dibandingkan")
+    ap.add_argument("--tolerance", type=float, default=0.2, help="Batas perlambatan (0.2 = 20%%)")
+    args = ap.parse_args()
+
+    workdir = Path(args.workdir)
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    for tool in args.tools:
+        for size in args.sizes:
+            results.extend(bench_one(tool, size, workdir, args))
+
+    out = {
+        "meta": {
+            "converter_version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "contracts": args.contracts,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    out_path = Path(args.out)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(out, indent=2), encoding="utf-8")
+    print(f"✅ wrote {out_path}", file=sys.stderr)
+
+    if args.compare:
+        old = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if compare(out, old, args.tolerance):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
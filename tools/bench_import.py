@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold start CLI: waktu proses baru untuk ``cli.py --help`` dan
+``import cli`` (median dari ``--runs`` kali), dikurangi baseline interpreter
+kosong (``python -c pass``), plus rincian ``-X importtime`` supaya import
+berat yang masuk ke jalur start-up kelihatan.
+
+Format JSON & ``--compare`` / ``--tolerance`` sama dengan tools/bench.py.
+
+Contoh:
+  python tools/bench_import.py --out bench/import_baseline.json
+  python tools/bench_import.py --out bench/import_new.json --compare bench/import_baseline.json
+"""
+from pathlib import Path
+import argparse, json, os, platform, statistics, subprocess, sys, time
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from stc_swc.version import __version__
+
+SCENARIOS = {
+    "baseline": ["-c", "pass"],
+    "import_cli": ["-c", "import cli"],
+    "cli_help": ["cli.py", "--help"],
+    "query_help": ["cli.py", "query", "--help"],
+}
+
+def _run(args: list, env=None) -> float:
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, *args], cwd=ROOT, env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - t0
+
+def measure(name: str, args: list, runs: int) -> dict:
+    _run(args)  # warm-up: .pyc & page cache
+    times = [_run(args) for _ in range(runs)]
+    return {"stage": name, "runs": runs, "wall_s": statistics.median(times), "min_s": min(times)}
+
+def import_profile(module: str = "cli", top: int = 15) -> dict:
+    """Cumulative import time ``module`` + modul dengan self time terbesar (µs)."""
+    p = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                       cwd=ROOT, capture_output=True, text=True, check=True)
+    rows = []
+    for line in p.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cum_us)))
+    total = next((cum for name, _, cum in rows if name == module), 0)
+    ours = [r for r in rows if r[0] == "cli" or r[0].startswith("stc_swc")]
+    heavy = sorted(rows, key=lambda r: r[1], reverse=True)[:top]
+    return {
+        "module": module,
+        "cumulative_us": total,
+        "stc_swc_us": sum(r[1] for r in ours),
+        "modules_loaded": len(rows),
+        "top_self_us": [{"module": n, "self_us": s, "cumulative_us": c} for n, s, c in heavy],
+    }
+
+def compare(new: dict, old: dict, tolerance: float) -> list:
+    base = {r["stage"]: r for r in old.get("results", [])}
+    regressions = []
+    for r in new["results"]:
+        b = base.get(r["stage"])
+        if not b or not b.get("net_s") or r["stage"] == "baseline":
+            continue
+        ratio = r["net_s"] / b["net_s"]
+        flag = ratio > 1 + tolerance
+        print(f"{'REGRESSION' if flag else 'ok':10} {r['stage']:12} "
+              f"{b['net_s'] * 1000:.1f}ms → {r['net_s'] * 1000:.1f}ms (x{ratio:.2f})")
+        if flag:
+            regressions.append((r["stage"], ratio))
+    return regressions
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark cold start (import time) CLI STC converter")
+    ap.add_argument("--runs", type=int, default=20, help="Jumlah proses per skenario")
+    ap.add_argument("--top", type=int, default=15, help="Jumlah modul terberat di profil importtime")
+    ap.add_argument("--out", default="bench/import_latest.json", help="File JSON hasil benchmark")
+    ap.add_argument("--compare", help="Baseline JSON lama untuk dibandingkan")
+    ap.add_argument("--tolerance", type=float, default=0.2, help="Batas perlambatan (0.2 = 20%%)")
+    args = ap.parse_args()
+
+    results = [measure(name, a, args.runs) for name, a in SCENARIOS.items()]
+    base = results[0]["wall_s"]
+    for r in results:
+        # selisih terhadap interpreter kosong = biaya yang memang milik converter
+        r["net_s"] = max(0.0, r["wall_s"] - base)
+        print(f"{r['stage']:12} {r['wall_s'] * 1000:7.1f}ms  (net {r['net_s'] * 1000:6.1f}ms)", file=sys.stderr)
+
+    out = {
+        "meta": {
+            "converter_version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+        "importtime": import_profile("cli", args.top),
+    }
+    out_path = Path(args.out)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(out, indent=2), encoding="utf-8")
+    print(f"✅ wrote {out_path}", file=sys.stderr)
+
+    if args.compare:
+        old = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if compare(out, old, args.tolerance):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 SWC Registry fetcher via GitHub Commits + Tree + Blob API (robust).
 
@@ -9,47 +8,90 @@ SWC Registry fetcher via GitHub Commits + Tree + Blob API (robust).
 - Parse Markdown -> title, severity, remediation
 - Tulis cache ke stc_swc/normalize/swc_registry_full.json
 
+Blob di-fetch paralel (worker pool, satu Session ber-pool koneksi). SHA blob
+& ETag disimpan di ~/.cache/stc-swc/swc_registry_fetch_cache.json (atau
+$XDG_CACHE_HOME, bisa diganti lewat --cache): entry yang SHA-nya sama
+dilewati tanpa request, dan request metadata memakai If-None-Match (304 =
+tidak berubah). Output & cache ditulis atomik, termasuk saat sebagian blob
+gagal (entry yang gagal tetap memakai data lama, run berikutnya mengulang).
+
 Set env opsional:
   GITHUB_TOKEN  (biar rate limit longgar)
+  SWC_API_BASE  (base URL API, mis. server lokal untuk testing)
 """
 from pathlib import Path
-import os, re, json, base64, requests, sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import argparse, os, re, json, base64, requests, sys
+from requests.adapters import HTTPAdapter
 
 OWNER = "SmartContractSecurity"
 REPO  = "SWC-registry"
-API_BASE = f"https://api.github.com/repos/{OWNER}/{REPO}"
+API_BASE = os.getenv("SWC_API_BASE", f"https://api.github.com/repos/{OWNER}/{REPO}").rstrip("/")
 
 OUT_PATH = Path("stc_swc/normalize/swc_registry_full.json")
+# cache berisi body respons mentah (termasuk listing tree rekursif) -> di luar
+# package & repo, mengikuti XDG_CACHE_HOME
+CACHE_PATH = (Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+              / "stc-swc" / "swc_registry_fetch_cache.json")
+WORKERS = 8
 
-def sess():
+def sess(workers: int = WORKERS):
     s = requests.Session()
+    # satu pool koneksi dipakai bersama semua worker
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, workers), max_retries=2)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     if os.getenv("GITHUB_TOKEN"):
         s.headers["Authorization"] = f"Bearer {os.getenv('GITHUB_TOKEN')}"
     s.headers["User-Agent"] = "stc-swc-fetcher"
     s.headers["Accept"] = "application/vnd.github+json"
     return s
 
-def get_default_branch(s):
-    r = s.get(API_BASE, timeout=30); r.raise_for_status()
-    return r.json().get("default_branch", "master")
+def _write_atomic(path: Path, obj):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+def _load_json(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def get_json(s, url, cache=None, timeout=30):
+    """
+    GET JSON; kalau ``cache`` diberikan, pakai ETag tersimpan (If-None-Match)
+    dan kembalikan body lama saat server menjawab 304.
+    """
+    entry = (cache or {}).get(url)
+    headers = {"If-None-Match": entry["etag"]} if entry and entry.get("etag") else {}
+    r = s.get(url, headers=headers, timeout=timeout)
+    if r.status_code == 304 and entry:
+        return entry["body"]
+    r.raise_for_status()
+    body = r.json()
+    if cache is not None and r.headers.get("ETag"):
+        cache[url] = {"etag": r.headers["ETag"], "body": body}
+    return body
+
+def get_default_branch(s, base=API_BASE, cache=None):
+    return get_json(s, base, cache).get("default_branch", "master")
 
-def get_tree_sha(s, branch):
+def get_tree_sha(s, branch, base=API_BASE, cache=None):
     # commits/{branch} -> commit.tree.sha
-    r = s.get(f"{API_BASE}/commits/{branch}", timeout=30); r.raise_for_status()
-    js = r.json()
+    js = get_json(s, f"{base}/commits/{branch}", cache)
     tree = js.get("commit", {}).get("tree", {})
     sha = tree.get("sha")
     if not sha:
         raise RuntimeError("tree sha not found")
     return sha
 
-def get_tree_recursive(s, tree_sha):
-    r = s.get(f"{API_BASE}/git/trees/{tree_sha}?recursive=1", timeout=60)
-    r.raise_for_status()
-    return r.json().get("tree", [])
+def get_tree_recursive(s, tree_sha, base=API_BASE, cache=None):
+    return get_json(s, f"{base}/git/trees/{tree_sha}?recursive=1", cache, timeout=60).get("tree", [])
 
-def get_blob_text(s, blob_sha):
-    r = s.get(f"{API_BASE}/git/blobs/{blob_sha}", timeout=30); r.raise_for_status()
+def get_blob_text(s, blob_sha, base=API_BASE):
+    r = s.get(f"{base}/git/blobs/{blob_sha}", timeout=30); r.raise_for_status()
     js = r.json()
     if js.get("encoding") == "base64":
         return base64.b64decode(js["content"]).decode("utf-8", "replace")
@@ -81,49 +123,88 @@ def parse_md(md: str) -> dict:
 
     return {"title": title or None, "severity": severity or None, "remediation": remediation or None}
 
-def fetch_all():
-    OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    s = sess()
-
-    branch = get_default_branch(s)
+def _entry(swc_num: str, meta: dict) -> dict:
+    return {
+        "id": swc_num,
+        "title": meta["title"],
+        "severity": meta["severity"],
+        "description": None,
+        "remediation": meta["remediation"],
+        "relationships": None,
+        "cwe": None,
+        "references": None,
+    }
+
+def fetch_all(base: str = API_BASE, workers: int = WORKERS, out_path: Path = OUT_PATH,
+              cache_path: Path = CACHE_PATH, force: bool = False) -> int:
+    """Refresh registry; return jumlah entry yang gagal di-fetch."""
+    out_path = Path(out_path)
+    cache_path = Path(cache_path)
+    cache = {} if force else _load_json(cache_path)
+    http_cache = cache.setdefault("http", {})
+    blobs = cache.setdefault("blobs", {})   # swc_num -> {"sha", "entry"}
+    s = sess(workers)
+
+    branch = get_default_branch(s, base, http_cache)
     print(f"[info] default_branch: {branch}", file=sys.stderr)
 
-    tree_sha = get_tree_sha(s, branch)
+    tree_sha = get_tree_sha(s, branch, base, http_cache)
     print(f"[info] tree_sha: {tree_sha}", file=sys.stderr)
 
-    tree = get_tree_recursive(s, tree_sha)
-    targets = [t for t in tree
-               if t.get("type") == "blob"
-               and re.match(r"^entries/SWC-\d{3}/README\.md$", t.get("path",""))]
-
-    print(f"[info] found {len(targets)} README.md entries", file=sys.stderr)
-
+    tree = get_tree_recursive(s, tree_sha, base, http_cache)
+    targets = {}
+    for t in tree:
+        m = re.match(r"^entries/SWC-(\d{3})/README\.md$", t.get("path", ""))
+        if t.get("type") == "blob" and m:
+            targets[m.group(1)] = t["sha"]
+
+    todo = {num: sha for num, sha in targets.items() if blobs.get(num, {}).get("sha") != sha}
+    print(f"[info] found {len(targets)} README.md entries, {len(todo)} berubah", file=sys.stderr)
+
+    def fetch(num, sha):
+        return _entry(num, parse_md(get_blob_text(s, sha, base)))
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+        futures = {ex.submit(fetch, num, sha): (num, sha) for num, sha in todo.items()}
+        for i, fut in enumerate(as_completed(futures), 1):
+            num, sha = futures[fut]
+            try:
+                blobs[num] = {"sha": sha, "entry": fut.result()}
+            except Exception as e:
+                failed.append(num)
+                print(f"[warn] SWC-{num}: {type(e).__name__}: {e}", file=sys.stderr)
+            if i % 20 == 0:
+                print(f"[info] processed {i}/{len(todo)}", file=sys.stderr)
+
+    # entry yang gagal -> pakai data lama (kalau ada); yang hilang dari tree dibuang
+    old = _load_json(out_path)
     entries = {}
-    for i, t in enumerate(targets, 1):
-        path = t["path"]
-        m = re.search(r"SWC-(\d{3})", path)
-        if not m: continue
-        swc_num = m.group(1)
-
-        md = get_blob_text(s, t["sha"])
-        meta = parse_md(md)
-
-        entries[swc_num] = {
-            "id": swc_num,
-            "title": meta["title"],
-            "severity": meta["severity"],
-            "description": None,
-            "remediation": meta["remediation"],
-            "relationships": None,
-            "cwe": None,
-            "references": None,
-        }
-
-        if i % 20 == 0:
-            print(f"[info] processed {i}/{len(targets)}", file=sys.stderr)
-
-    OUT_PATH.write_text(json.dumps(entries, ensure_ascii=False, indent=2), encoding="utf-8")
-    print(f"✅ wrote {OUT_PATH} with {len(entries)} entries")
+    for num in sorted(targets):
+        if num in blobs and num not in failed:
+            entries[num] = blobs[num]["entry"]
+        elif num in old:
+            entries[num] = old[num]
+    for num in list(blobs):
+        if num not in targets or num in failed:
+            blobs.pop(num)
+
+    _write_atomic(out_path, entries)
+    _write_atomic(cache_path, cache)
+    print(f"✅ wrote {out_path} with {len(entries)} entries"
+          + (f" ({len(failed)} gagal, dicoba lagi di run berikutnya)" if failed else ""))
+    return len(failed)
+
+def main():
+    ap = argparse.ArgumentParser(description="Refresh SWC registry dari GitHub")
+    ap.add_argument("--api-base", default=API_BASE, help="Base URL API repo (default: GitHub / env SWC_API_BASE)")
+    ap.add_argument("--workers", type=int, default=WORKERS)
+    ap.add_argument("--out", default=str(OUT_PATH))
+    ap.add_argument("--cache", default=str(CACHE_PATH), help="File cache SHA blob & ETag")
+    ap.add_argument("--force", action="store_true", help="Abaikan cache, fetch ulang semua entry")
+    args = ap.parse_args()
+    failed = fetch_all(args.api_base.rstrip("/"), args.workers, Path(args.out), Path(args.cache), args.force)
+    sys.exit(1 if failed else 0)
 
 if __name__ == "__main__":
-    fetch_all()
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Generator report Mythril / Slither sintetis untuk benchmark.
+
+Bentuk JSON mengikuti outputs/mythril_output.json (issues[]) dan
+outputs/slither_output.json (results.detectors[]); ukuran & variasinya
+bisa diatur. File ditulis streaming, jadi 1M temuan tidak perlu muat di RAM.
+
+Contoh:
+  python tools/gen_synthetic_reports.py --tool slither --findings 100000 --out bench/slither_100k.json
+  python tools/gen_synthetic_reports.py --tool mythril --findings 1000000 --contracts 500 --lean
+"""
+from pathlib import Path
+import argparse, json, random, sys
+
+MYTHRIL_ISSUES = [
+    # (swc-id, title, severity)
+    ("107", "External Call To User-Supplied Address", "Low"),
+    ("107", "State access after external call", "Medium"),
+    ("114", "Transaction Order Dependence", "Medium"),
+    ("101", "Integer Arithmetic Bugs", "High"),
+    ("104", "Unchecked return value from external call.", "Medium"),
+    ("105", "Unprotected Ether Withdrawal", "High"),
+    ("106", "Unprotected Selfdestruct", "High"),
+    ("110", "Exception State", "Medium"),
+    ("112", "Delegatecall to user-supplied address", "High"),
+    ("115", "Dependence on tx.origin", "Low"),
+    ("116", "Dependence on predictable environment variable", "Low"),
+]
+
+SLITHER_CHECKS = [
+    # (check, impact, confidence, template deskripsi)
+    ("reentrancy-eth", "High", "Medium", "Reentrancy in {c}.{f}() ({p}#{a}-{b}):\n\tExternal calls:\n\t- (sent,None) = msg.sender.call{{value: amount}}() ({p}#{a})\n\tState variables written after the call(s):\n\t- balances[msg.sender] = 0 ({p}#{b})\n"),
+    ("reentrancy-no-eth", "Medium", "Medium", "Reentrancy in {c}.{f}() ({p}#{a}-{b}):\n\tExternal calls:\n\t- token.transfer(to,amount) ({p}#{a})\n"),
+    ("reentrancy-benign", "Low", "Medium", "Reentrancy in {c}.{f}() ({p}#{a}-{b}):\n\tState variables written after the call(s)\n"),
+    ("solc-version", "Informational", "High", "Version constraint ^0.8.0 contains known severe issues\nIt is used by:\n\t- ^0.8.0 ({p}#{a})\n"),
+    ("low-level-calls", "Informational", "High", "Low level call in {c}.{f}() ({p}#{a}-{b}):\n\t- (sent,None) = msg.sender.call{{value: amount}}() ({p}#{a})\n"),
+    ("tx-origin", "Medium", "Medium", "{c}.{f}() ({p}#{a}-{b}) uses tx.origin for authorization: require(tx.origin == owner) ({p}#{a})\n"),
+    ("timestamp", "Low", "Medium", "{c}.{f}() ({p}#{a}-{b}) uses timestamp for comparisons\n"),
+    ("arbitrary-send-eth", "High", "Medium", "{c}.{f}() ({p}#{a}-{b}) sends eth to arbitrary user\n"),
+    ("controlled-delegatecall", "High", "Medium", "{c}.{f}() ({p}#{a}-{b}) uses delegatecall to a input-controlled function id\n"),
+    ("unused-return", "Medium", "Medium", "{c}.{f}() ({p}#{a}-{b}) ignores return value\n"),
+    ("naming-convention", "Informational", "High", "Parameter {c}.{f}(uint256)._amount ({p}#{a}) is not in mixedCase\n"),
+]
+
+FUNCS = ["withdraw", "deposit", "transfer", "approve", "mint", "burn", "execute", "claim", "swap", "stake"]
+
+def _tx_sequence(rnd):
+    # payload berat ala Mythril (initialState + steps dengan input bytecode)
+    code = "0x6080604052" + "".join(rnd.choice("0123456789abcdef") for _ in range(2048))
+    return {
+        "initialState": {"accounts": {
+            "0xaffeaffeaffeaffeaffeaffeaffeaffeaffeaffe": {"balance": "0x0", "code": "", "nonce": 0, "storage": "{}"},
+            "0xdeadbeefdeadbeefdeadbeefdeadbeefdeadbeef": {"balance": "0x0", "code": "", "nonce": 0, "storage": "{}"},
+        }},
+        "steps": [
+            {"address": "", "calldata": "", "input": code, "name": "unknown", "origin": "0xaffeaffeaffeaffeaffeaffeaffeaffeaffeaffe", "value": "0x0"},
+            {"address": "0x901d12ebe1b195e5aa8748e62bd7734ae19b51f", "calldata": "0x3ccfd60b", "input": "0x3ccfd60b",
+             "name": "withdraw()", "origin": "0xdeadbeefdeadbeefdeadbeefdeadbeefdeadbeef", "resolved_input": None, "value": "0x0"},
+        ],
+    }
+
+def mythril_issue(rnd, contract, tx_seq):
+    swc, title, sev = rnd.choice(MYTHRIL_ISSUES)
+    func = rnd.choice(FUNCS)
+    line = rnd.randint(5, 800)
+    it = {
+        "address": rnd.randint(100, 20000),
+        "code": "msg.sender.call{value: amount}(\"\")",
+        "contract": contract,
+        "description": f"{title}.\nThe contract {contract} executes a call in {func}() that may lead to unexpected behaviour.",
+        "filename": f"{contract}.sol",
+        "function": f"{func}()",
+        "lineno": line,
+        "max_gas_used": rnd.randint(20000, 90000),
+        "min_gas_used": rnd.randint(1000, 20000),
+        "severity": sev,
+        "sourceMap": f":{rnd.randint(1, 99)}",
+        "swc-id": swc,
+        "title": title,
+    }
+    if tx_seq is not None:
+        it["tx_sequence"] = tx_seq
+    return it
+
+def _source_mapping(path, lines, start):
+    return {
+        "start": start, "length": 50 * len(lines),
+        "filename_relative": path, "filename_absolute": f"/repo/{path}", "filename_short": path,
+        "is_dependency": False, "lines": lines, "starting_column": 5, "ending_column": 6,
+    }
+
+def slither_detector(rnd, contract, n_elements):
+    check, impact, conf, tmpl = rnd.choice(SLITHER_CHECKS)
+    func = rnd.choice(FUNCS)
+    path = f"contracts/{contract}.sol"
+    a = rnd.randint(2, 800)
+    b = a + rnd.randint(0, 20)
+    lines = list(range(a, b + 1))
+    parent = {"type": "contract", "name": contract, "source_mapping": _source_mapping(path, list(range(1, b + 5)), 0)}
+    elements = [{
+        "type": "function", "name": func,
+        "source_mapping": _source_mapping(path, lines, a * 40),
+        "type_specific_fields": {"parent": parent, "signature": f"{func}()"},
+    }]
+    for k in range(1, n_elements):
+        ln = rnd.randint(a, b)
+        elements.append({
+            "type": "node", "name": f"stmt_{k} = {func}()",
+            "source_mapping": _source_mapping(path, [ln], ln * 40),
+            "type_specific_fields": {"parent": {"type": "function", "name": func,
+                                                "source_mapping": _source_mapping(path, lines, a * 40),
+                                                "type_specific_fields": {"parent": parent, "signature": f"{func}()"}}},
+        })
+    desc = tmpl.format(c=contract, f=func, p=path, a=a, b=b)
+    return {
+        "elements": elements,
+        "description": desc,
+        "markdown": desc,
+        "first_markdown_element": f"{path}#L{a}-L{b}",
+        "id": "%064x" % rnd.getrandbits(256),
+        "check": check,
+        "impact": impact,
+        "confidence": conf,
+    }
+
+def write_report(tool: str, out: Path, findings: int, contracts: int = 20, seed: int = 0,
+                 lean: bool = False, elements: int = 3):
+    rnd = random.Random(seed)
+    names = [f"Contract{i:04d}" for i in range(max(1, contracts))]
+    out.parent.mkdir(parents=True, exist_ok=True)
+    # satu tx_sequence dipakai ulang (ukuran realistis, generate cepat)
+    tx_seq = None if lean else _tx_sequence(rnd)
+
+    with out.open("w", encoding="utf-8") as f:
+        if tool == "mythril":
+            f.write('{"error": null, "issues": [')
+        else:
+            f.write('{"success": true, "error": null, "results": {"detectors": [')
+        for i in range(findings):
+            if i:
+                f.write(", ")
+            c = rnd.choice(names)
+            item = mythril_issue(rnd, c, tx_seq) if tool == "mythril" else slither_detector(rnd, c, elements)
+            f.write(json.dumps(item))
+        f.write('], "success": true}' if tool == "mythril" else "]}}")
+    return out
+
+def main():
+    ap = argparse.ArgumentParser(description="Generate report Mythril/Slither sintetis")
+    ap.add_argument("--tool", required=True, choices=["mythril", "slither"])
+    ap.add_argument("--findings", type=int, default=1000)
+    ap.add_argument("--contracts", type=int, default=20, help="Jumlah kontrak berbeda")
+    ap.add_argument("--elements", type=int, default=3, help="Elemen per detector (Slither)")
+    ap.add_argument("--lean", action="store_true", help="Tanpa tx_sequence (Mythril)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", required=True)
+    args = ap.parse_args()
+
+    out = write_report(args.tool, Path(args.out), args.findings, args.contracts,
+                       args.seed, args.lean, args.elements)
+    print(f"✅ wrote {out} ({out.stat().st_size / 1e6:.1f} MB, {args.findings} findings)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()